@@ -0,0 +1,137 @@
+"""
+Benchmark comparing a sklearn Pipeline of tubular transformers against a TubularPipeline,
+which copies the input data once rather than once per step.
+
+With tubular installed, run from the root of the repo with;
+
+    python benchmarks/pipeline_copy_elision.py --rows 1000000 --steps 40
+
+Wall clock time is the best of --repeats runs of transform and peak memory is the peak traced
+by tracemalloc during a single run of transform, reported relative to the size of the input.
+"""
+
+import argparse
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+from tubular.capping import CappingTransformer
+from tubular.imputers import MeanImputer
+from tubular.numeric import ScalingTransformer
+from tubular.pipeline import TubularPipeline
+
+
+def create_df(n_rows, n_columns=10, seed=0):
+    """Create a float DataFrame with some missing values to use in the benchmark."""
+
+    rng = np.random.default_rng(seed)
+
+    values = rng.normal(size=(n_rows, n_columns))
+
+    values[rng.random(size=values.shape) < 0.05] = np.nan
+
+    return pd.DataFrame(values, columns=[f"x{i}" for i in range(n_columns)])
+
+
+def create_steps(columns, n_steps):
+    """Create n_steps tubular transformers cycling through imputing, capping and scaling."""
+
+    steps = []
+
+    for i in range(n_steps):
+
+        if i % 3 == 0:
+
+            step = MeanImputer(columns=columns)
+
+        elif i % 3 == 1:
+
+            step = CappingTransformer(capping_values={c: [-3, 3] for c in columns})
+
+        else:
+
+            step = ScalingTransformer(columns=columns, scaler="min_max")
+
+        steps.append((f"step_{i}", step))
+
+    return steps
+
+
+def time_transform(pipeline, X, repeats):
+    """Return the best wall clock time of repeats calls to pipeline.transform."""
+
+    times = []
+
+    for _ in range(repeats):
+
+        start = time.perf_counter()
+
+        pipeline.transform(X)
+
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def peak_memory_transform(pipeline, X):
+    """Return the peak memory traced during a call to pipeline.transform."""
+
+    tracemalloc.start()
+
+    pipeline.transform(X)
+
+    _, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return peak
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=40)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    X = create_df(args.rows)
+
+    input_size = X.memory_usage(deep=True).sum()
+
+    pipelines = {
+        "sklearn Pipeline": Pipeline(create_steps(list(X.columns), args.steps)),
+        "TubularPipeline": TubularPipeline(create_steps(list(X.columns), args.steps)),
+    }
+
+    print(
+        f"{args.rows} rows, {X.shape[1]} columns, {args.steps} steps, "
+        f"input size {input_size / 1e6:.1f} MB"
+    )
+
+    for name, pipeline in pipelines.items():
+
+        with warnings.catch_warnings():
+
+            # CappingTransformer warns that no fitting is done when capping_values are given
+            warnings.simplefilter("ignore", UserWarning)
+
+            pipeline.fit(X)
+
+        peak = peak_memory_transform(pipeline, X)
+
+        best_time = time_transform(pipeline, X, args.repeats)
+
+        print(
+            f"{name:>18}: transform {best_time:.3f}s, peak traced memory "
+            f"{peak / 1e6:.1f} MB ({peak / input_size:.2f}x input)"
+        )
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,253 @@
+import pytest
+import pandas as pd
+import re
+import tubular.testing.test_data as d
+import tubular.testing.helpers as h
+from sklearn.exceptions import NotFittedError
+
+import tubular
+from tubular.base import BaseTransformer, BasePartialFitMixin
+from tubular.imputers import MeanImputer, MedianImputer, ModeImputer
+from tubular.capping import CappingTransformer
+from tubular.nominal import (
+    NominalToIntegerTransformer,
+    GroupRareLevelsTransformer,
+    MeanResponseTransformer,
+    OrdinalEncoderTransformer,
+)
+from tubular.numeric import LogTransformer
+
+
+class PartialFitTransformer(BaseTransformer, BasePartialFitMixin):
+    """Transformer using BasePartialFitMixin without implementing sufficient_stats or finalize."""
+
+    pass
+
+
+class TestInit(object):
+    """Tests for the transformers using BasePartialFitMixin."""
+
+    @pytest.mark.parametrize(
+        "transformer_class",
+        [
+            MeanImputer,
+            MedianImputer,
+            ModeImputer,
+            CappingTransformer,
+            NominalToIntegerTransformer,
+            GroupRareLevelsTransformer,
+            MeanResponseTransformer,
+            OrdinalEncoderTransformer,
+        ],
+    )
+    def test_inheritance(self, transformer_class):
+        """Test that transformers that support partial_fit inherit from BasePartialFitMixin."""
+
+        assert issubclass(
+            transformer_class, BasePartialFitMixin
+        ), f"{transformer_class.__name__} does not inherit from BasePartialFitMixin"
+
+    def test_partial_fit_not_on_base_transformer(self):
+        """Test that transformers that do not support partial_fit do not have the methods."""
+
+        for method_name in [
+            "partial_fit",
+            "merge_sufficient_stats",
+            "sufficient_stats",
+            "finalize",
+        ]:
+
+            assert not hasattr(
+                LogTransformer(columns="a"), method_name
+            ), f"LogTransformer has {method_name} method"
+
+
+class TestPartialFit(object):
+    """Tests for BasePartialFitMixin.partial_fit()."""
+
+    def test_arguments(self):
+        """Test that partial_fit has expected arguments."""
+
+        h.test_function_arguments(
+            func=BasePartialFitMixin.partial_fit,
+            expected_arguments=["self", "X", "y"],
+            expected_default_values=(None,),
+        )
+
+    def test_not_implemented_error(self):
+        """Test that an exception is raised if sufficient_stats is not implemented."""
+
+        x = PartialFitTransformer(columns="a")
+
+        with pytest.raises(
+            NotImplementedError,
+            match="sufficient_stats is not implemented for PartialFitTransformer",
+        ):
+
+            x.partial_fit(d.create_df_1())
+
+    def test_super_fit_called(self, mocker):
+        """Test that partial_fit calls BaseTransformer.fit to check the inputs."""
+
+        df = d.create_df_1()
+
+        x = PartialFitTransformer(columns="a")
+
+        mocker.patch.object(
+            PartialFitTransformer,
+            "sufficient_stats",
+            return_value={"a": pd.Series([1])},
+        )
+
+        expected_call_args = {0: {"args": (x, d.create_df_1(), None), "kwargs": {}}}
+
+        with h.assert_function_call(
+            mocker, tubular.base.BaseTransformer, "fit", expected_call_args
+        ):
+
+            x.partial_fit(df)
+
+    def test_chunk_stats_combined(self, mocker):
+        """Test that the sufficient stats from each chunk are combined in sufficient_stats_."""
+
+        x = PartialFitTransformer(columns="a")
+
+        mocker.patch.object(
+            PartialFitTransformer,
+            "sufficient_stats",
+            side_effect=[
+                {"a": pd.Series({"sum": 1.0, "count": 1.0})},
+                {"a": pd.Series({"sum": 2.0, "count": 2.0})},
+            ],
+        )
+
+        x.partial_fit(d.create_df_1())
+        x.partial_fit(d.create_df_1())
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "sufficient_stats_": {"a": pd.Series({"sum": 3.0, "count": 3.0})}
+            },
+            msg="sufficient_stats_ after two calls to partial_fit",
+        )
+
+    def test_partial_fit_returns_self(self, mocker):
+        """Test that partial_fit returns self."""
+
+        x = PartialFitTransformer(columns="a")
+
+        mocker.patch.object(
+            PartialFitTransformer,
+            "sufficient_stats",
+            return_value={"a": pd.Series([1])},
+        )
+
+        assert x.partial_fit(d.create_df_1()) is x, "partial_fit did not return self"
+
+
+class TestCombineSufficientStats(object):
+    """Tests for BasePartialFitMixin.combine_sufficient_stats()."""
+
+    def test_stats_added(self):
+        """Test that stats are added by column with missing levels filled with 0 and stats for
+        columns not in other_stats are copied."""
+
+        stats = {
+            "a": pd.Series({"x": 1, "y": 2}),
+            "b": pd.Series({"x": 1}),
+        }
+        other_stats = {"a": pd.Series({"y": 3, "z": 4})}
+
+        x = PartialFitTransformer()
+
+        combined_stats = x.combine_sufficient_stats(stats, other_stats)
+
+        h.assert_equal_dispatch(
+            expected={
+                "a": pd.Series({"x": 1.0, "y": 5.0, "z": 4.0}),
+                "b": pd.Series({"x": 1}),
+            },
+            actual=combined_stats,
+            msg="combined stats",
+        )
+
+        assert (
+            combined_stats["b"] is not stats["b"]
+        ), "stats for column only in stats not copied"
+
+
+class TestMergeSufficientStats(object):
+    """Tests for BasePartialFitMixin.merge_sufficient_stats()."""
+
+    def test_other_type_error(self):
+        """Test that an exception is raised if other is not the same type of transformer."""
+
+        x = PartialFitTransformer(columns="a")
+
+        with pytest.raises(
+            TypeError, match="other should be a PartialFitTransformer but got"
+        ):
+
+            x.merge_sufficient_stats({"a": 1})
+
+    def test_other_not_fitted_error(self):
+        """Test that an exception is raised if other has not been partial_fit."""
+
+        x = PartialFitTransformer(columns="a")
+
+        with pytest.raises(NotFittedError):
+
+            x.merge_sufficient_stats(PartialFitTransformer(columns="a"))
+
+    def test_different_columns_error(self):
+        """Test that an exception is raised if other has stats for different columns."""
+
+        x = PartialFitTransformer(columns="a")
+        x.sufficient_stats_ = {"a": pd.Series([1])}
+
+        x2 = PartialFitTransformer(columns="b")
+        x2.sufficient_stats_ = {"b": pd.Series([1])}
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "other has sufficient stats for columns ['b'] but expected ['a']"
+            ),
+        ):
+
+            x.merge_sufficient_stats(x2)
+
+    def test_merge_into_unfitted_transformer(self):
+        """Test that merging into a transformer that has not been partial_fit copies the stats
+        and sets the columns attribute."""
+
+        x = PartialFitTransformer()
+
+        x2 = PartialFitTransformer(columns="a")
+        x2.sufficient_stats_ = {"a": pd.Series([1])}
+
+        x.merge_sufficient_stats(x2)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "columns": ["a"],
+                "sufficient_stats_": {"a": pd.Series([1])},
+            },
+            msg="attributes after merge_sufficient_stats",
+        )
+
+
+class TestFinalize(object):
+    """Tests for BasePartialFitMixin.finalize()."""
+
+    def test_not_implemented_error(self):
+        """Test that an exception is raised as finalize is not implemented."""
+
+        with pytest.raises(
+            NotImplementedError,
+            match="finalize is not implemented for PartialFitTransformer",
+        ):
+
+            PartialFitTransformer().finalize()
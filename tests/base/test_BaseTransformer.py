@@ -1,9 +1,13 @@
 import pytest
 import pandas
+import numpy as np
 import re
+import joblib
+import weakref
 import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 from unittest import mock
+from sklearn.exceptions import NotFittedError
 
 import tubular
 from tubular.base import BaseTransformer
@@ -17,8 +21,15 @@ class TestInit(object):
 
         h.test_function_arguments(
             func=BaseTransformer.__init__,
-            expected_arguments=["self", "columns", "copy", "verbose"],
-            expected_default_values=(None, True, False),
+            expected_arguments=[
+                "self",
+                "columns",
+                "copy",
+                "verbose",
+                "n_jobs",
+                "chunk_rows",
+            ],
+            expected_default_values=(None, True, False, None, None),
         )
 
     def test_default_attributes_set_in_init(self):
@@ -31,6 +42,8 @@ class TestInit(object):
             "verbose": False,
             "columns": None,
             "copy": True,
+            "n_jobs": None,
+            "chunk_rows": None,
         }
 
         h.test_object_attributes(
@@ -86,6 +99,40 @@ class TestInit(object):
             obj=x, expected_method="columns_check", msg="columns_check"
         )
 
+    @pytest.mark.parametrize("n_jobs", [0, 1.5, "2", True])
+    def test_n_jobs_error(self, n_jobs):
+        """Test an error is raised if n_jobs is not None or a non-zero int."""
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(f"n_jobs must be None or a non-zero int but got {n_jobs}"),
+        ):
+
+            BaseTransformer(n_jobs=n_jobs)
+
+    @pytest.mark.parametrize("chunk_rows", [0, -1, 1.5, "2", True])
+    def test_chunk_rows_error(self, chunk_rows):
+        """Test an error is raised if chunk_rows is not None or a positive int."""
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"chunk_rows must be None or a positive int but got {chunk_rows}"
+            ),
+        ):
+
+            tubular.imputers.NullIndicator(columns="a", chunk_rows=chunk_rows)
+
+    def test_chunk_rows_not_row_independent_error(self):
+        """Test an error is raised if chunk_rows is set for a transformer that is not row independent."""
+
+        with pytest.raises(
+            ValueError,
+            match="BaseTransformer is not row independent so chunk_rows cannot be set",
+        ):
+
+            BaseTransformer(chunk_rows=2)
+
     def test_verbose_non_bool_error(self):
         """Test an error is raised if verbose is not specified as a bool."""
 
@@ -100,6 +147,26 @@ class TestInit(object):
 
             BaseTransformer(copy=1)
 
+    def test_copy_str_error(self):
+        """Test an error is raised if copy is a str other than 'columns'."""
+
+        with pytest.raises(
+            ValueError, match="copy must be a bool or 'columns' but got rows"
+        ):
+
+            BaseTransformer(copy="rows")
+
+    def test_copy_columns_set_to_attribute(self):
+        """Test that copy can be set to 'columns'."""
+
+        x = BaseTransformer(copy="columns")
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"copy": "columns"},
+            msg="copy attribute set to columns",
+        )
+
     def test_columns_empty_list_error(self):
         """Test an error is raised if columns is specified as an empty list."""
 
@@ -273,6 +340,100 @@ class TestTransform(object):
 
             x.transform(X=df)
 
+    def test_copy_columns_called(self, mocker):
+        """Test copy_columns is called, and not pd.DataFrame.copy, if copy is 'columns'."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns="a", copy="columns")
+
+        expected_call_args = {0: {"args": (df,), "kwargs": {}}}
+
+        spy = mocker.spy(pandas.DataFrame, "copy")
+
+        with h.assert_function_call(
+            mocker,
+            tubular.base.BaseTransformer,
+            "copy_columns",
+            expected_call_args,
+            return_value=df,
+        ):
+
+            x.transform(X=df)
+
+        assert (
+            spy.call_count == 0
+        ), f"Unexpected number of calls to pd.DataFrame.copy -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+    def test_df_copy_not_called_in_copy_elision(self, mocker):
+        """Test pd.DataFrame.copy is not called within copy_elision, even if copy is True."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns="a", copy=True)
+
+        spy = mocker.spy(pandas.DataFrame, "copy")
+
+        with tubular.base.copy_elision():
+
+            df_transformed = x.transform(X=df)
+
+        assert (
+            spy.call_count == 0
+        ), f"Unexpected number of calls to pd.DataFrame.copy -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+        assert df_transformed is df, "X copied within copy_elision"
+
+    def test_copy_elision_only_for_given_transformers(self):
+        """Test that only the transformers passed to copy_elision skip copying X, with the
+        innermost context applying."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns="a", copy=True)
+        x2 = BaseTransformer(columns="a", copy=True)
+
+        with tubular.base.copy_elision([x]):
+
+            assert x.transform(X=df) is df, "X copied for transformer in copy_elision"
+
+            assert (
+                x2.transform(X=df) is not df
+            ), "X not copied for transformer not in copy_elision"
+
+            with tubular.base.copy_elision([x2]):
+
+                assert (
+                    x.transform(X=df) is not df
+                ), "X not copied for transformer not in inner copy_elision"
+
+            assert x.transform(X=df) is df, "X copied after inner copy_elision exited"
+
+        assert x.transform(X=df) is not df, "X not copied after copy_elision exited"
+
+    def test_df_copy_called_after_copy_elision(self, mocker):
+        """Test pd.DataFrame.copy is called again once nested copy_elision contexts have exited."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns="a", copy=True)
+
+        with tubular.base.copy_elision():
+
+            with tubular.base.copy_elision():
+
+                pass
+
+            assert x.transform(X=df) is df, "X copied within outer copy_elision"
+
+        spy = mocker.spy(pandas.DataFrame, "copy")
+
+        x.transform(X=df)
+
+        assert (
+            spy.call_count == 1
+        ), f"Unexpected number of calls to pd.DataFrame.copy -\n  Expected: 1\n  Actual: {spy.call_count}"
+
     def test_no_rows_error(self):
         """Test an error is raised if X has no rows."""
 
@@ -359,6 +520,159 @@ class TestColumnsCheck(object):
 
             x.columns_check(X=df)
 
+    def test_columns_not_in_X_error_after_check_passed(self):
+        """Test an error is raised if X is missing a column after the check has passed for
+        data with different columns."""
+
+        x = BaseTransformer(columns=["a", "b"])
+
+        x.columns_check(X=d.create_df_1())
+
+        with pytest.raises(ValueError, match="variable b is not in X"):
+
+            x.columns_check(X=d.create_df_1()[["a"]])
+
+    def test_columns_attribute_changed_after_check_passed(self):
+        """Test an error is raised if the columns attribute is changed in place after the check
+        has passed for the same X."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns=["a"])
+
+        x.columns_check(X=df)
+
+        x.columns.append("z")
+
+        with pytest.raises(ValueError, match="variable z is not in X"):
+
+            x.columns_check(X=df)
+
+    def test_check_skipped_for_same_schema(self, mocker):
+        """Test that the columns are not looked up again in X when the check has passed for
+        data with the same columns."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns=["a", "b"])
+
+        x.columns_check(X=df)
+
+        spy = mocker.spy(x, "set_schema_checked")
+
+        x.columns_check(X=df.iloc[:2])
+        x.columns_check(X=df.copy())
+
+        assert (
+            spy.call_count == 0
+        ), f"columns checked again for the same schema - {spy.call_count} calls"
+
+
+class TestSchemaChecked(object):
+    """Tests for the schema_checked and set_schema_checked methods."""
+
+    def test_arguments(self):
+        """Test that schema_checked and set_schema_checked have expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.schema_checked,
+            expected_arguments=["self", "check", "X", "dtypes"],
+            expected_default_values=(None,),
+        )
+
+        h.test_function_arguments(
+            func=BaseTransformer.set_schema_checked,
+            expected_arguments=["self", "check", "X", "dtypes"],
+            expected_default_values=(None,),
+        )
+
+    def test_not_checked(self):
+        """Test that False is returned if no data has been checked."""
+
+        x = BaseTransformer(columns=["a"])
+
+        assert not x.schema_checked(
+            "columns", d.create_df_1()
+        ), "schema_checked True before any data checked"
+
+    @pytest.mark.parametrize(
+        "X, dtypes, expected",
+        [
+            (d.create_df_1(), ["int64", "object"], True),
+            (d.create_df_1().iloc[[0]], ["int64", "object"], True),
+            (d.create_df_1(), ["float64", "object"], False),
+            (d.create_df_1()[["b", "a"]], ["int64", "object"], False),
+            (d.create_df_2(), ["int64", "object"], False),
+        ],
+    )
+    def test_schema_compared(self, X, dtypes, expected):
+        """Test that True is returned only for data with the same columns and dtypes as the
+        data last checked."""
+
+        x = BaseTransformer(columns=["a"])
+
+        x.set_schema_checked("check", d.create_df_1(), ["int64", "object"])
+
+        assert (
+            x.schema_checked("check", X, dtypes) is expected
+        ), f"unexpected schema_checked output, expected {expected}"
+
+    def test_checks_separate(self):
+        """Test that the schema is recorded separately for each check."""
+
+        df = d.create_df_1()
+
+        x = BaseTransformer(columns=["a"])
+
+        x.set_schema_checked("columns", df)
+
+        assert not x.schema_checked(
+            "numeric", df
+        ), "schema_checked True for a different check"
+
+
+class TestCheckNumericColumns(object):
+    """Tests for the check_numeric_columns method."""
+
+    def test_arguments(self):
+        """Test that check_numeric_columns has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.check_numeric_columns, expected_arguments=["self", "X"]
+        )
+
+    def test_exception_raised(self):
+        """Test an exception is raised if non numeric columns are passed in X."""
+
+        df = d.create_df_2()
+
+        x = BaseTransformer(columns=["a", "b", "c"])
+
+        with pytest.raises(
+            TypeError,
+            match=r"""The following columns are not numeric in X; \['b', 'c'\]""",
+        ):
+
+            x.check_numeric_columns(df)
+
+    def test_exception_raised_after_dtype_changed(self):
+        """Test an exception is raised if a column becomes non numeric after the check has
+        passed for X."""
+
+        df = d.create_df_2()
+
+        x = BaseTransformer(columns=["a"])
+
+        x.check_numeric_columns(df)
+
+        df["a"] = df["a"].astype(str)
+
+        with pytest.raises(
+            TypeError, match=r"""The following columns are not numeric in X; \['a'\]"""
+        ):
+
+            x.check_numeric_columns(df)
+
 
 class TestColumnsSetOrCheck(object):
     """Tests for columns_set_or_check method."""
@@ -395,6 +709,655 @@ class TestColumnsSetOrCheck(object):
         )
 
 
+class TestTransformStream(object):
+    """Tests for BaseTransformer.transform_stream()."""
+
+    def test_arguments(self):
+        """Test that transform_stream has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.transform_stream,
+            expected_arguments=["self", "chunks"],
+        )
+
+    def test_transform_called_on_each_chunk(self, mocker):
+        """Test that transform is called on each chunk and the outputs are yielded."""
+
+        df = d.create_df_1()
+
+        chunks = [df.iloc[:2], df.iloc[2:4], df.iloc[4:]]
+
+        x = BaseTransformer(columns="a")
+
+        mocked = mocker.patch.object(
+            BaseTransformer, "transform", side_effect=["x", "y", "z"]
+        )
+
+        output = list(x.transform_stream(chunks))
+
+        assert output == ["x", "y", "z"], f"unexpected output {output}"
+
+        assert mocked.call_count == 3, "unexpected number of calls to transform"
+
+        for i, chunk in enumerate(chunks):
+
+            h.assert_frame_equal_msg(
+                actual=mocked.call_args_list[i][0][0],
+                expected=chunk,
+                msg_tag=f"chunk {i} passed to transform",
+            )
+
+    def test_chunks_read_lazily(self):
+        """Test that chunks are only read as transformed chunks are requested."""
+
+        df = d.create_df_1()
+
+        chunks_read = []
+
+        def chunk_source():
+
+            for i in range(3):
+
+                chunks_read.append(i)
+
+                yield df.iloc[2 * i : 2 * i + 2]
+
+        x = BaseTransformer(columns="a")
+
+        stream = x.transform_stream(chunk_source())
+
+        assert chunks_read == [], "chunks read before output requested"
+
+        next(stream)
+
+        assert chunks_read == [0], f"expected one chunk read but got {chunks_read}"
+
+    @pytest.mark.parametrize("copy", [True, False])
+    def test_previous_chunks_released(self, copy):
+        """Test that no reference is kept to previous input or output chunks when the next
+        chunk is read."""
+
+        df = d.create_df_1()
+
+        refs = []
+
+        def chunk_source():
+
+            for i in range(3):
+
+                assert all(
+                    r() is None for r in refs
+                ), "previous chunk still in memory when next chunk read"
+
+                chunk = df.iloc[2 * i : 2 * i + 2].copy()
+
+                refs.append(weakref.ref(chunk))
+
+                yield chunk
+
+                del chunk
+
+        x = BaseTransformer(columns="a", copy=copy)
+
+        for output in x.transform_stream(chunk_source()):
+
+            refs.append(weakref.ref(output))
+
+            del output
+
+
+class TestTransformChunks(object):
+    """Tests for transform_chunks()."""
+
+    def test_transform_applied_to_each_chunk(self):
+        """Test that the transform function is applied to each chunk in turn, as the outputs are
+        requested."""
+
+        chunks_read = []
+
+        def chunk_source():
+
+            for i in range(3):
+
+                chunks_read.append(i)
+
+                yield i
+
+        stream = tubular.base.transform_chunks(lambda chunk: chunk * 10, chunk_source())
+
+        assert chunks_read == [], "chunks read before output requested"
+
+        assert next(stream) == 0, "unexpected first output"
+
+        assert chunks_read == [0], f"expected one chunk read but got {chunks_read}"
+
+        assert list(stream) == [10, 20], "unexpected remaining outputs"
+
+    def test_transform_stream_uses_transform_chunks(self, mocker):
+        """Test that BaseTransformer.transform_stream yields from transform_chunks."""
+
+        x = BaseTransformer(columns="a")
+
+        mocked = mocker.patch.object(
+            tubular.base, "transform_chunks", return_value=iter(["x", "y"])
+        )
+
+        chunks = [d.create_df_1()]
+
+        assert list(x.transform_stream(chunks)) == ["x", "y"], "unexpected output"
+
+        assert mocked.call_args_list == [
+            mock.call(x.transform, chunks)
+        ], "unexpected call to transform_chunks"
+
+
+class TestTransformRowBlocks(object):
+    """Tests for BaseTransformer.transform_row_blocks() and splitting X into blocks of rows in
+    transform when chunk_rows is set."""
+
+    def test_arguments(self):
+        """Test that transform_row_blocks has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.transform_row_blocks,
+            expected_arguments=["self", "transform", "X"],
+        )
+
+    @pytest.mark.parametrize("n_jobs", [None, 2])
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 4, 10])
+    def test_same_as_single_block(self, n_jobs, chunk_rows):
+        """Test that transforming in blocks of rows gives the same output as one transform."""
+
+        df = d.create_df_3()
+
+        x = tubular.imputers.MeanImputer(columns=["a", "b", "c"]).fit(df)
+
+        expected = x.transform(df)
+
+        x_blocks = tubular.imputers.MeanImputer(
+            columns=["a", "b", "c"], n_jobs=n_jobs, chunk_rows=chunk_rows
+        ).fit(df)
+
+        h.assert_frame_equal_msg(
+            actual=x_blocks.transform(df),
+            expected=expected,
+            msg_tag="output transformed in blocks of rows",
+        )
+
+    @pytest.mark.parametrize(
+        "df, expected",
+        h.index_preserved_params(
+            d.create_df_3(),
+            tubular.imputers.NullIndicator(columns=["a", "b"]).transform(
+                d.create_df_3()
+            ),
+        ),
+    )
+    def test_index_preserved(self, df, expected):
+        """Test that the index of X is preserved when transforming in blocks of rows."""
+
+        x = tubular.imputers.NullIndicator(columns=["a", "b"], n_jobs=2, chunk_rows=3)
+
+        h.assert_frame_equal_msg(
+            actual=x.transform(df),
+            expected=expected,
+            msg_tag="output transformed in blocks of rows",
+        )
+
+    def test_blocks_passed_to_transform(self, mocker):
+        """Test that the undecorated transform is called once on each block of rows, including
+        calls to super().transform."""
+
+        df = d.create_df_3()
+
+        x = tubular.imputers.NullIndicator(columns=["a", "b"], chunk_rows=3)
+
+        spy = mocker.spy(tubular.base.BaseTransformer, "transform")
+
+        x.transform(df)
+
+        assert (
+            spy.call_count == 3
+        ), "unexpected number of calls to BaseTransformer.transform"
+
+        for i, start in enumerate([0, 3, 6]):
+
+            h.assert_frame_equal_msg(
+                # blocks are transformed in place so only compare the input columns
+                actual=spy.call_args_list[i][0][1][df.columns],
+                expected=df.iloc[start : start + 3],
+                msg_tag=f"block {i} passed to BaseTransformer.transform",
+            )
+
+    def test_single_block_not_split(self, mocker):
+        """Test that transform_row_blocks is not called if X has no more than chunk_rows rows."""
+
+        df = d.create_df_3()
+
+        x = tubular.imputers.NullIndicator(columns=["a", "b"], chunk_rows=7)
+
+        spy = mocker.spy(tubular.base.BaseTransformer, "transform_row_blocks")
+
+        x.transform(df)
+
+        assert spy.call_count == 0, "transform_row_blocks called for a single block"
+
+    @pytest.mark.parametrize("copy", [True, False])
+    def test_X_not_modified(self, copy):
+        """Test that X is not modified when transforming in blocks of rows, regardless of copy."""
+
+        df = d.create_df_3()
+
+        x = tubular.imputers.MeanImputer(
+            columns=["a", "b", "c"], copy=copy, chunk_rows=2
+        ).fit(df)
+
+        x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_3(),
+            msg_tag="X after transform in blocks of rows",
+        )
+
+    def test_process_backend(self):
+        """Test that transforming in blocks of rows with a process based joblib backend gives the
+        same output as one transform."""
+
+        df = pandas.DataFrame({"a": ["abc", "de", "f", None] * 50})
+
+        x = tubular.strings.SeriesStrMethodTransformer(
+            new_column_name="b",
+            pd_method_name="find",
+            columns=["a"],
+            pd_method_kwargs={"sub": "e"},
+        )
+
+        expected = x.transform(df)
+
+        x_blocks = tubular.strings.SeriesStrMethodTransformer(
+            new_column_name="b",
+            pd_method_name="find",
+            columns=["a"],
+            pd_method_kwargs={"sub": "e"},
+            chunk_rows=50,
+            n_jobs=2,
+        )
+
+        with joblib.parallel_backend("loky"):
+
+            df_transformed = x_blocks.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="output transformed in blocks of rows with loky backend",
+        )
+
+    def test_row_blocks_flag_restored(self):
+        """Test that transform_row_block restores the previous value of the row blocks flag."""
+
+        df = d.create_df_3()
+
+        x = tubular.imputers.NullIndicator(columns=["a", "b"])
+
+        tubular.base._row_blocks_state.active = True
+
+        try:
+
+            tubular.base.transform_row_block(
+                x, tubular.imputers.NullIndicator.transform.__wrapped__, df
+            )
+
+            assert (
+                tubular.base._row_blocks_state.active is True
+            ), "row blocks flag not restored"
+
+        finally:
+
+            tubular.base._row_blocks_state.active = False
+
+        tubular.base.transform_row_block(
+            x, tubular.imputers.NullIndicator.transform.__wrapped__, df
+        )
+
+        assert (
+            tubular.base._row_blocks_state.active is False
+        ), "row blocks flag not restored"
+
+
+class TestTransformRecord(object):
+    """Tests for BaseTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_transform_called_on_single_row(self, mocker):
+        """Test that transform is called with a DataFrame with the record as its only row."""
+
+        x = BaseTransformer(columns="a")
+
+        expected_call_args = {
+            0: {"args": (pandas.DataFrame({"a": [1], "b": ["x"]}),), "kwargs": {}}
+        }
+
+        with h.assert_function_call(
+            mocker,
+            tubular.base.BaseTransformer,
+            "transform",
+            expected_call_args,
+            return_value=pandas.DataFrame({"a": [1], "b": ["x"]}),
+        ):
+
+            x.transform_record({"a": 1, "b": "x"})
+
+    def test_output(self):
+        """Test that the transformed row is returned as a dict."""
+
+        x = tubular.dates.DateDiffLeapYearTransformer(
+            column_lower="a", column_upper="b", new_column_name="c", drop_cols=False
+        )
+
+        record = {
+            "a": pandas.Timestamp("2000-03-01"),
+            "b": pandas.Timestamp("2010-02-28"),
+        }
+
+        h.assert_equal_dispatch(
+            expected={**record, "c": 9},
+            actual=x.transform_record(record),
+            msg="transform_record output",
+        )
+
+    def test_record_not_modified(self):
+        """Test that the input record is not modified."""
+
+        x = tubular.imputers.NullIndicator(columns="a")
+
+        record = {"a": 1}
+
+        x.transform_record(record)
+
+        h.assert_equal_dispatch(
+            expected={"a": 1},
+            actual=record,
+            msg="record after transform_record",
+        )
+
+    def test_subclass_overriding_transform_falls_back(self):
+        """Test that a subclass that overrides transform, but not transform_record, uses the
+        DataFrame path rather than an inherited fast path for single records."""
+
+        class DoubleImputer(tubular.imputers.MeanImputer):
+            def transform(self, X):
+
+                X = super().transform(X)
+
+                X[self.columns] = X[self.columns] * 2
+
+                return X
+
+        x = DoubleImputer(columns="a")
+        x.impute_values_ = {"a": 1.5}
+
+        assert (
+            DoubleImputer.transform_record is BaseTransformer.transform_record
+        ), "transform_record not reset for subclass overriding transform"
+
+        h.assert_equal_dispatch(
+            expected={"a": 3.0},
+            actual=x.transform_record({"a": np.NaN}),
+            msg="transform_record output",
+        )
+
+
+class TestColumnFunctions(object):
+    """Tests for BaseTransformer.column_functions()."""
+
+    def test_arguments(self):
+        """Test that column_functions has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.column_functions, expected_arguments=["self"]
+        )
+
+    def test_none_returned(self):
+        """Test that None is returned by default, as the transformer cannot be fused."""
+
+        assert (
+            BaseTransformer(columns="a").column_functions() is None
+        ), "column_functions did not return None"
+
+    def test_subclass_overriding_transform_not_fused(self):
+        """Test that a subclass that overrides transform, but not column_functions, returns None
+        rather than the column functions of its parent class."""
+
+        class DoubleImputer(tubular.imputers.MeanImputer):
+            def transform(self, X):
+
+                X = super().transform(X)
+
+                X[self.columns] = X[self.columns] * 2
+
+                return X
+
+        x = DoubleImputer(columns="a")
+        x.impute_values_ = {"a": 1.5}
+
+        assert (
+            x.column_functions() is None
+        ), "column_functions not reset for subclass overriding transform"
+
+
+class TestCheckColumnFunctionsInput(object):
+    """Tests for BaseTransformer.check_column_functions_input()."""
+
+    def test_arguments(self):
+        """Test that check_column_functions_input has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.check_column_functions_input,
+            expected_arguments=["self", "X_columns"],
+        )
+
+    def test_no_checks_by_default(self):
+        """Test that no checks are made on the column values by default."""
+
+        x = BaseTransformer(columns="a")
+
+        x.check_column_functions_input({"a": pandas.Series([None, "a"])})
+
+
+class TestCheckRecord(object):
+    """Tests for BaseTransformer.check_record()."""
+
+    def test_arguments(self):
+        """Test that check_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.check_record,
+            expected_arguments=["self", "record", "attributes"],
+            expected_default_values=(None,),
+        )
+
+    def test_non_dict_error(self):
+        """Test an error is raised if record is not a dict."""
+
+        x = BaseTransformer(columns="a")
+
+        with pytest.raises(ValueError, match="record should be a dict"):
+
+            x.check_record(pandas.Series({"a": 1}))
+
+    def test_columns_none_error(self):
+        """Test an error is raised if the columns attribute is not set."""
+
+        x = BaseTransformer()
+
+        with pytest.raises(ValueError, match="columns not set"):
+
+            x.check_record({"a": 1})
+
+    def test_missing_column_error(self):
+        """Test an error is raised if a column is not in record."""
+
+        x = BaseTransformer(columns=["a", "b"])
+
+        with pytest.raises(ValueError, match="variable b is not in record"):
+
+            x.check_record({"a": 1})
+
+    def test_not_fitted_error(self):
+        """Test a NotFittedError is raised if one of attributes is not set."""
+
+        x = BaseTransformer(columns="a")
+
+        with pytest.raises(NotFittedError):
+
+            x.check_record({"a": 1}, ["columns", "impute_values_"])
+
+    @pytest.mark.parametrize("copy", [True, "columns"])
+    def test_record_copied(self, copy):
+        """Test that a copy of record is returned if copy is True or "columns"."""
+
+        x = BaseTransformer(columns="a", copy=copy)
+
+        record = {"a": 1}
+
+        record_checked = x.check_record(record)
+
+        assert record_checked is not record, "record not copied"
+
+        h.assert_equal_dispatch(
+            expected=record, actual=record_checked, msg="copied record"
+        )
+
+    def test_record_not_copied(self):
+        """Test that record is not copied if copy is False or within copy_elision."""
+
+        record = {"a": 1}
+
+        assert (
+            BaseTransformer(columns="a", copy=False).check_record(record) is record
+        ), "record copied with copy=False"
+
+        with tubular.base.copy_elision():
+
+            assert (
+                BaseTransformer(columns="a").check_record(record) is record
+            ), "record copied within copy_elision"
+
+
+class TestIsNullValue(object):
+    """Tests for tubular.base.is_null_value()."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [None, np.NaN, float("nan"), pandas.NaT, pandas.NA, np.datetime64("NaT")],
+    )
+    def test_null_values(self, value):
+        """Test that null values are identified, as with pd.isnull."""
+
+        assert tubular.base.is_null_value(value), f"{value} not identified as null"
+
+    @pytest.mark.parametrize(
+        "value", [0, 1.5, "a", "", False, pandas.Timestamp("2000-01-01"), (1, 2)]
+    )
+    def test_non_null_values(self, value):
+        """Test that non null values are not identified as null."""
+
+        assert not tubular.base.is_null_value(value), f"{value} identified as null"
+
+
+class TestCopyColumns(object):
+    """Tests for the copy_columns method."""
+
+    def test_arguments(self):
+        """Test that copy_columns has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.copy_columns, expected_arguments=["self", "X"]
+        )
+
+    def test_output_equal_to_input(self):
+        """Test that the output of copy_columns is equal to the input."""
+
+        df = d.create_df_2()
+
+        df.columns.name = "name"
+
+        x = BaseTransformer(columns="a", copy="columns")
+
+        h.assert_frame_equal_msg(
+            actual=x.copy_columns(df),
+            expected=d.create_df_2().rename_axis(columns="name"),
+            msg_tag="copy_columns output",
+        )
+
+    def test_only_columns_copied(self):
+        """Test that columns in the columns attribute are copied and other columns are shared with X."""
+
+        df = pandas.DataFrame(
+            np.arange(12, dtype="float").reshape(3, 4), columns=["a", "b", "c", "d"]
+        )
+
+        x = BaseTransformer(columns=["a", "c"], copy="columns")
+
+        df_copy = x.copy_columns(df)
+
+        for c in ["a", "c"]:
+
+            assert not np.shares_memory(
+                df[c].values, df_copy[c].values
+            ), f"column {c} not copied"
+
+        for c in ["b", "d"]:
+
+            assert np.shares_memory(
+                df[c].values, df_copy[c].values
+            ), f"column {c} copied"
+
+    def test_input_not_modified(self):
+        """Test that modifying the copied columns in place or adding columns does not modify X."""
+
+        df = d.create_df_3()
+
+        x = BaseTransformer(columns=["a", "b"], copy="columns")
+
+        df_copy = x.copy_columns(df)
+
+        df_copy.loc[df_copy["a"] > 2, "a"] = 0
+        df_copy["b"].fillna(0, inplace=True)
+        df_copy["c"] = 1
+        df_copy["d"] = 1
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_3(),
+            msg_tag="X modified by changes to copy_columns output",
+        )
+
+    def test_duplicated_columns_full_copy(self, mocker):
+        """Test that pd.DataFrame.copy is called if X has duplicated column names."""
+
+        df = pandas.DataFrame([[1, 2, 3]], columns=["a", "b", "b"])
+
+        x = BaseTransformer(columns="a", copy="columns")
+
+        expected_call_args = {0: {"args": (), "kwargs": {}}}
+
+        with h.assert_function_call(
+            mocker, pandas.DataFrame, "copy", expected_call_args, return_value=df
+        ):
+
+            x.copy_columns(df)
+
+
 class TestCheckIsFitted(object):
     """Tests for the check_is_fitted method."""
 
@@ -434,3 +1397,79 @@ class TestCheckIsFitted(object):
             assert (
                 call_1_pos_args[1] == attributes
             ), f"Incorrect second positional arg in check_is_fitted call -\n  Expected: {attributes}\n  Actual: {call_1_pos_args[1]}"
+
+
+class TestFitByColumn(object):
+    """Tests for BaseTransformer.fit_by_column()."""
+
+    def test_arguments(self):
+        """Test that fit_by_column has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseTransformer.fit_by_column,
+            expected_arguments=["self", "fit_column", "X", "other_columns"],
+            expected_default_values=(None,),
+        )
+
+    @pytest.mark.parametrize("n_jobs", [None, 1, 2, -1])
+    def test_results_in_column_order(self, n_jobs):
+        """Test that the outputs of fit_column are returned for each column in the order of the
+        columns attribute."""
+
+        df = d.create_df_3()
+
+        x = BaseTransformer(columns=["c", "a", "b"], n_jobs=n_jobs)
+
+        fitted_values = x.fit_by_column(lambda X_c, c: (c, X_c.sum()), df)
+
+        h.assert_equal_dispatch(
+            expected={
+                "c": ("c", df["c"].sum()),
+                "a": ("a", df["a"].sum()),
+                "b": ("b", df["b"].sum()),
+            },
+            actual=fitted_values,
+            msg="output of fit_by_column",
+        )
+
+        assert list(fitted_values.keys()) == [
+            "c",
+            "a",
+            "b",
+        ], "fit_by_column output not in order of columns"
+
+    @pytest.mark.parametrize("n_jobs", [None, 2])
+    def test_other_columns_passed(self, n_jobs):
+        """Test that fit_column is passed a pd.DataFrame of the column and other_columns, without
+        duplicating the column if it is in other_columns."""
+
+        df = d.create_df_3()
+
+        x = BaseTransformer(columns=["a", "b"], n_jobs=n_jobs)
+
+        fitted_values = x.fit_by_column(
+            lambda X_c, c: list(X_c.columns.values), df, ["b", "c"]
+        )
+
+        h.assert_equal_dispatch(
+            expected={"a": ["a", "b", "c"], "b": ["b", "c"]},
+            actual=fitted_values,
+            msg="columns passed to fit_column",
+        )
+
+    def test_exception_raised(self):
+        """Test that exceptions from fit_column are raised when running in parallel."""
+
+        def fit_column(X_c, c):
+
+            if c == "b":
+
+                raise ValueError(f"column {c} error")
+
+            return X_c.sum()
+
+        x = BaseTransformer(columns=["a", "b", "c"], n_jobs=2)
+
+        with pytest.raises(ValueError, match="column b error"):
+
+            x.fit_by_column(fit_column, d.create_df_3())
@@ -6,7 +6,8 @@ import pandas as pd
 import numpy as np
 
 import tubular
-from tubular.capping import CappingTransformer
+from sklearn.exceptions import NotFittedError
+from tubular.capping import CappingTransformer, OutOfRangeNullTransformer
 
 
 class TestInit(object):
@@ -22,8 +23,9 @@ class TestInit(object):
                 "capping_values",
                 "quantiles",
                 "weights_column",
+                "sketch_compression",
             ],
-            expected_default_values=(None, None, None),
+            expected_default_values=(None, None, None, None),
         )
 
     @pytest.mark.parametrize(
@@ -34,6 +36,16 @@ class TestInit(object):
             ("check_capping_values_dict"),
             ("weighted_quantile"),
             ("prepare_quantiles"),
+            ("apply_fused_capping"),
+            ("check_sample_weight"),
+            ("interpolate_quantiles"),
+            ("batch_weighted_quantiles"),
+            ("update_sketches"),
+            ("merge_sketches"),
+            ("set_capping_values_from_sketches"),
+            ("partial_fit"),
+            ("merge_sufficient_stats"),
+            ("finalize"),
         ],
     )
     def test_class_methods(self, method_name):
@@ -196,6 +208,24 @@ class TestInit(object):
             msg="quantiles attribute for CappingTransformer set in init",
         )
 
+    def test_sketch_compression_type_error(self):
+        """Test that an exception is raised if sketch_compression is not an int or float."""
+
+        with pytest.raises(
+            TypeError, match="sketch_compression should be an int or float but got"
+        ):
+
+            CappingTransformer(quantiles={"a": [0.1, 0.9]}, sketch_compression="a")
+
+    def test_sketch_compression_value_error(self):
+        """Test that an exception is raised if sketch_compression is not greater than 0."""
+
+        with pytest.raises(
+            ValueError, match="sketch_compression should be greater than 0 but got -1"
+        ):
+
+            CappingTransformer(quantiles={"a": [0.1, 0.9]}, sketch_compression=-1)
+
 
 class TestCheckCappingValuesDict(object):
     """Tests for the CappingTransformer.check_capping_values_dict() method."""
@@ -363,8 +393,8 @@ class TestFit(object):
 
             x.fit(df)
 
-    def test_prepare_quantiles_call_weight(self, mocker):
-        """Test the call to prepare_quantiles if weights_column is set."""
+    def test_batch_weighted_quantiles_call_weight(self, mocker):
+        """Test the call to batch_weighted_quantiles if weights_column is set."""
 
         df = d.create_df_9()
 
@@ -374,48 +404,54 @@ class TestFit(object):
 
         expected_call_args = {
             0: {
-                "args": (d.create_df_9()["a"], [0.1, 1], d.create_df_9()["c"]),
+                "args": (
+                    d.create_df_9(),
+                    {"a": [0.1, 1], "b": [0.5, None]},
+                    d.create_df_9()["c"],
+                ),
                 "kwargs": {},
-            },
-            1: {
-                "args": (d.create_df_9()["b"], [0.5, None], d.create_df_9()["c"]),
-                "kwargs": {},
-            },
+            }
         }
 
         with h.assert_function_call(
             mocker,
             tubular.capping.CappingTransformer,
-            "prepare_quantiles",
+            "batch_weighted_quantiles",
             expected_call_args,
+            return_value={"a": [1, 2], "b": [3, None]},
         ):
 
             x.fit(df)
 
-    def test_prepare_quantiles_call_no_weight(self, mocker):
-        """Test the call to prepare_quantiles if weights_column is not set."""
+    def test_batch_weighted_quantiles_call_no_weight(self, mocker):
+        """Test the call to batch_weighted_quantiles if weights_column is not set."""
 
         df = d.create_df_9()
 
         x = CappingTransformer(quantiles={"a": [0.1, 1], "b": [0.5, None]})
 
         expected_call_args = {
-            0: {"args": (d.create_df_9()["a"], [0.1, 1], None), "kwargs": {}},
-            1: {"args": (d.create_df_9()["b"], [0.5, None], None), "kwargs": {}},
+            0: {
+                "args": (d.create_df_9(), {"a": [0.1, 1], "b": [0.5, None]}, None),
+                "kwargs": {},
+            }
         }
 
         with h.assert_function_call(
             mocker,
             tubular.capping.CappingTransformer,
-            "prepare_quantiles",
+            "batch_weighted_quantiles",
             expected_call_args,
+            return_value={"a": [1, 2], "b": [3, None]},
         ):
 
             x.fit(df)
 
     @pytest.mark.parametrize("weights_column", [("c"), (None)])
-    def test_prepare_quantiles_output_set_attributes(self, mocker, weights_column):
-        """Test the output of prepare_quantiles is set to capping_values and_replacement_values attributes."""
+    def test_batch_weighted_quantiles_output_set_attributes(
+        self, mocker, weights_column
+    ):
+        """Test the output of batch_weighted_quantiles is set to capping_values and_replacement_values attributes."""
 
         df = d.create_df_9()
 
@@ -423,11 +459,11 @@ class TestFit(object):
             quantiles={"a": [0.1, 1], "b": [0.5, None]}, weights_column=weights_column
         )
 
-        mocked_return_values = [["aaaa", "bbbb"], [1234, None]]
+        mocked_return_values = {"a": ["aaaa", "bbbb"], "b": [1234, None]}
 
         mocker.patch(
-            "tubular.capping.CappingTransformer.prepare_quantiles",
-            side_effect=mocked_return_values,
+            "tubular.capping.CappingTransformer.batch_weighted_quantiles",
+            return_value=mocked_return_values,
         )
 
         x.fit(df)
@@ -435,16 +471,10 @@ class TestFit(object):
         h.test_object_attributes(
             obj=x,
             expected_attributes={
-                "capping_values": {
-                    "a": mocked_return_values[0],
-                    "b": mocked_return_values[1],
-                },
-                "_replacement_values": {
-                    "a": mocked_return_values[0],
-                    "b": mocked_return_values[1],
-                },
+                "capping_values": mocked_return_values,
+                "_replacement_values": mocked_return_values,
             },
-            msg="weighted_quantile output set to capping_values, _replacement_values attributes",
+            msg="batch_weighted_quantiles output set to capping_values, _replacement_values attributes",
         )
 
     @pytest.mark.parametrize("weights_column", [(None), ("c")])
@@ -468,6 +498,313 @@ class TestFit(object):
                 f"unexpected exception when calling fit with quantiles {quantiles} - {err}"
             )
 
+    @pytest.mark.parametrize("weights_column", [(None), ("c")])
+    def test_sketch_fit_same_as_exact_fit_for_small_data(self, weights_column):
+        """Test that fitting with sketch_compression gives the exact capping values when there is
+        less data than the sketch buffer."""
+
+        df = d.create_df_9()
+
+        quantiles = {"a": [0.1, 1], "b": [0.5, None]}
+
+        x = CappingTransformer(quantiles=quantiles, weights_column=weights_column)
+
+        x.fit(df)
+
+        x_sketch = CappingTransformer(
+            quantiles=quantiles, weights_column=weights_column, sketch_compression=100
+        )
+
+        x_sketch.fit(df)
+
+        h.test_object_attributes(
+            obj=x_sketch,
+            expected_attributes={
+                "capping_values": x.capping_values,
+                "_replacement_values": x._replacement_values,
+            },
+            msg="capping values from fit with sketch_compression",
+        )
+
+    def test_sketches_reset_in_fit(self):
+        """Test that fit replaces existing quantile sketches rather than updating them."""
+
+        df = d.create_df_9()
+
+        x = CappingTransformer(quantiles={"a": [0, 1]}, sketch_compression=100)
+
+        x.fit(df)
+        x.fit(df.loc[df["a"] > 2])
+
+        h.assert_equal_dispatch(
+            expected=[np.float64(4.0), np.float64(6.0)],
+            actual=x.capping_values["a"],
+            msg="capping values after refitting",
+        )
+
+
+class TestUpdateSketches(object):
+    """Tests for the CappingTransformer.update_sketches method."""
+
+    def test_arguments(self):
+        """Test that update_sketches has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.update_sketches,
+            expected_arguments=["self", "X"],
+        )
+
+    def test_no_sketch_compression_error(self):
+        """Test that an exception is raised if sketch_compression is not set."""
+
+        x = CappingTransformer(quantiles={"a": [0.1, 0.9]})
+
+        with pytest.raises(
+            ValueError,
+            match="quantiles and sketch_compression must be set to use quantile sketches",
+        ):
+
+            x.update_sketches(d.create_df_9())
+
+    def test_chunks_same_as_fit(self):
+        """Test that updating with chunks of data gives the same capping values as fit on all the data."""
+
+        df = d.create_df_9()
+
+        quantiles = {"a": [0.1, 1], "b": [0.5, None]}
+
+        x = CappingTransformer(
+            quantiles=quantiles, weights_column="c", sketch_compression=100
+        )
+
+        x.fit(df)
+
+        x_chunks = CappingTransformer(
+            quantiles=quantiles, weights_column="c", sketch_compression=100
+        )
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.update_sketches(chunk)
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={
+                "capping_values": x.capping_values,
+                "_replacement_values": x._replacement_values,
+            },
+            msg="capping values from update_sketches",
+        )
+
+    def test_negative_weights_error(self):
+        """Test that the sample weights are checked."""
+
+        df = d.create_df_9()
+
+        df["c"] = -1
+
+        x = CappingTransformer(
+            quantiles={"a": [0.1, 1]}, weights_column="c", sketch_compression=100
+        )
+
+        with pytest.raises(ValueError, match="negative weights in sample weights"):
+
+            x.update_sketches(df)
+
+
+class TestMergeSketches(object):
+    """Tests for the CappingTransformer.merge_sketches method."""
+
+    def test_arguments(self):
+        """Test that merge_sketches has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.merge_sketches,
+            expected_arguments=["self", "other"],
+        )
+
+    def test_partitions_same_as_fit(self):
+        """Test that merging sketches fit on partitions of the data gives the same capping values
+        as fit on all the data."""
+
+        df = d.create_df_9()
+
+        quantiles = {"a": [0.1, 1], "b": [0.5, None]}
+
+        x = CappingTransformer(quantiles=quantiles, sketch_compression=100)
+
+        x.fit(df)
+
+        x_1 = CappingTransformer(quantiles=quantiles, sketch_compression=100)
+        x_2 = CappingTransformer(quantiles=quantiles, sketch_compression=100)
+
+        x_1.fit(df.iloc[:3])
+        x_2.fit(df.iloc[3:])
+
+        x_1.merge_sketches(x_2)
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={
+                "capping_values": x.capping_values,
+                "_replacement_values": x._replacement_values,
+            },
+            msg="capping values from merge_sketches",
+        )
+
+    def test_different_columns_error(self):
+        """Test that an exception is raised if other has sketches for different columns."""
+
+        df = d.create_df_9()
+
+        x_1 = CappingTransformer(quantiles={"a": [0.1, 1]}, sketch_compression=100)
+        x_2 = CappingTransformer(quantiles={"b": [0.1, 1]}, sketch_compression=100)
+
+        x_2.fit(df)
+
+        with pytest.raises(
+            ValueError,
+            match=r"other has sketches for columns \['b'\] but expected \['a'\]",
+        ):
+
+            x_1.merge_sketches(x_2)
+
+    def test_non_capping_transformer_error(self):
+        """Test that an exception is raised if other is not a CappingTransformer."""
+
+        x = CappingTransformer(quantiles={"a": [0.1, 1]}, sketch_compression=100)
+
+        with pytest.raises(
+            TypeError, match="other should be a CappingTransformer but got"
+        ):
+
+            x.merge_sketches({"a": None})
+
+
+class TestPartialFit(object):
+    """Tests for CappingTransformer.partial_fit() and CappingTransformer.finalize()."""
+
+    @pytest.mark.parametrize("weights_column", [(None), ("c")])
+    def test_chunks_same_as_fit(self, weights_column):
+        """Test that partial_fit on chunks of data then finalize gives the same capping values as
+        fit when there is less data than the sketch buffer."""
+
+        df = d.create_df_9()
+
+        quantiles = {"a": [0.1, 1], "b": [0.5, None]}
+
+        x = CappingTransformer(quantiles=quantiles, weights_column=weights_column)
+
+        x.fit(df)
+
+        x_chunks = CappingTransformer(
+            quantiles=quantiles, weights_column=weights_column, sketch_compression=100
+        )
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={
+                "capping_values": x.capping_values,
+                "_replacement_values": x._replacement_values,
+            },
+            msg="capping values after finalize",
+        )
+
+    def test_merged_partitions_same_as_fit(self):
+        """Test that merging the sufficient stats from partitions of the data gives the same
+        capping values as fit."""
+
+        df = d.create_df_9()
+
+        quantiles = {"a": [0.1, 1], "b": [0.5, None]}
+
+        x = CappingTransformer(quantiles=quantiles)
+
+        x.fit(df)
+
+        x_1 = CappingTransformer(quantiles=quantiles, sketch_compression=100)
+        x_2 = CappingTransformer(quantiles=quantiles, sketch_compression=100)
+
+        x_1.partial_fit(df.iloc[:3])
+        x_2.partial_fit(df.iloc[3:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={
+                "capping_values": x.capping_values,
+                "_replacement_values": x._replacement_values,
+            },
+            msg="capping values after merge_sufficient_stats",
+        )
+
+    def test_no_sketch_compression_error(self):
+        """Test that an exception is raised if sketch_compression is not set."""
+
+        x = CappingTransformer(quantiles={"a": [0.1, 0.9]})
+
+        with pytest.raises(
+            ValueError,
+            match="quantiles and sketch_compression must be set to use quantile sketches",
+        ):
+
+            x.partial_fit(d.create_df_9())
+
+    def test_update_sketches_called(self, mocker):
+        """Test that partial_fit calls update_sketches."""
+
+        df = d.create_df_9()
+
+        x = CappingTransformer(quantiles={"a": [0, 1]}, sketch_compression=100)
+
+        expected_call_args = {0: {"args": (d.create_df_9(),), "kwargs": {}}}
+
+        with h.assert_function_call(
+            mocker,
+            tubular.capping.CappingTransformer,
+            "update_sketches",
+            expected_call_args,
+        ):
+
+            x.partial_fit(df)
+
+    def test_merge_sketches_called(self, mocker):
+        """Test that merge_sufficient_stats calls merge_sketches."""
+
+        df = d.create_df_9()
+
+        x_1 = CappingTransformer(quantiles={"a": [0, 1]}, sketch_compression=100)
+        x_2 = CappingTransformer(quantiles={"a": [0, 1]}, sketch_compression=100)
+
+        x_2.partial_fit(df)
+
+        expected_call_args = {0: {"args": (x_2,), "kwargs": {}}}
+
+        with h.assert_function_call(
+            mocker,
+            tubular.capping.CappingTransformer,
+            "merge_sketches",
+            expected_call_args,
+        ):
+
+            x_1.merge_sufficient_stats(x_2)
+
+    def test_finalize_not_fitted_error(self):
+        """Test that an exception is raised if finalize is called before partial_fit."""
+
+        x = CappingTransformer(quantiles={"a": [0, 1]}, sketch_compression=100)
+
+        with pytest.raises(NotFittedError):
+
+            x.finalize()
+
 
 class TestPrepareQuantiles(object):
     """Tests for the CappingTransformer.prepare_quantiles method."""
@@ -694,6 +1031,52 @@ class TestTransform(object):
             msg_tag="Unexpected values in CappingTransformer.transform, with columns meant to not be transformed",
         )
 
+    def test_apply_fused_capping_called_for_float_columns(self, mocker):
+        """Test that apply_fused_capping is called with only the float64 columns to cap."""
+
+        df = d.create_df_3()
+
+        df["b"] = df["b"].fillna(0).astype("int64")
+
+        x = CappingTransformer(
+            capping_values={"a": [2, 5], "b": [None, 7], "c": [0, None]}
+        )
+
+        spy = mocker.spy(tubular.capping.CappingTransformer, "apply_fused_capping")
+
+        x.transform(df)
+
+        assert (
+            spy.call_count == 1
+        ), f"Unexpected number of calls to apply_fused_capping -\n  Expected: 1\n  Actual: {spy.call_count}"
+
+        h.assert_equal_dispatch(
+            expected=["a", "c"],
+            actual=spy.call_args_list[0][0][2],
+            msg="columns passed to apply_fused_capping",
+        )
+
+    def test_expected_output_int_and_float_columns(self):
+        """Test that capping is applied correctly when capping both int and float columns."""
+
+        df = pd.DataFrame(
+            {"a": [1, 2, 3, 4, 5, 6], "b": [1.5, 2.5, np.NaN, 4.5, 5.5, 6.5]}
+        )
+
+        expected = pd.DataFrame(
+            {"a": [2, 2, 3, 4, 5, 5], "b": [2.0, 2.5, np.NaN, 4.5, 5.5, 6.0]}
+        )
+
+        x = CappingTransformer(capping_values={"a": [2, 5], "b": [2, 6]})
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in CappingTransformer.transform",
+        )
+
     def test_non_numeric_column_error(self):
         """Test that transform will raise an error if a column to transform is not numeric."""
 
@@ -765,6 +1148,188 @@ class TestTransform(object):
         assert x.quantiles == x2.quantiles, "quantiles attribute modified in transform"
 
 
+class TestBatchWeightedQuantiles(object):
+    """Tests for the CappingTransformer.batch_weighted_quantiles method."""
+
+    def test_arguments(self):
+        """Test that batch_weighted_quantiles has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.batch_weighted_quantiles,
+            expected_arguments=["self", "X", "quantiles", "sample_weight"],
+            expected_default_values=(None,),
+        )
+
+    @pytest.mark.parametrize("weighted", [True, False])
+    def test_output_same_as_prepare_quantiles(self, weighted):
+        """Test that the output is the same as calling prepare_quantiles on each column."""
+
+        rng = np.random.default_rng(0)
+
+        df = pd.DataFrame(
+            {
+                "a": rng.normal(size=200),
+                "b": rng.integers(0, 5, size=200).astype("float"),
+                "c": rng.integers(-3, 3, size=200),
+            }
+        )
+
+        df.loc[rng.random(size=200) < 0.2, "a"] = np.NaN
+        df.loc[rng.random(size=200) < 0.2, "b"] = np.NaN
+
+        sample_weight = rng.integers(0, 4, size=200) if weighted else None
+
+        quantiles = {"a": [0.05, 0.95], "b": [None, 0.37], "c": [0, 1]}
+
+        x = CappingTransformer(quantiles=quantiles)
+
+        expected = {
+            col: x.prepare_quantiles(df[col], col_quantiles, sample_weight)
+            for col, col_quantiles in quantiles.items()
+        }
+
+        actual = x.batch_weighted_quantiles(df, quantiles, sample_weight)
+
+        h.assert_equal_dispatch(
+            expected=expected,
+            actual=actual,
+            msg="batch_weighted_quantiles output",
+        )
+
+    def test_sample_weight_checked_once(self, mocker):
+        """Test that check_sample_weight is called once for all columns."""
+
+        df = d.create_df_9()
+
+        x = CappingTransformer(quantiles={"a": [0.1, 1], "b": [0.5, None]})
+
+        spy = mocker.spy(tubular.capping.CappingTransformer, "check_sample_weight")
+
+        x.batch_weighted_quantiles(df, x.quantiles, df["c"])
+
+        assert (
+            spy.call_count == 1
+        ), f"Unexpected number of calls to check_sample_weight -\n  Expected: 1\n  Actual: {spy.call_count}"
+
+    def test_negative_values_in_weights_error(self):
+        """Test that an exception is raised if there are negative values in sample_weight."""
+
+        x = CappingTransformer(quantiles={"a": [0.1, 1]})
+
+        df = pd.DataFrame({"a": [1, 2, 3]})
+
+        with pytest.raises(ValueError, match="negative weights in sample weights"):
+
+            x.batch_weighted_quantiles(df, x.quantiles, [1, -1, 1])
+
+
+class TestInterpolateQuantiles(object):
+    """Tests for the CappingTransformer.interpolate_quantiles method."""
+
+    def test_arguments(self):
+        """Test that interpolate_quantiles has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.interpolate_quantiles,
+            expected_arguments=["self", "values", "quantiles", "sample_weight"],
+            expected_default_values=(None,),
+        )
+
+    def test_unweighted_output_same_as_unit_weights(self):
+        """Test the quantiles found with np.partition match those found by sorting with unit weights."""
+
+        rng = np.random.default_rng(1)
+
+        values = rng.integers(0, 50, size=999).astype("float")
+        values[rng.random(size=999) < 0.1] = np.NaN
+
+        quantiles = np.array([0, 0.001, 0.1, 1 / 3, 0.5, 0.9, 0.999, 1])
+
+        x = CappingTransformer(quantiles={"a": [0.1, 1]})
+
+        expected = x.interpolate_quantiles(values, quantiles, np.ones(values.shape[0]))
+
+        actual = x.interpolate_quantiles(values, quantiles)
+
+        h.assert_equal_dispatch(
+            expected=expected,
+            actual=actual,
+            msg="interpolate_quantiles output",
+        )
+
+
+class TestApplyFusedCapping(object):
+    """Tests for the CappingTransformer.apply_fused_capping method."""
+
+    def test_arguments(self):
+        """Test that apply_fused_capping has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.apply_fused_capping,
+            expected_arguments=["self", "X", "columns"],
+        )
+
+    def test_output_same_as_column_by_column_capping(self):
+        """Test that the output is the same as capping each column in turn with pandas."""
+
+        rng = np.random.default_rng(0)
+
+        values = rng.normal(size=(100, 4))
+        values[rng.random(size=values.shape) < 0.1] = np.NaN
+
+        df = pd.DataFrame(values, columns=["a", "b", "c", "d"])
+
+        capping_values = {
+            "a": [-1, 1],
+            "b": [None, 0.5],
+            "c": [-0.5, None],
+            "d": [-10, 10],
+        }
+
+        expected = df.copy()
+
+        for col, (cap_min, cap_max) in capping_values.items():
+
+            if cap_min is not None:
+
+                expected.loc[expected[col] < cap_min, col] = cap_min
+
+            if cap_max is not None:
+
+                expected.loc[expected[col] > cap_max, col] = cap_max
+
+        x = CappingTransformer(capping_values=capping_values)
+
+        df_transformed = x.apply_fused_capping(df.copy(), ["a", "b", "c", "d"])
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in CappingTransformer.apply_fused_capping",
+        )
+
+    def test_other_columns_untouched(self):
+        """Test that columns not passed to apply_fused_capping are not changed."""
+
+        df = pd.DataFrame(
+            {"a": [1.0, 5.0, 10.0], "b": [1.0, 5.0, 10.0], "c": ["x", "y", "z"]}
+        )
+
+        expected = pd.DataFrame(
+            {"a": [2.0, 5.0, 8.0], "b": [1.0, 5.0, 10.0], "c": ["x", "y", "z"]}
+        )
+
+        x = CappingTransformer(capping_values={"a": [2, 8], "b": [2, 8]})
+
+        df_transformed = x.apply_fused_capping(df, ["a"])
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in CappingTransformer.apply_fused_capping",
+        )
+
+
 class TestWeightedQuantile(object):
     """Tests for the CappingTransformer.weighted_quantile method."""
 
@@ -866,3 +1431,156 @@ class TestWeightedQuantile(object):
         with pytest.raises(ValueError, match="negative weights in sample weights"):
 
             x.weighted_quantile([2, 3, 4, 5], [0, 1], [2, -0.01])
+
+
+class TestTransformRecord(object):
+    """Tests for CappingTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    @pytest.mark.parametrize(
+        "capping_values",
+        [
+            {"a": [2, 5], "b": [None, 7], "c": [0, None]},
+            {"a": [2.5, 4.5], "b": [1, 8.5], "c": [-4.5, 1.5]},
+        ],
+    )
+    def test_same_as_transform(self, capping_values):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_3()
+
+        x = CappingTransformer(capping_values=capping_values)
+
+        h.assert_transform_record_equal(x, df, "CappingTransformer.transform_record")
+
+    def test_non_numeric_error(self):
+        """Test that an exception is raised if values to cap are not numeric."""
+
+        x = CappingTransformer(capping_values={"a": [2, 5], "b": [-1, 8]})
+
+        with pytest.raises(
+            TypeError, match=r"The following columns are not numeric in X; \['b'\]"
+        ):
+
+            x.transform_record({"a": 1, "b": "x"})
+
+    def test_null_values_unchanged(self):
+        """Test that null values, including None, are not capped."""
+
+        x = CappingTransformer(capping_values={"a": [2, 5], "b": [-1, 8]})
+
+        h.assert_equal_dispatch(
+            expected={"a": None, "b": 8},
+            actual=x.transform_record({"a": None, "b": 10}),
+            msg="transform_record output",
+        )
+
+
+class TestColumnFunctions(object):
+    """Tests for CappingTransformer.column_functions() and CappingTransformer.cap_column()."""
+
+    def test_arguments(self):
+        """Test that column_functions and cap_column have expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.column_functions, expected_arguments=["self"]
+        )
+
+        h.test_function_arguments(
+            func=CappingTransformer.cap_column, expected_arguments=["self", "X_c", "c"]
+        )
+
+    @pytest.mark.parametrize(
+        "capping_values",
+        [
+            {"a": [2, 5], "b": [None, 7], "c": [0, None]},
+            {"a": [2.5, 4.5], "b": [1, 8.5], "c": [-4.5, 1.5]},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "transformer", [CappingTransformer, OutOfRangeNullTransformer]
+    )
+    def test_same_as_transform(self, capping_values, transformer):
+        """Test that applying the function for each column gives the same output as transform,
+        for float and int columns, without modifying the input."""
+
+        df = d.create_df_3()
+        df["d"] = [1, 2, 3, 4, 5, 6, 7]
+
+        x = transformer(capping_values={**capping_values, "d": [2, 5]})
+
+        expected = x.transform(df)
+
+        for c, column_function in x.column_functions().items():
+
+            h.assert_series_equal_msg(
+                actual=column_function(df[c]),
+                expected=expected[c],
+                msg_tag=f"column function output for {c}",
+            )
+
+        h.assert_frame_equal_msg(
+            actual=df[["a", "b", "c"]],
+            expected=d.create_df_3(),
+            msg_tag="input modified by column functions",
+        )
+
+    def test_non_numeric_error(self):
+        """Test that an exception is raised if the column is not numeric."""
+
+        x = CappingTransformer(capping_values={"a": [2, 5]})
+
+        with pytest.raises(
+            TypeError, match=r"The following columns are not numeric in X; \['a'\]"
+        ):
+
+            x.cap_column(pd.Series(["a", "b"]), "a")
+
+
+class TestCheckColumnFunctionsInput(object):
+    """Tests for CappingTransformer.check_column_functions_input()."""
+
+    def test_arguments(self):
+        """Test that check_column_functions_input has expected arguments."""
+
+        h.test_function_arguments(
+            func=CappingTransformer.check_column_functions_input,
+            expected_arguments=["self", "X_columns"],
+        )
+
+    def test_non_numeric_error(self):
+        """Test that the error lists all the non-numeric columns, as in transform."""
+
+        df = d.create_df_3()
+        df["b"] = df["b"].astype(str)
+        df["c"] = df["c"].astype(str)
+
+        x = CappingTransformer(capping_values={"a": [2, 5], "b": [1, 3], "c": [0, 1]})
+
+        with pytest.raises(
+            TypeError, match=r"The following columns are not numeric in X; \['b', 'c'\]"
+        ):
+
+            x.transform(df)
+
+        with pytest.raises(
+            TypeError, match=r"The following columns are not numeric in X; \['b', 'c'\]"
+        ):
+
+            x.check_column_functions_input({c: df[c] for c in x.columns})
+
+    def test_numeric_no_error(self):
+        """Test that no error is raised if the columns are numeric."""
+
+        df = d.create_df_3()
+
+        x = CappingTransformer(capping_values={"a": [2, 5], "b": [1, 3]})
+
+        x.check_column_functions_input({c: df[c] for c in x.columns})
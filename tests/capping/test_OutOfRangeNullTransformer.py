@@ -27,7 +27,11 @@ class TestInit(object):
 
     @pytest.mark.parametrize(
         "method_name",
-        [("fit"), ("set_replacement_values")],
+        [
+            ("fit"),
+            ("set_replacement_values"),
+            ("set_capping_values_from_sketches"),
+        ],
     )
     def test_class_methods(self, method_name):
         """Test that OutOfRangeNullTransformer has transform fit and set_replacement_values methods."""
@@ -231,3 +235,105 @@ class TestSetReplacementValues(object):
             },
             msg="attributes not as expected after running set_replacement_values",
         )
+
+
+class TestTransform(object):
+    """Tests for OutOfRangeNullTransformer.transform()."""
+
+    def expected_df_1():
+        """Expected output from test_expected_output."""
+
+        df = d.create_df_3()
+
+        df["a"] = [np.NaN, 2, 3, 4, 5, np.NaN, np.NaN]
+        df["b"] = [1, 2, 3, np.NaN, 7, np.NaN, np.NaN]
+        df["c"] = [np.NaN, 1, 2, 3, np.NaN, np.NaN, np.NaN]
+
+        return df
+
+    @pytest.mark.parametrize(
+        "df, expected",
+        h.row_by_row_params(d.create_df_3(), expected_df_1())
+        + h.index_preserved_params(d.create_df_3(), expected_df_1()),
+    )
+    def test_expected_output(self, df, expected):
+        """Test that values outside of the capping values are set to null in transform."""
+
+        x = OutOfRangeNullTransformer(
+            capping_values={"a": [2, 5], "b": [None, 7], "c": [0, None]}
+        )
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in OutOfRangeNullTransformer.transform",
+        )
+
+
+class TestSetCappingValuesFromSketches(object):
+    """Tests for the OutOfRangeNullTransformer.set_capping_values_from_sketches method."""
+
+    def test_replacement_values_null_after_update_sketches(self):
+        """Test that _replacement_values are null after capping values are set from sketches."""
+
+        df = d.create_df_9()
+
+        x = OutOfRangeNullTransformer(
+            quantiles={"a": [0, 1], "b": [None, 1]}, sketch_compression=100
+        )
+
+        x.update_sketches(df)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "capping_values": {
+                    "a": [np.float64(1.0), np.float64(6.0)],
+                    "b": [None, np.float64(5.0)],
+                },
+                "_replacement_values": {"a": [np.NaN, np.NaN], "b": [None, np.NaN]},
+            },
+            msg="attributes after update_sketches",
+        )
+
+    def test_replacement_values_null_after_finalize(self):
+        """Test that _replacement_values are null after partial_fit and finalize."""
+
+        df = d.create_df_9()
+
+        x = OutOfRangeNullTransformer(
+            quantiles={"a": [0, 1], "b": [None, 1]}, sketch_compression=100
+        )
+
+        x.partial_fit(df).finalize()
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "capping_values": {
+                    "a": [np.float64(1.0), np.float64(6.0)],
+                    "b": [None, np.float64(5.0)],
+                },
+                "_replacement_values": {"a": [np.NaN, np.NaN], "b": [None, np.NaN]},
+            },
+            msg="attributes after finalize",
+        )
+
+
+class TestTransformRecord(object):
+    """Tests for OutOfRangeNullTransformer.transform_record()."""
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_3()
+
+        x = OutOfRangeNullTransformer(
+            capping_values={"a": [2, 5], "b": [None, 7], "c": [0, None]}
+        )
+
+        h.assert_transform_record_equal(
+            x, df, "OutOfRangeNullTransformer.transform_record"
+        )
@@ -0,0 +1,317 @@
+import pytest
+import tubular.testing.helpers as h
+
+import pandas as pd
+import numpy as np
+
+from tubular.capping import TDigest, CappingTransformer, combine_tdigests
+
+
+class TestInit(object):
+    """Tests for TDigest.init()."""
+
+    def test_arguments(self):
+        """Test that init has expected arguments."""
+
+        h.test_function_arguments(
+            func=TDigest.__init__,
+            expected_arguments=["self", "compression"],
+            expected_default_values=(100,),
+        )
+
+    @pytest.mark.parametrize(
+        "method_name",
+        [
+            ("update"),
+            ("merge"),
+            ("collect"),
+            ("compress_if_full"),
+            ("scale"),
+            ("scale_limits"),
+            ("merge_groups"),
+            ("compress"),
+            ("quantile"),
+        ],
+    )
+    def test_class_methods(self, method_name):
+        """Test that TDigest has the expected methods."""
+
+        x = TDigest()
+
+        h.test_object_method(obj=x, expected_method=method_name, msg=method_name)
+
+    def test_compression_type_error(self):
+        """Test that an exception is raised if compression is not an int or float."""
+
+        with pytest.raises(
+            TypeError, match="compression should be an int or float but got"
+        ):
+
+            TDigest(compression="100")
+
+    def test_compression_value_error(self):
+        """Test that an exception is raised if compression is not greater than 0."""
+
+        with pytest.raises(
+            ValueError, match="compression should be greater than 0 but got 0"
+        ):
+
+            TDigest(compression=0)
+
+
+class TestUpdate(object):
+    """Tests for TDigest.update()."""
+
+    def test_nulls_and_zero_weights_ignored(self):
+        """Test that null values and zero weight observations are not added to the sketch."""
+
+        x = TDigest()
+
+        x.update(
+            pd.Series([1.0, np.NaN, 3.0, 10.0, -5.0]),
+            np.array([1.0, 1.0, 2.0, 0.0, 1.0]),
+        )
+
+        x.collect()
+
+        h.assert_equal_dispatch(
+            expected=[-5.0, 1.0, 3.0],
+            actual=x.means.tolist(),
+            msg="means after update",
+        )
+
+        h.assert_equal_dispatch(
+            expected=[1.0, 1.0, 2.0],
+            actual=x.weights.tolist(),
+            msg="weights after update",
+        )
+
+        assert (x.min, x.max) == (
+            -5.0,
+            3.0,
+        ), f"unexpected min and max after update - {(x.min, x.max)}"
+
+    def test_update_returns_self(self):
+        """Test that update returns self."""
+
+        x = TDigest()
+
+        assert x.update([1, 2, 3]) is x, "update did not return self"
+
+
+class TestCompress(object):
+    """Tests for TDigest.compress()."""
+
+    def test_totals_preserved(self):
+        """Test that compress preserves the total weight, count and weighted sum of the data."""
+
+        rng = np.random.default_rng(0)
+
+        values = rng.normal(size=10000)
+        weights = rng.integers(1, 5, size=10000).astype("float")
+
+        x = TDigest(compression=50)
+
+        x.update(values, weights)
+
+        x.compress()
+
+        np.testing.assert_allclose(x.weights.sum(), weights.sum())
+        np.testing.assert_allclose(x.counts.sum(), 10000)
+        np.testing.assert_allclose(
+            (x.means * x.weights).sum(), (values * weights).sum()
+        )
+
+    def test_number_of_centroids_bounded(self):
+        """Test that after compress there are at most compression + 1 centroids and the means are sorted."""
+
+        rng = np.random.default_rng(1)
+
+        x = TDigest(compression=50)
+
+        for _ in range(10):
+
+            x.update(rng.exponential(size=5000))
+
+        x.compress()
+
+        assert (
+            len(x.means) <= 51
+        ), f"too many centroids after compress, expected at most 51 but got {len(x.means)}"
+
+        assert np.all(np.diff(x.means) >= 0), "centroid means not sorted"
+
+
+class TestMerge(object):
+    """Tests for TDigest.merge()."""
+
+    def test_merge_same_as_single_sketch_when_exact(self):
+        """Test that merging sketches on small partitions gives the same quantiles as one sketch."""
+
+        values = np.array([5.0, 1.0, 4.0, 2.0, 3.0, 8.0, 7.0, 6.0])
+        weights = np.array([1.0, 2.0, 1.0, 1.0, 3.0, 1.0, 1.0, 2.0])
+
+        quantiles = [0, 0.1, 0.25, 0.5, 0.9, 1]
+
+        x = TDigest().update(values, weights)
+
+        x1 = TDigest().update(values[:3], weights[:3])
+        x2 = TDigest().update(values[3:], weights[3:])
+
+        x1.merge(x2)
+
+        h.assert_equal_dispatch(
+            expected=x.quantile(quantiles),
+            actual=x1.quantile(quantiles),
+            msg="quantiles from merged sketches",
+        )
+
+    def test_other_not_modified(self):
+        """Test that the sketch merged in is not modified."""
+
+        x1 = TDigest().update([1, 2, 3])
+        x2 = TDigest().update([4, 5])
+
+        x1.merge(x2)
+
+        h.assert_equal_dispatch(
+            expected=[np.float64(4.0), np.float64(5.0)],
+            actual=x2.quantile([0, 1]),
+            msg="quantiles from sketch merged in",
+        )
+
+    def test_non_tdigest_error(self):
+        """Test that an exception is raised if other is not a TDigest."""
+
+        with pytest.raises(TypeError, match="other should be a TDigest but got"):
+
+            TDigest().merge([1, 2, 3])
+
+
+class TestQuantile(object):
+    """Tests for TDigest.quantile()."""
+
+    @pytest.mark.parametrize("weighted", [True, False])
+    def test_exact_before_compression(self, weighted):
+        """Test that quantiles are the same as CappingTransformer.weighted_quantile before any compression."""
+
+        rng = np.random.default_rng(2)
+
+        values = rng.normal(size=300)
+        values[rng.random(size=300) < 0.1] = np.NaN
+
+        weights = rng.integers(0, 3, size=300).astype("float") if weighted else None
+
+        quantiles = [0, 0.01, 0.3, 0.5, 0.99, 1]
+
+        x = TDigest(compression=100)
+
+        x.update(values, weights)
+
+        h.assert_equal_dispatch(
+            expected=CappingTransformer(capping_values={"a": [1, 2]}).weighted_quantile(
+                values, quantiles, weights
+            ),
+            actual=x.quantile(quantiles),
+            msg="TDigest quantiles",
+        )
+
+    def test_approximate_quantiles_within_error_bound(self):
+        """Test that the rank error of approximate quantiles is within the documented bound."""
+
+        rng = np.random.default_rng(3)
+
+        values = rng.lognormal(size=200000)
+
+        x = TDigest(compression=100)
+
+        for chunk in np.array_split(values, 10):
+
+            x.update(chunk)
+
+        quantiles = np.array([0.001, 0.01, 0.5, 0.99, 0.999])
+
+        estimates = np.array(x.quantile(quantiles))
+
+        ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+
+        bounds = np.pi * np.sqrt(quantiles * (1 - quantiles)) / 100
+
+        assert np.all(
+            np.abs(ranks - quantiles) <= bounds
+        ), f"rank errors {np.abs(ranks - quantiles)} larger than {bounds}"
+
+    def test_min_and_max_returned(self):
+        """Test that quantiles 0 and 1 give the min and max after compression."""
+
+        rng = np.random.default_rng(4)
+
+        values = rng.normal(size=5000)
+
+        x = TDigest(compression=20).update(values)
+
+        h.assert_equal_dispatch(
+            expected=[values.min(), values.max()],
+            actual=x.quantile([0, 1]),
+            msg="TDigest min and max quantiles",
+        )
+
+    def test_empty_error(self):
+        """Test that an exception is raised if no values have been added."""
+
+        with pytest.raises(
+            ValueError, match="no values have been added to the TDigest"
+        ):
+
+            TDigest().update([np.NaN]).quantile([0.5])
+
+
+class TestCombineTDigests(object):
+    """Tests for combine_tdigests()."""
+
+    def test_sketches_merged_by_key(self):
+        """Test that sketches are merged by key and sketches for keys only in sketches are copied."""
+
+        sketches = {"a": TDigest().update([1, 2, 3]), "b": TDigest().update([4])}
+        other_sketches = {"a": TDigest().update([4, 5])}
+
+        combined_sketches = combine_tdigests(sketches, other_sketches, 100)
+
+        combined_sketches["a"].collect()
+
+        assert (
+            combined_sketches["a"].weights.sum() == 5
+        ), "unexpected total weight of merged sketch"
+
+        h.assert_equal_dispatch(
+            expected={
+                "a": [np.float64(1.0), np.float64(5.0)],
+                "b": [np.float64(4.0), np.float64(4.0)],
+            },
+            actual={k: v.quantile([0, 1]) for k, v in combined_sketches.items()},
+            msg="quantiles from combined sketches",
+        )
+
+    def test_inputs_not_modified(self):
+        """Test that neither dict of sketches is modified."""
+
+        sketches = {"a": TDigest().update([1, 2, 3])}
+        other_sketches = {"a": TDigest().update([4, 5])}
+
+        combined_sketches = combine_tdigests(sketches, other_sketches, 100)
+
+        assert (
+            combined_sketches["a"] is not sketches["a"]
+        ), "sketch not copied by combine_tdigests"
+
+        h.assert_equal_dispatch(
+            expected=[
+                [np.float64(1.0), np.float64(3.0)],
+                [np.float64(4.0), np.float64(5.0)],
+            ],
+            actual=[
+                sketches["a"].quantile([0, 1]),
+                other_sketches["a"].quantile([0, 1]),
+            ],
+            msg="quantiles from input sketches",
+        )
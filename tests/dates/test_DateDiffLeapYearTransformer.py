@@ -72,6 +72,122 @@ class TestCalculateAge(object):
             date_transformer.calculate_age(row=row)
 
 
+class TestCalculateAgeVectorised(object):
+    """Tests for the calculate_age_vectorised function in dates.py."""
+
+    def test_arguments(self):
+        """Test that calculate_age_vectorised has expected arguments."""
+
+        h.test_function_arguments(
+            func=DateDiffLeapYearTransformer.calculate_age_vectorised,
+            expected_arguments=["self", "X"],
+        )
+
+    def test_upper_column_type_error(self):
+        """Test that an exception is raised if upper date values are not datetime objects."""
+
+        df = pd.DataFrame({"a": [datetime.date(2020, 5, 10)], "b": ["dummy_val"]})
+
+        date_transformer = DateDiffLeapYearTransformer(
+            column_lower="a", column_upper="b", new_column_name="c", drop_cols=True
+        )
+
+        with pytest.raises(
+            TypeError,
+            match="upper column values should be datetime.datetime or datetime.date objects",
+        ):
+
+            date_transformer.calculate_age_vectorised(df)
+
+    def test_lower_column_type_error(self):
+        """Test that an exception is raised if lower date values are not datetime objects."""
+
+        df = pd.DataFrame({"a": ["dummy_val"], "b": [datetime.date(2020, 5, 10)]})
+
+        date_transformer = DateDiffLeapYearTransformer(
+            column_lower="a", column_upper="b", new_column_name="c", drop_cols=True
+        )
+
+        with pytest.raises(
+            TypeError,
+            match="lower column values should be datetime.datetime or datetime.date objects",
+        ):
+
+            date_transformer.calculate_age_vectorised(df)
+
+    @pytest.mark.parametrize("missing_replacement", [None, 0, -1.5, "missing"])
+    def test_results_same_as_calculate_age(self, missing_replacement):
+        """Test that calculate_age_vectorised gives the same output as applying calculate_age row by row."""
+
+        np.random.seed(0)
+
+        dates = pd.Series(
+            pd.date_range("1896-02-27", "2004-03-02", freq="D").date
+        ).sample(500, replace=True)
+
+        df = pd.DataFrame(
+            {
+                "a": dates.sample(frac=1).values,
+                "b": dates.values,
+            }
+        )
+
+        # leap day combinations
+        df.loc[0] = [datetime.date(2000, 2, 29), datetime.date(2001, 2, 28)]
+        df.loc[1] = [datetime.date(2000, 2, 29), datetime.date(2001, 3, 1)]
+        df.loc[2] = [datetime.date(2001, 2, 28), datetime.date(2000, 2, 29)]
+        df.loc[3] = [datetime.date(2001, 3, 1), datetime.date(2000, 2, 29)]
+        df.loc[4] = [None, datetime.date(2000, 2, 29)]
+        df.loc[5] = [datetime.date(2000, 2, 29), np.NaN]
+
+        date_transformer = DateDiffLeapYearTransformer(
+            column_lower="a",
+            column_upper="b",
+            new_column_name="c",
+            drop_cols=True,
+            missing_replacement=missing_replacement,
+        )
+
+        expected = df.apply(lambda x: date_transformer.calculate_age(x), axis=1)
+
+        actual = date_transformer.calculate_age_vectorised(df)
+
+        h.assert_series_equal_msg(
+            actual=actual,
+            expected=expected,
+            msg_tag="calculate_age_vectorised output different to calculate_age",
+        )
+
+    def test_datetime64_columns(self):
+        """Test that datetime64 columns can be used, including columns with NaT values."""
+
+        df = pd.DataFrame(
+            {
+                "a": pd.to_datetime(["2000-02-29", "2000-02-29", None, "2010-06-01"]),
+                "b": pd.to_datetime(["2001-02-28", "2001-03-01", "2001-01-01", None]),
+            },
+            index=[3, 1, 0, 2],
+        )
+
+        date_transformer = DateDiffLeapYearTransformer(
+            column_lower="a",
+            column_upper="b",
+            new_column_name="c",
+            drop_cols=True,
+            missing_replacement=-1,
+        )
+
+        expected = pd.Series([0, 1, -1, -1], index=[3, 1, 0, 2])
+
+        actual = date_transformer.calculate_age_vectorised(df)
+
+        h.assert_series_equal_msg(
+            actual=actual,
+            expected=expected,
+            msg_tag="calculate_age_vectorised output with datetime64 columns",
+        )
+
+
 class TestInit(object):
     """Tests for DateDiffLeapYearTransformer.init()."""
 
@@ -105,6 +221,11 @@ class TestInit(object):
         h.test_object_method(
             obj=x, expected_method="calculate_age", msg="calculate_message"
         )
+        h.test_object_method(
+            obj=x,
+            expected_method="calculate_age_vectorised",
+            msg="calculate_age_vectorised",
+        )
 
     def test_inheritance(self):
         """Test that DateDiffLeapYearTransformer inherits from BaseTransformer."""
@@ -411,3 +532,50 @@ class TestTransform(object):
             expected=expected,
             msg_tag="Unexpected values in DateDiffLeapYearTransformer.transform (nulls)",
         )
+
+    @pytest.mark.parametrize(
+        "df, expected",
+        h.index_preserved_params(d.create_date_test_df(), expected_df_2()),
+    )
+    @pytest.mark.parametrize("n_jobs", [None, 2])
+    def test_expected_output_chunk_rows(self, df, expected, n_jobs):
+        """Test that the output from transform is the same when transforming in blocks of rows."""
+
+        x = DateDiffLeapYearTransformer(
+            column_lower="a",
+            column_upper="b",
+            new_column_name="c",
+            drop_cols=False,
+            n_jobs=n_jobs,
+            chunk_rows=3,
+        )
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in DateDiffLeapYearTransformer.transform (with chunk_rows)",
+        )
+
+    def test_out_of_bounds_dates(self):
+        """Test that dates outside of the datetime64[ns] range are still handled, by calculating row by row."""
+
+        df = pd.DataFrame(
+            {
+                "a": [datetime.date(1, 1, 1), datetime.date(2000, 2, 29)],
+                "b": [datetime.date(2020, 5, 1), datetime.date(2001, 2, 28)],
+            }
+        )
+
+        x = DateDiffLeapYearTransformer(
+            column_lower="a", column_upper="b", new_column_name="c", drop_cols=True
+        )
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=pd.DataFrame({"c": [2019, 0]}),
+            msg_tag="Unexpected values in DateDiffLeapYearTransformer.transform (out of bounds dates)",
+        )
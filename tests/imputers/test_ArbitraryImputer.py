@@ -168,3 +168,66 @@ class TestTransform(object):
         ):
 
             x.transform(df)
+
+
+class TestTransformRecord(object):
+    """Tests for ArbitraryImputer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=ArbitraryImputer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    @pytest.mark.parametrize("impute_value", [-1, "z"])
+    def test_same_as_transform(self, impute_value):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_5()
+
+        x = ArbitraryImputer(impute_value=impute_value, columns=["b", "c"])
+
+        h.assert_transform_record_equal(x, df, "ArbitraryImputer.transform_record")
+
+
+class TestColumnFunctions(object):
+    """Tests for ArbitraryImputer.column_functions() and ArbitraryImputer.impute_column()."""
+
+    def test_arguments(self):
+        """Test that column_functions and impute_column have expected arguments."""
+
+        h.test_function_arguments(
+            func=ArbitraryImputer.column_functions, expected_arguments=["self"]
+        )
+
+        h.test_function_arguments(
+            func=ArbitraryImputer.impute_column,
+            expected_arguments=["self", "X_c", "c"],
+        )
+
+    @pytest.mark.parametrize("impute_value", [-1, "z", "a"])
+    def test_same_as_transform(self, impute_value):
+        """Test that applying the function for each column gives the same output as transform,
+        including adding the impute value to the categories of categorical columns."""
+
+        df = d.create_df_5()
+
+        x = ArbitraryImputer(impute_value=impute_value, columns=["b", "c"])
+
+        expected = x.transform(d.create_df_5())
+
+        for c, column_function in x.column_functions().items():
+
+            h.assert_series_equal_msg(
+                actual=column_function(df[c]),
+                expected=expected[c],
+                msg_tag=f"column function output for {c}",
+            )
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_5(),
+            msg_tag="input modified by column functions",
+        )
@@ -3,6 +3,7 @@ import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 
 import tubular
+from sklearn.exceptions import NotFittedError
 from tubular.imputers import BaseImputer
 import pandas as pd
 import numpy as np
@@ -173,3 +174,265 @@ class TestTransform:
         ):
 
             x.transform(df)
+
+    @pytest.mark.parametrize("copy", [True, False, "columns"])
+    def test_float_columns_imputed_as_block(self, copy):
+        """Test that transform gives the same output as pd.Series.fillna on each column when float64
+        columns are imputed as a single block, alongside columns imputed one at a time."""
+
+        df = pd.DataFrame(
+            {
+                "a": [1.0, np.NaN, 3.0, np.NaN],
+                "b": ["a", None, "c", "d"],
+                "c": [np.NaN, 2.0, np.NaN, 4.0],
+                "d": pd.Series([1.5, np.NaN, 2.5, 3.5], dtype="float32"),
+                "e": [1.0, 2.0, np.NaN, np.NaN],
+            },
+            index=[5, 3, 1, 0],
+        )
+
+        impute_values = {"a": 7, "b": "g", "c": np.float64(0.5), "d": 0.1, "e": "h"}
+
+        expected = df.copy()
+
+        for c, impute_value in impute_values.items():
+
+            expected[c] = expected[c].fillna(impute_value)
+
+        x = BaseImputer(copy=copy)
+        x.columns = ["a", "b", "c", "d", "e"]
+        x.impute_values_ = impute_values
+
+        df_transformed = x.transform(df.copy())
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="block imputed columns",
+        )
+
+    def test_x_modified_in_place_when_copy_false(self):
+        """Test that X is modified in place by the block imputation if copy is False."""
+
+        df = d.create_df_3()
+
+        x = BaseImputer(copy=False)
+        x.columns = ["a", "b"]
+        x.impute_values_ = {"a": 1.5, "b": 2.5}
+
+        df_transformed = x.transform(df)
+
+        assert df_transformed is df, "X not modified in place when copy is False"
+
+        assert (
+            df[["a", "b"]].notnull().all().all()
+        ), "nulls not imputed in X when copy is False"
+
+    def test_x_not_modified_when_copied(self):
+        """Test that the input X is not changed by the block imputation if copy is True."""
+
+        df = d.create_df_3()
+
+        x = BaseImputer()
+        x.columns = ["a", "b"]
+        x.impute_values_ = {"a": 1.5, "b": 2.5}
+
+        x.transform(df)
+
+        h.assert_equal_dispatch(
+            expected=d.create_df_3(),
+            actual=df,
+            msg="Check X not changing during transform",
+        )
+
+    def test_other_columns_not_copied_when_copy_columns(self):
+        """Test that with copy="columns" the columns not imputed still share memory with X, and the
+        block imputed columns do not."""
+
+        df = pd.DataFrame(
+            {
+                "a": [1.0, np.NaN, 3.0, np.NaN],
+                "b": [np.NaN, 2.0, np.NaN, 4.0],
+                "c": [5.0, 6.0, 7.0, 8.0],
+                "d": [1, 2, 3, 4],
+            }
+        )
+
+        x = BaseImputer(copy="columns")
+        x.columns = ["a", "b"]
+        x.impute_values_ = {"a": 1.5, "b": 2.5}
+
+        df_transformed = x.transform(df)
+
+        for c in ["c", "d"]:
+
+            assert np.shares_memory(
+                df_transformed[c].to_numpy(), df[c].to_numpy()
+            ), f"column {c} copied in transform with copy='columns'"
+
+        for c in ["a", "b"]:
+
+            assert not np.shares_memory(
+                df_transformed[c].to_numpy(), df[c].to_numpy()
+            ), f"column {c} modified in place in transform with copy='columns'"
+
+        assert df[["a", "b"]].isnull().sum().sum() == 4, "X modified in transform"
+
+
+class TestBlockImputeColumns:
+    """Tests for BaseImputer.block_impute_columns and BaseImputer.impute_block."""
+
+    def test_arguments(self):
+        """Test that block_impute_columns and impute_block have expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseImputer.block_impute_columns, expected_arguments=["self", "X"]
+        )
+
+        h.test_function_arguments(
+            func=BaseImputer.impute_block, expected_arguments=["self", "X", "columns"]
+        )
+
+    def test_float64_columns_with_numeric_impute_values(self):
+        """Test that only float64 columns with a numeric, non bool, impute value are imputed as a block."""
+
+        df = pd.DataFrame(
+            {
+                "a": [1.0, np.NaN],
+                "b": [1.0, np.NaN],
+                "c": [1.0, np.NaN],
+                "d": pd.Series([1.0, np.NaN], dtype="float32"),
+                "e": ["a", None],
+                "f": [1.0, np.NaN],
+                "g": [1.0, np.NaN],
+            }
+        )
+
+        x = BaseImputer()
+        x.columns = ["g", "a", "b", "c", "d", "e", "f"]
+        x.impute_values_ = {
+            "a": 1,
+            "b": "x",
+            "c": True,
+            "d": 1.0,
+            "e": "x",
+            "f": np.NaN,
+            "g": np.int64(2),
+        }
+
+        h.assert_equal_dispatch(
+            expected=["g", "a", "f"],
+            actual=x.block_impute_columns(df),
+            msg="block_impute_columns output",
+        )
+
+    def test_duplicate_columns_not_imputed_as_block(self):
+        """Test that no columns are imputed as a block if X has duplicate column names."""
+
+        df = pd.DataFrame([[1.0, np.NaN, 2.0]], columns=["a", "b", "b"])
+
+        x = BaseImputer()
+        x.columns = ["a"]
+        x.impute_values_ = {"a": 1.0}
+
+        h.assert_equal_dispatch(
+            expected=[],
+            actual=x.block_impute_columns(df),
+            msg="block_impute_columns output",
+        )
+
+    def test_impute_block_output(self):
+        """Test that impute_block fills the nulls in each column with its impute value."""
+
+        df = pd.DataFrame({"a": [1.0, np.NaN, 3.0], "b": [np.NaN, np.NaN, 6.0]})
+
+        x = BaseImputer()
+        x.columns = ["a", "b"]
+        x.impute_values_ = {"a": 7, "b": -1.5}
+
+        np.testing.assert_array_equal(
+            x.impute_block(df, ["a", "b"]),
+            np.array([[1.0, -1.5], [7.0, -1.5], [3.0, 6.0]]),
+        )
+
+
+class TestTransformRecord:
+    """Tests for BaseImputer.transform_record."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseImputer.transform_record, expected_arguments=["self", "record"]
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = TestTransform.expected_df_1()
+
+        x = BaseImputer()
+        x.columns = ["a", "b", "c"]
+        x.impute_values_ = {"a": 7, "b": "g", "c": "f"}
+
+        h.assert_transform_record_equal(x, df, "BaseImputer.transform_record")
+
+    def test_not_fitted_error(self):
+        """Test that an exception is raised if impute_values_ is not set."""
+
+        x = BaseImputer(columns="a")
+
+        with pytest.raises(NotFittedError):
+
+            x.transform_record({"a": 1})
+
+
+class TestColumnFunctions:
+    """Tests for BaseImputer.column_functions and BaseImputer.impute_column."""
+
+    def test_arguments(self):
+        """Test that column_functions and impute_column have expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseImputer.column_functions, expected_arguments=["self"]
+        )
+
+        h.test_function_arguments(
+            func=BaseImputer.impute_column, expected_arguments=["self", "X_c", "c"]
+        )
+
+    def test_same_as_transform(self):
+        """Test that applying the function for each column gives the same output as transform."""
+
+        df = TestTransform.expected_df_1()
+
+        x = BaseImputer()
+        x.columns = ["a", "b", "c"]
+        x.impute_values_ = {"a": 7, "b": "g", "c": "f"}
+
+        expected = x.transform(df)
+
+        column_functions = x.column_functions()
+
+        h.assert_equal_dispatch(
+            expected=["a", "b", "c"],
+            actual=list(column_functions.keys()),
+            msg="columns in column_functions",
+        )
+
+        for c, column_function in column_functions.items():
+
+            h.assert_series_equal_msg(
+                actual=column_function(df[c]),
+                expected=expected[c],
+                msg_tag=f"column function output for {c}",
+            )
+
+    def test_not_fitted_error(self):
+        """Test that an exception is raised if impute_values_ is not set."""
+
+        x = BaseImputer(columns="a")
+
+        with pytest.raises(NotFittedError):
+
+            x.column_functions()
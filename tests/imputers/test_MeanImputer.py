@@ -3,6 +3,7 @@ import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 
 import tubular
+from sklearn.exceptions import NotFittedError
 from tubular.imputers import MeanImputer
 
 import pandas as pd
@@ -126,6 +127,66 @@ class TestFit(object):
         )
 
 
+class TestPartialFit(object):
+    """Tests for MeanImputer.partial_fit() and MeanImputer.finalize()."""
+
+    def test_chunks_same_as_fit(self):
+        """Test that partial_fit on chunks of data then finalize gives the same impute values as fit."""
+
+        df = d.create_df_3()
+
+        x = MeanImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_chunks = MeanImputer(columns=["a", "b", "c"])
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="impute_values_ attribute after finalize",
+        )
+
+    def test_merged_partitions_same_as_fit(self):
+        """Test that merging the sufficient stats from partitions of the data gives the same impute
+        values as fit."""
+
+        df = d.create_df_3()
+
+        x = MeanImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_1 = MeanImputer(columns=["a", "b", "c"])
+        x_2 = MeanImputer(columns=["a", "b", "c"])
+
+        x_1.partial_fit(df.iloc[:4])
+        x_2.partial_fit(df.iloc[4:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="impute_values_ attribute after merge_sufficient_stats",
+        )
+
+    def test_finalize_not_fitted_error(self):
+        """Test that an exception is raised if finalize is called before partial_fit."""
+
+        x = MeanImputer(columns=["a", "b", "c"])
+
+        with pytest.raises(NotFittedError):
+
+            x.finalize()
+
+
 class TestTransform(object):
     """Tests for MeanImputer.transform()."""
 
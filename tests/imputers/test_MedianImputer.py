@@ -3,6 +3,7 @@ import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 
 import tubular
+from sklearn.exceptions import NotFittedError
 from tubular.imputers import MedianImputer
 
 import pandas as pd
@@ -17,8 +18,8 @@ class TestInit(object):
 
         h.test_function_arguments(
             func=MedianImputer.__init__,
-            expected_arguments=["self", "columns"],
-            expected_default_values=(None,),
+            expected_arguments=["self", "columns", "sketch_compression"],
+            expected_default_values=(None, 100),
         )
 
     def test_class_methods(self):
@@ -50,6 +51,24 @@ class TestInit(object):
 
             MedianImputer(columns=None, verbose=True, copy=True)
 
+    def test_sketch_compression_type_error(self):
+        """Test that an exception is raised if sketch_compression is not an int or float."""
+
+        with pytest.raises(
+            TypeError, match="sketch_compression should be an int or float but got"
+        ):
+
+            MedianImputer(sketch_compression="100")
+
+    def test_sketch_compression_value_error(self):
+        """Test that an exception is raised if sketch_compression is not greater than 0."""
+
+        with pytest.raises(
+            ValueError, match="sketch_compression should be greater than 0 but got 0"
+        ):
+
+            MedianImputer(sketch_compression=0)
+
 
 class TestFit(object):
     """Tests for MedianImputer.fit()"""
@@ -125,6 +144,121 @@ class TestFit(object):
             msg="Check X not changing during fit",
         )
 
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_n_jobs_same_as_serial(self, n_jobs):
+        """Test that fitting columns in parallel gives the same impute_values_ as fitting them one at a time."""
+
+        df = d.create_df_3()
+
+        x = MedianImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_parallel = MedianImputer(columns=["a", "b", "c"], n_jobs=n_jobs)
+
+        x_parallel.fit(df)
+
+        h.test_object_attributes(
+            obj=x_parallel,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="attributes after fit with n_jobs",
+        )
+
+
+class TestPartialFit(object):
+    """Tests for MedianImputer.partial_fit() and MedianImputer.finalize()."""
+
+    def test_chunks_same_as_fit(self):
+        """Test that partial_fit on chunks of data then finalize gives the same impute values as fit."""
+
+        df = d.create_df_3()
+
+        x = MedianImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_chunks = MedianImputer(columns=["a", "b", "c"])
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="impute_values_ attribute after finalize",
+        )
+
+    def test_merged_partitions_same_as_fit(self):
+        """Test that merging the sufficient stats from partitions of the data gives the same impute
+        values as fit."""
+
+        df = d.create_df_3()
+
+        x = MedianImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_1 = MedianImputer(columns=["a", "b", "c"])
+        x_2 = MedianImputer(columns=["a", "b", "c"])
+
+        x_1.partial_fit(df.iloc[:4])
+        x_2.partial_fit(df.iloc[4:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="impute_values_ attribute after merge_sufficient_stats",
+        )
+
+    def test_finalize_not_fitted_error(self):
+        """Test that an exception is raised if finalize is called before partial_fit."""
+
+        x = MedianImputer(columns=["a", "b", "c"])
+
+        with pytest.raises(NotFittedError):
+
+            x.finalize()
+
+    def test_approximate_median_for_large_data(self):
+        """Test that the median is approximated from the sketches once there is more data than
+        the sketches hold exactly."""
+
+        rng = np.random.default_rng(0)
+
+        df = pd.DataFrame({"a": rng.lognormal(size=20000)})
+
+        x = MedianImputer(columns="a", sketch_compression=20)
+
+        for chunk in np.array_split(df, 10):
+
+            x.partial_fit(chunk)
+
+        x.finalize()
+
+        rank = (df["a"] < x.impute_values_["a"]).mean()
+
+        assert (
+            np.abs(rank - 0.5) < 0.05
+        ), f"median from sketch has rank {rank}, expected close to 0.5"
+
+    def test_all_null_column(self):
+        """Test that the impute value is null for a column with no non-null values, as in fit."""
+
+        df = pd.DataFrame({"a": [np.NaN, np.NaN], "b": [1.0, 2.0]})
+
+        x = MedianImputer().partial_fit(df).finalize()
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"impute_values_": {"a": np.NaN, "b": np.float64(1.5)}},
+            msg="impute_values_ attribute after finalize",
+        )
+
 
 class TestTransform(object):
     """Tests for MedianImputer.transform()."""
@@ -3,6 +3,7 @@ import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 
 import tubular
+from sklearn.exceptions import NotFittedError
 from tubular.imputers import ModeImputer
 
 import pandas as pd
@@ -125,6 +126,105 @@ class TestFit(object):
             msg="Check X not changing during fit",
         )
 
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_n_jobs_same_as_serial(self, n_jobs):
+        """Test that fitting columns in parallel gives the same impute_values_ as fitting them one at a time."""
+
+        df = d.create_df_5()
+
+        x = ModeImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_parallel = ModeImputer(columns=["a", "b", "c"], n_jobs=n_jobs)
+
+        x_parallel.fit(df)
+
+        h.test_object_attributes(
+            obj=x_parallel,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="attributes after fit with n_jobs",
+        )
+
+
+class TestPartialFit(object):
+    """Tests for ModeImputer.partial_fit() and ModeImputer.finalize()."""
+
+    def test_chunks_same_as_fit(self):
+        """Test that partial_fit on chunks of data then finalize gives the same impute values as fit."""
+
+        df = d.create_df_5()
+
+        x = ModeImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_chunks = ModeImputer(columns=["a", "b", "c"])
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="impute_values_ attribute after finalize",
+        )
+
+    def test_merged_partitions_same_as_fit(self):
+        """Test that merging the sufficient stats from partitions of the data gives the same impute
+        values as fit."""
+
+        df = d.create_df_5()
+
+        x = ModeImputer(columns=["a", "b", "c"])
+
+        x.fit(df)
+
+        x_1 = ModeImputer(columns=["a", "b", "c"])
+        x_2 = ModeImputer(columns=["a", "b", "c"])
+
+        x_1.partial_fit(df.iloc[:4])
+        x_2.partial_fit(df.iloc[4:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="impute_values_ attribute after merge_sufficient_stats",
+        )
+
+    def test_finalize_not_fitted_error(self):
+        """Test that an exception is raised if finalize is called before partial_fit."""
+
+        x = ModeImputer(columns=["a", "b", "c"])
+
+        with pytest.raises(NotFittedError):
+
+            x.finalize()
+
+    def test_all_null_column(self):
+        """Test that the impute value is null for a column with no non-null values in any chunk."""
+
+        df = pd.DataFrame({"a": [np.NaN, np.NaN, np.NaN], "b": ["x", "y", "y"]})
+
+        x = ModeImputer()
+
+        for chunk in [df.iloc[:1], df.iloc[1:]]:
+
+            x.partial_fit(chunk)
+
+        x.finalize()
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"impute_values_": {"a": np.NaN, "b": "y"}},
+            msg="impute_values_ attribute after finalize",
+        )
+
 
 class TestTransform(object):
     """Tests for ModeImputer.transform()."""
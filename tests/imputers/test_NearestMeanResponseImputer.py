@@ -247,6 +247,71 @@ class TestFit(object):
             msg="impute_values_ attribute",
         )
 
+    def test_first_nearest_level_used_for_ties(self):
+        """Test that the first level in sorted order is learnt when levels are equally close in mean response."""
+
+        df = pd.DataFrame(
+            {
+                "a": [3, 2, np.nan, 1, 2, 3],
+                "c": [1, 0, 2, 0, 4, 3],
+            }
+        )
+
+        x = NearestMeanResponseImputer(response_column="c", columns=["a"])
+
+        x.fit(df)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"impute_values_": {"a": np.float64(2)}},
+            msg="impute_values_ attribute",
+        )
+
+    def test_learnt_values_non_numeric_columns(self):
+        """Test that the nearest mean response values learnt during fit are expected for object and
+        categorical columns."""
+
+        df = pd.DataFrame(
+            {
+                "a": ["x", "y", None, "z", "y", None],
+                "c": [1, 3, 4, 5, 3, 4],
+            }
+        )
+
+        df["b"] = df["a"].astype(pd.CategoricalDtype(["z", "y", "x"]))
+
+        x = NearestMeanResponseImputer(response_column="c", columns=["a", "b"])
+
+        x.fit(df)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"impute_values_": {"a": "y", "b": "z"}},
+            msg="impute_values_ attribute",
+        )
+
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_n_jobs_same_as_serial(self, n_jobs):
+        """Test that fitting columns in parallel gives the same impute_values_ as fitting them one at a time."""
+
+        df = d.create_NearestMeanResponseImputer_test_df()
+
+        x = NearestMeanResponseImputer(response_column="c", columns=["a", "b"])
+
+        x.fit(df)
+
+        x_parallel = NearestMeanResponseImputer(
+            response_column="c", columns=["a", "b"], n_jobs=n_jobs
+        )
+
+        x_parallel.fit(df)
+
+        h.test_object_attributes(
+            obj=x_parallel,
+            expected_attributes={"impute_values_": x.impute_values_},
+            msg="attributes after fit with n_jobs",
+        )
+
 
 class TestTransform(object):
     """Tests for NearestMeanResponseImputer.transform"""
@@ -107,3 +107,23 @@ class TestTransform(object):
             actual=df_transformed,
             msg="Check null indicator columns created correctly in transform.",
         )
+
+
+class TestTransformRecord(object):
+    """Tests for NullIndicator.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=NullIndicator.transform_record, expected_arguments=["self", "record"]
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_9()
+
+        x = NullIndicator(columns=["a", "b", "c"])
+
+        h.assert_transform_record_equal(x, df, "NullIndicator.transform_record")
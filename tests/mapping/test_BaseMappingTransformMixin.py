@@ -1,8 +1,11 @@
+import pytest
 import pandas as pd
+import numpy as np
 import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 
 import tubular
+from tubular.base import ReturnKeyDict
 from tubular.mapping import BaseMappingTransformMixin
 
 
@@ -120,3 +123,178 @@ class TestTransform(object):
             call_pos_arg,
             "positional args in second pd.Series.map call not correct",
         )
+
+
+class TestMapColumn(object):
+    """Tests for BaseMappingTransformMixin.map_column()."""
+
+    def test_arguments(self):
+        """Test that map_column has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMappingTransformMixin.map_column,
+            expected_arguments=["self", "X_c", "c"],
+        )
+
+    @pytest.mark.parametrize(
+        "X_c, mapping",
+        [
+            (
+                pd.Series(["a", None, "b", np.NaN, "a", "c"], index=[5, 4, 3, 2, 1, 0]),
+                {"a": "x", "b": 1},
+            ),
+            (
+                pd.Series(["a", None, "b", np.NaN, "a", "c"]),
+                {"a": 1, "b": 2, "c": 3, None: 0},
+            ),
+            (pd.Series([1, 2, 3, 1, 2, 3]), {1: 1.5, 2: 2.5}),
+            (pd.Series([1.0, np.NaN, 2.0, 1.0]), {np.NaN: -1.0, 1.0: 10.0}),
+            (pd.Series([True, False, True]), {True: 1, False: 0}),
+            (pd.Series(["a", "b", np.NaN, "a"], dtype="category"), {"a": "x"}),
+        ],
+    )
+    def test_same_as_pd_series_map(self, X_c, mapping):
+        """Test that the output is the same as pd.Series.map with a ReturnKeyDict mapping."""
+
+        x = BaseMappingTransformMixin()
+        x.columns = ["a"]
+        x.mappings = {"a": ReturnKeyDict(mapping)}
+
+        expected = X_c.map(ReturnKeyDict(mapping))
+
+        actual = x.map_column(X_c, "a")
+
+        h.assert_series_equal_msg(
+            actual=actual,
+            expected=expected,
+            msg_tag="output from map_column",
+        )
+
+        assert [type(v) for v in actual] == [
+            type(v) for v in expected
+        ], "types of values from map_column not the same as from pd.Series.map"
+
+    def test_unique_values_looked_up_once(self):
+        """Test that each unique value is only looked up in the mapping once."""
+
+        lookups = []
+
+        class CountingDict(dict):
+            def __missing__(self, key):
+
+                lookups.append(key)
+
+                return key
+
+        X_c = pd.Series(["a", "b", "a", "b", "a", "b"])
+
+        x = BaseMappingTransformMixin()
+        x.columns = ["a"]
+        x.mappings = {"a": CountingDict()}
+
+        x.map_column(X_c, "a")
+
+        assert lookups == ["a", "b"], f"unexpected lookups {lookups}"
+
+
+class TestTransformRecord(object):
+    """Tests for BaseMappingTransformMixin.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMappingTransformMixin.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_map_record_called(self, mocker):
+        """Test that map_record is called and the mapped values set on the record."""
+
+        x = BaseMappingTransformMixin()
+        x.columns = ["a"]
+        x.mappings = {"a": ReturnKeyDict({1: 2})}
+
+        with h.assert_function_call_count(
+            mocker,
+            tubular.mapping.BaseMappingTransformMixin,
+            "map_record",
+            1,
+            return_value={"a": "x"},
+        ):
+
+            record = x.transform_record({"a": 1, "b": 1})
+
+        h.assert_equal_dispatch(
+            expected={"a": "x", "b": 1},
+            actual=record,
+            msg="transform_record output",
+        )
+
+
+class TestMapRecord(object):
+    """Tests for BaseMappingTransformMixin.map_record()."""
+
+    def test_arguments(self):
+        """Test that map_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMappingTransformMixin.map_record,
+            expected_arguments=["self", "record"],
+        )
+
+    @pytest.mark.parametrize(
+        "values, mapping",
+        [
+            (["a", None, "b", np.NaN, "a", "c"], ReturnKeyDict({"a": "x", "b": 1})),
+            ([1, 2, 3], ReturnKeyDict({1: 1.5, 2: 2.5})),
+            ([True, False], ReturnKeyDict({True: 1, False: 0})),
+            (["a", "b", "c"], {"a": 1, "b": 2}),
+        ],
+    )
+    def test_same_as_map_column(self, values, mapping):
+        """Test that each value is mapped to the same value as with map_column."""
+
+        x = BaseMappingTransformMixin()
+        x.columns = ["a"]
+        x.mappings = {"a": mapping}
+
+        expected = x.map_column(pd.Series(values), "a").tolist()
+
+        actual = [x.map_record({"a": value})["a"] for value in values]
+
+        for value, e, a in zip(values, expected, actual):
+
+            assert (e == a) or (
+                pd.isnull(e) and pd.isnull(a)
+            ), f"{value} mapped to {a} by map_record but {e} by map_column"
+
+
+class TestColumnFunctions(object):
+    """Tests for BaseMappingTransformMixin.column_functions()."""
+
+    def test_arguments(self):
+        """Test that column_functions has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMappingTransformMixin.column_functions, expected_arguments=["self"]
+        )
+
+    def test_same_as_transform(self):
+        """Test that applying the function for each column gives the same output as transform."""
+
+        df = d.create_df_1()
+
+        x = BaseMappingTransformMixin()
+        x.columns = ["a", "b"]
+        x.mappings = {"a": ReturnKeyDict({1: 5}), "b": ReturnKeyDict({"a": "z"})}
+
+        expected = x.transform(df)
+
+        for c, column_function in x.column_functions().items():
+
+            h.assert_series_equal_msg(
+                actual=column_function(df[c]),
+                expected=expected[c],
+                msg_tag=f"column function output for {c}",
+            )
@@ -5,6 +5,9 @@ import tubular.testing.helpers as h
 import tubular
 from tubular.mapping import BaseMappingTransformer
 
+import pandas as pd
+import numpy as np
+
 
 class TestInit(object):
     """Tests for BaseMappingTransformer.init()."""
@@ -176,3 +179,52 @@ class TestTransform(object):
             actual=x.mappings,
             msg="BaseMappingTransformer.transform has changed self.mappings unexpectedly",
         )
+
+
+class TestKeyPositions(object):
+    """Tests for BaseMappingTransformer.key_positions()."""
+
+    def test_arguments(self):
+        """Test that key_positions has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMappingTransformer.key_positions,
+            expected_arguments=["self", "X_c", "c"],
+        )
+
+    @pytest.mark.parametrize("dtype", ["object", "category"])
+    def test_expected_output(self, dtype):
+        """Test the keys and positions returned, with null keys and values not matched."""
+
+        X_c = pd.Series(["b", "a", np.NaN, "z", "b"], dtype=dtype)
+
+        x = BaseMappingTransformer(mappings={"c": {"a": 1, np.NaN: 2, "b": 3}})
+
+        keys, positions = x.key_positions(X_c, "c")
+
+        assert keys == ["a", "b"], f"unexpected keys {keys}"
+
+        np.testing.assert_array_equal(positions, np.array([1, 0, -1, -1, 1]))
+
+
+class TestKeyValue(object):
+    """Tests for BaseMappingTransformer.key_value()."""
+
+    def test_arguments(self):
+        """Test that key_value has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMappingTransformer.key_value,
+            expected_arguments=["self", "value", "c", "default"],
+        )
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("a", 1), ("b", 3), (np.NaN, -1), (None, -1), ("z", -1), ([1], -1)],
+    )
+    def test_expected_output(self, value, expected):
+        """Test the mapped value returned, with null keys and values not matched."""
+
+        x = BaseMappingTransformer(mappings={"c": {"a": 1, np.NaN: 2, "b": 3}})
+
+        assert x.key_value(value, "c", -1) == expected, f"unexpected value for {value}"
@@ -257,6 +257,39 @@ class TestTransform(object):
             msg_tag="expected output from cross column add transformer",
         )
 
+    def test_many_keys(self):
+        """Test the output when there are many keys in the mappings, compared to adjusting each row."""
+
+        df = pd.DataFrame(
+            {
+                "a": np.arange(20000) % 700,
+                "b": (np.arange(20000) % 900).astype("str"),
+                "c": np.linspace(0, 1, 20000),
+            }
+        )
+
+        mapping = {
+            "a": {i: 1 + i / 1000 for i in range(500)},
+            "b": {str(i): 2 + i / 1000 for i in range(500)},
+        }
+
+        x = CrossColumnAddTransformer(mappings=mapping, adjust_column="c")
+
+        df_transformed = x.transform(df)
+
+        expected = df.copy()
+
+        expected["c"] = [
+            c + mapping["a"].get(a, 0) + mapping["b"].get(b, 0)
+            for a, b, c in zip(df["a"], df["b"], df["c"])
+        ]
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="expected output from cross column add transformer",
+        )
+
     def test_mappings_unchanged(self):
         """Test that mappings is unchanged in transform."""
 
@@ -273,3 +306,53 @@ class TestTransform(object):
             actual=x.mappings,
             msg="CrossColumnAddTransformer.transform has changed self.mappings unexpectedly",
         )
+
+
+class TestTransformRecord(object):
+    """Tests for CrossColumnAddTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=CrossColumnAddTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_5()
+
+        x = CrossColumnAddTransformer(
+            mappings={"b": {"a": 1.5, "d": 2}, "c": {"c": 3, "e": -1}},
+            adjust_column="a",
+        )
+
+        h.assert_transform_record_equal(
+            x, df, "CrossColumnAddTransformer.transform_record"
+        )
+
+    def test_adjust_column_missing_error(self):
+        """Test that an exception is raised if adjust_column is not in the record."""
+
+        x = CrossColumnAddTransformer(
+            mappings={"b": {"a": 1.5, "d": 2}, "c": {"c": 3, "e": -1}},
+            adjust_column="a",
+        )
+
+        with pytest.raises(ValueError, match="variable a is not in record"):
+
+            x.transform_record({"b": "a", "c": "c"})
+
+    def test_non_numeric_error(self):
+        """Test that an exception is raised if the adjust column value is not numeric."""
+
+        x = CrossColumnAddTransformer(
+            mappings={"b": {"a": 1.5, "d": 2}, "c": {"c": 3, "e": -1}},
+            adjust_column="a",
+        )
+
+        with pytest.raises(TypeError, match="variable a must have numeric dtype."):
+
+            x.transform_record({"a": "x", "b": "a", "c": "c"})
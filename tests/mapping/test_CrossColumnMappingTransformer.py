@@ -7,6 +7,7 @@ from tubular.mapping import CrossColumnMappingTransformer
 from collections import OrderedDict
 
 import pandas as pd
+import numpy as np
 
 
 class TestInit(object):
@@ -250,6 +251,71 @@ class TestTransform(object):
             msg_tag="expected output from cross column mapping transformer",
         )
 
+    @pytest.mark.parametrize(
+        "df, expected",
+        h.index_preserved_params(d.create_df_7(), expected_df_3()),
+    )
+    def test_multiple_mappings_categorical_columns(self, df, expected):
+        """Test that mappings by categorical columns give the same output as object columns."""
+
+        mapping = OrderedDict()
+
+        mapping["a"] = {1: "aa", 2: "bb"}
+        mapping["b"] = {"x": "cc", "z": "dd", "not_a_level": "ee"}
+
+        df["b"] = df["b"].astype("category")
+        expected["b"] = expected["b"].astype("category")
+
+        x = CrossColumnMappingTransformer(mappings=mapping, adjust_column="c")
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="expected output from cross column mapping transformer",
+        )
+
+    def test_null_keys_not_matched(self):
+        """Test that null keys in mappings do not match null values, as for comparison with ==."""
+
+        df = pd.DataFrame({"a": [1.0, np.NaN, 3.0], "b": ["x", "y", "z"]})
+
+        mapping = {"a": {np.NaN: "null", 3.0: "three"}}
+
+        x = CrossColumnMappingTransformer(mappings=mapping, adjust_column="b")
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=pd.DataFrame({"a": [1.0, np.NaN, 3.0], "b": ["x", "y", "three"]}),
+            msg_tag="expected output from cross column mapping transformer",
+        )
+
+    def test_many_keys(self):
+        """Test the output when there are many keys in the mapping, compared to mapping each row."""
+
+        df = pd.DataFrame(
+            {"a": np.arange(20000) % 7000, "b": np.zeros(20000, dtype="int64")}
+        )
+
+        mapping = {"a": {i: i * 2 for i in range(5000)}}
+
+        x = CrossColumnMappingTransformer(mappings=mapping, adjust_column="b")
+
+        df_transformed = x.transform(df)
+
+        expected = pd.DataFrame(
+            {"a": df["a"], "b": [mapping["a"].get(i, 0) for i in df["a"]]}
+        )
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="expected output from cross column mapping transformer",
+        )
+
     def test_mappings_unchanged(self):
         """Test that mappings is unchanged in transform."""
 
@@ -266,3 +332,41 @@ class TestTransform(object):
             actual=x.mappings,
             msg="CrossColumnMappingTransformer.transform has changed self.mappings unexpectedly",
         )
+
+
+class TestTransformRecord(object):
+    """Tests for CrossColumnMappingTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=CrossColumnMappingTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_5()
+
+        x = CrossColumnMappingTransformer(
+            mappings=OrderedDict([("b", {"a": 1.5, "d": "z"}), ("c", {"c": 3})]),
+            adjust_column="a",
+        )
+
+        h.assert_transform_record_equal(
+            x, df, "CrossColumnMappingTransformer.transform_record"
+        )
+
+    def test_adjust_column_missing_error(self):
+        """Test that an exception is raised if adjust_column is not in the record."""
+
+        x = CrossColumnMappingTransformer(
+            mappings=OrderedDict([("b", {"a": 1.5, "d": "z"}), ("c", {"c": 3})]),
+            adjust_column="a",
+        )
+
+        with pytest.raises(ValueError, match="variable a is not in record"):
+
+            x.transform_record({"b": "a", "c": "c"})
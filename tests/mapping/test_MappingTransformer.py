@@ -242,3 +242,24 @@ class TestTransform(object):
             expected=preserve_original_value_mapping,
             msg="MappingTransformer.transform has changed self.mappings unexpectedly",
         )
+
+
+class TestTransformRecord(object):
+    """Tests for MappingTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=MappingTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_1()
+
+        x = MappingTransformer(mappings={"a": {1: 5, 2: 10}, "b": {"a": "z", "f": 1}})
+
+        h.assert_transform_record_equal(x, df, "MappingTransformer.transform_record")
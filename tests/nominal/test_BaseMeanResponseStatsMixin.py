@@ -0,0 +1,197 @@
+import pytest
+import pandas as pd
+import numpy as np
+import tubular.testing.test_data as d
+import tubular.testing.helpers as h
+
+from tubular.nominal import BaseMeanResponseStatsMixin, MeanResponseTransformer
+
+
+def create_df():
+    """Create data with a mix of column types, nulls and a null weight for the tests."""
+
+    df = pd.DataFrame(
+        {
+            "s": ["b", "a", None, "b", np.NaN, "c", "a", "b"],
+            "i": [3, 1, 2, 3, 1, 2, 2, 3],
+            "bool": [True, False, True, True, False, False, True, False],
+            "cat": pd.Categorical(
+                ["x", "y", "x", "x", "y", "y", "x", "y"], categories=["z", "y", "x"]
+            ),
+            "response": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+            "weights": [1.0, 0.5, 2.0, np.NaN, 1.0, 1.0, 3.0, 0.5],
+        }
+    )
+
+    return df
+
+
+class TestResponseAndWeights(object):
+    """Tests for BaseMeanResponseStatsMixin.response_and_weights()."""
+
+    def test_arguments(self):
+        """Test that response_and_weights has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMeanResponseStatsMixin.response_and_weights,
+            expected_arguments=["self", "X"],
+        )
+
+    @pytest.mark.parametrize("weights_column", [None, "weights"])
+    def test_output(self, weights_column):
+        """Test that the response and weights are returned as float arrays, with null weights as 0."""
+
+        df = create_df()
+
+        x = MeanResponseTransformer(
+            response_column="response", weights_column=weights_column, columns="s"
+        )
+
+        response, weights = x.response_and_weights(df)
+
+        np.testing.assert_array_equal(response, df["response"].to_numpy())
+
+        if weights_column is None:
+
+            assert weights is None, f"weights should be None but got {weights}"
+
+        else:
+
+            np.testing.assert_array_equal(
+                weights, np.array([1.0, 0.5, 2.0, 0.0, 1.0, 1.0, 3.0, 0.5])
+            )
+
+
+class TestLevelSums(object):
+    """Tests for BaseMeanResponseStatsMixin.level_sums()."""
+
+    def test_arguments(self):
+        """Test that level_sums has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMeanResponseStatsMixin.level_sums,
+            expected_arguments=["self", "X_c", "c", "response", "weights"],
+        )
+
+    @pytest.mark.parametrize("c", ["s", "i", "bool", "cat"])
+    @pytest.mark.parametrize("weights_column", [None, "weights"])
+    def test_same_as_groupby(self, c, weights_column):
+        """Test that the sums by level are the same as from pandas groupby, including excluding
+        nulls and including unused categories."""
+
+        df = create_df()
+
+        x = MeanResponseTransformer(
+            response_column="response", weights_column=weights_column, columns=c
+        )
+
+        response, weights = x.response_and_weights(df)
+
+        if weights_column is None:
+
+            expected = df.groupby([c])["response"].agg(["sum", "count"])
+
+        else:
+
+            expected = df.groupby([c])[["response", "weights"]].sum()
+
+        expected.columns = ["response_sum", "weight_sum"]
+
+        c_stats = x.level_sums(df[c], c, response, weights)
+
+        h.assert_equal_dispatch(
+            expected=expected.index.tolist(),
+            actual=c_stats.index.tolist(),
+            msg=f"levels from level_sums for {c}",
+        )
+
+        h.assert_frame_equal_msg(
+            actual=c_stats.reset_index(drop=True),
+            expected=expected.reset_index(drop=True),
+            msg_tag=f"sums from level_sums for {c}",
+            check_dtype=False,
+        )
+
+
+class TestMeanResponseByLevel(object):
+    """Tests for BaseMeanResponseStatsMixin.mean_response_by_level()."""
+
+    def test_arguments(self):
+        """Test that mean_response_by_level has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMeanResponseStatsMixin.mean_response_by_level,
+            expected_arguments=["self", "X_c", "c", "response", "weights"],
+        )
+
+    def test_unused_category_null(self):
+        """Test that the mean response is null for categories with no rows, as from groupby."""
+
+        df = create_df()
+
+        x = MeanResponseTransformer(response_column="response", columns="cat")
+
+        response, weights = x.response_and_weights(df)
+
+        mean_response = x.mean_response_by_level(df["cat"], "cat", response, weights)
+
+        h.assert_series_equal_msg(
+            actual=mean_response.reset_index(drop=True),
+            expected=df.groupby(["cat"])["response"].mean().reset_index(drop=True),
+            msg_tag="mean response by level",
+            check_names=False,
+        )
+
+
+class TestFitMeanResponse(object):
+    """Tests for BaseMeanResponseStatsMixin.fit_mean_response()."""
+
+    def test_arguments(self):
+        """Test that fit_mean_response has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseMeanResponseStatsMixin.fit_mean_response,
+            expected_arguments=["self", "X"],
+        )
+
+    def test_columns_in_output(self):
+        """Test that the mean response is returned for each column in the columns attribute."""
+
+        df = d.create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(response_column="a", columns=["b", "d", "f"])
+
+        mean_responses = x.fit_mean_response(df)
+
+        h.assert_equal_dispatch(
+            expected=["b", "d", "f"],
+            actual=list(mean_responses.keys()),
+            msg="columns in fit_mean_response output",
+        )
+
+    def test_response_column_checked(self):
+        """Test that an exception is raised if the response column is not in X."""
+
+        df = d.create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(response_column="z", columns=["b"])
+
+        with pytest.raises(ValueError, match="response z not in X"):
+
+            x.fit_mean_response(df)
+
+
+class TestRankMapping(object):
+    """Tests for BaseMeanResponseStatsMixin.rank_mapping()."""
+
+    def test_ranks(self):
+        """Test that levels are ranked by ascending mean response from 1, with ties keeping
+        their order."""
+
+        mean_response = pd.Series([0.5, 0.1, 0.5, 0.3], index=["a", "b", "c", "d"])
+
+        h.assert_equal_dispatch(
+            expected={"b": 1, "d": 2, "a": 3, "c": 4},
+            actual=BaseMeanResponseStatsMixin.rank_mapping(mean_response),
+            msg="rank_mapping output",
+        )
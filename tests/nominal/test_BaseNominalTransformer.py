@@ -6,6 +6,9 @@ import tubular
 from tubular.base import BaseTransformer
 from tubular.nominal import BaseNominalTransformer
 
+import pandas as pd
+import numpy as np
+
 
 class TestInit(object):
     """Test for BaseNominalTransformer object."""
@@ -109,3 +112,217 @@ class TestCheckMappableRows:
         ):
 
             x.check_mappable_rows(df)
+
+    def test_unmapped_levels_reported(self):
+        """Test that the levels that cannot be mapped are listed in the exception."""
+
+        df = pd.DataFrame({"a": ["x", "y", "z", "y", np.NaN]})
+
+        x = BaseNominalTransformer()
+        x.columns = ["a"]
+        x.mappings = {"a": {"x": 1}}
+
+        with pytest.raises(
+            ValueError,
+            match=r"levels not present in mapping: \['y', 'z', nan\]$",
+        ):
+
+            x.check_mappable_rows(df)
+
+
+class TestCompileMappings:
+    """Tests for the BaseNominalTransformer.compile_mappings method."""
+
+    def test_tables_compiled(self):
+        """Test the levels and values in mapping_tables_."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"x": 1.5, np.NaN: 2.5}}
+
+        levels, values = x.compile_mappings()["a"]
+
+        h.assert_equal_dispatch(
+            expected=pd.Index(["x", np.NaN]),
+            actual=levels,
+            msg="levels in mapping_tables_",
+        )
+
+        np.testing.assert_array_equal(values, np.array([1.5, 2.5]))
+
+    def test_tables_not_rebuilt_if_mappings_unchanged(self):
+        """Test that the tables are only compiled again if the mappings attribute changes."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"x": 0, "y": 1}}
+
+        tables = x.compile_mappings()
+
+        assert (
+            x.compile_mappings()["a"] is tables["a"]
+        ), "tables compiled again with unchanged mappings"
+
+        x.mappings = {"a": {"x": 0, "y": 1}}
+
+        assert (
+            x.compile_mappings()["a"] is tables["a"]
+        ), "tables compiled again with equal mappings"
+
+        x.mappings = {"a": {"x": 0, "y": 2}}
+
+        np.testing.assert_array_equal(x.compile_mappings()["a"][1], np.array([0, 2]))
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda mappings: mappings["a"].__setitem__("y", 2),
+            lambda mappings: mappings["a"].__setitem__("z", 2),
+            lambda mappings: mappings["a"].pop("x"),
+        ],
+        ids=["value changed", "level added", "level removed"],
+    )
+    def test_tables_rebuilt_if_mappings_changed_in_place(self, change):
+        """Test that changes made to the mappings attribute in place are compiled."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"x": 0, "y": 1}}
+
+        x.compile_mappings()
+
+        change(x.mappings)
+
+        levels, values = x.compile_mappings()["a"]
+
+        h.assert_equal_dispatch(
+            expected=pd.Index(list(x.mappings["a"].keys())),
+            actual=levels,
+            msg="levels in mapping_tables_",
+        )
+
+        np.testing.assert_array_equal(values, np.array(list(x.mappings["a"].values())))
+
+    def test_unhashable_mappings_always_compiled(self):
+        """Test that the tables are compiled on each call if the mapped values cannot be hashed."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"x": [0], "y": [1]}}
+
+        tables = x.compile_mappings()
+
+        assert (
+            x.compile_mappings()["a"] is not tables["a"]
+        ), "tables not compiled again with unhashable mappings"
+
+
+class TestHashMappings:
+    """Tests for the BaseNominalTransformer.hash_mappings method."""
+
+    def test_arguments(self):
+        """Test that hash_mappings has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseNominalTransformer.hash_mappings, expected_arguments=["self"]
+        )
+
+    def test_output(self):
+        """Test the number of levels and hash of items returned for each column."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"x": 0, "y": 1}, "b": {}}
+
+        h.assert_equal_dispatch(
+            expected={
+                "a": (2, hash((("x", 0), ("y", 1)))),
+                "b": (0, hash(())),
+            },
+            actual=x.hash_mappings(),
+            msg="hash_mappings output",
+        )
+
+    def test_unhashable_none(self):
+        """Test None is returned if the mappings cannot be hashed."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"x": [0]}}
+
+        assert x.hash_mappings() is None, "hash_mappings not None for unhashable values"
+
+
+class TestMapColumn:
+    """Tests for the BaseNominalTransformer.map_column method."""
+
+    @pytest.mark.parametrize(
+        "X_c",
+        [
+            pd.Series(["b", "a", np.NaN, "b"], index=[4, 3, 2, 1], name="a"),
+            pd.Series(["b", "a", np.NaN, "b"], dtype="category", name="a"),
+        ],
+    )
+    def test_same_as_pd_series_map(self, X_c):
+        """Test that the output is the same as pd.Series.map when all rows can be mapped."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"a": 1.5, "b": 2.5, np.NaN: 0.0}}
+
+        h.assert_series_equal_msg(
+            actual=x.map_column(X_c, "a"),
+            expected=X_c.map(x.mappings["a"]),
+            msg_tag="output from map_column",
+        )
+
+    def test_exception_raised(self):
+        """Test an exception is raised if rows cannot be mapped, without calling check_mappable_rows."""
+
+        x = BaseNominalTransformer()
+        x.mappings = {"a": {"a": 1}}
+
+        with pytest.raises(
+            ValueError,
+            match=r"nulls would be introduced into column a from levels not present in mapping: \['b'\]",
+        ):
+
+            x.map_column(pd.Series(["a", "b"]), "a")
+
+
+class TestMapRecord:
+    """Tests for the BaseNominalTransformer.map_record method."""
+
+    def test_arguments(self):
+        """Test that map_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=BaseNominalTransformer.map_record,
+            expected_arguments=["self", "record"],
+        )
+
+    @pytest.mark.parametrize("value", ["a", "b", np.NaN, float("nan")])
+    def test_same_as_map_column(self, value):
+        """Test that values are mapped to the same values as with map_column, including null
+        values matching a null level."""
+
+        x = BaseNominalTransformer()
+        x.columns = ["a"]
+        x.mappings = {"a": {"a": 1.5, "b": 2.5, np.NaN: 0.0}}
+
+        expected = x.map_column(pd.Series([value]), "a").iloc[0]
+
+        actual = x.map_record({"a": value})["a"]
+
+        assert (
+            actual == expected
+        ), f"{value} mapped to {actual} by map_record but {expected} by map_column"
+
+    @pytest.mark.parametrize("value", ["b", None, ["a"]])
+    def test_exception_raised(self, value):
+        """Test an exception is raised if a value cannot be mapped, including None when the
+        mapping only has a np.NaN level, as with map_column."""
+
+        x = BaseNominalTransformer()
+        x.columns = ["a"]
+        x.mappings = {"a": {"a": 1, np.NaN: 0}}
+
+        with pytest.raises(
+            ValueError,
+            match="nulls would be introduced into column a from levels not present in mapping",
+        ):
+
+            x.map_record({"a": value})
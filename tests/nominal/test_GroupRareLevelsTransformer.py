@@ -234,6 +234,106 @@ class TestFit(object):
             msg="mapping_ attribute",
         )
 
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_n_jobs_same_as_serial(self, n_jobs):
+        """Test that fitting columns in parallel gives the same mapping_ and rare_levels_record_ as fitting them one at a time."""
+
+        df = d.create_df_6()
+
+        x = GroupRareLevelsTransformer(
+            columns=["b", "c"], cut_off_percent=0.2, weight="a"
+        )
+
+        x.fit(df)
+
+        x_parallel = GroupRareLevelsTransformer(
+            columns=["b", "c"], cut_off_percent=0.2, weight="a", n_jobs=n_jobs
+        )
+
+        x_parallel.fit(df)
+
+        h.test_object_attributes(
+            obj=x_parallel,
+            expected_attributes={
+                "mapping_": x.mapping_,
+                "rare_levels_record_": x.rare_levels_record_,
+            },
+            msg="attributes after fit with n_jobs",
+        )
+
+
+class TestPartialFit(object):
+    """Tests for GroupRareLevelsTransformer.partial_fit() and GroupRareLevelsTransformer.finalize()."""
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (d.create_df_5(), {"columns": ["b", "c"], "cut_off_percent": 0.2}),
+            (
+                d.create_df_6(),
+                {"columns": ["b", "c"], "cut_off_percent": 0.2, "weight": "a"},
+            ),
+        ],
+    )
+    def test_chunks_same_as_fit(self, df, init_kwargs):
+        """Test that partial_fit on chunks of data then finalize gives the same mapping_ and rare_levels_record_ as fit."""
+
+        x = GroupRareLevelsTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_chunks = GroupRareLevelsTransformer(**init_kwargs)
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={
+                "mapping_": x.mapping_,
+                "rare_levels_record_": x.rare_levels_record_,
+            },
+            msg="attributes after finalize",
+        )
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (d.create_df_5(), {"columns": ["b", "c"], "cut_off_percent": 0.2}),
+            (
+                d.create_df_6(),
+                {"columns": ["b", "c"], "cut_off_percent": 0.2, "weight": "a"},
+            ),
+        ],
+    )
+    def test_merged_partitions_same_as_fit(self, df, init_kwargs):
+        """Test that merging the sufficient stats from partitions of the data gives the same
+        mapping_ and rare_levels_record_ as fit."""
+
+        x = GroupRareLevelsTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_1 = GroupRareLevelsTransformer(**init_kwargs)
+        x_2 = GroupRareLevelsTransformer(**init_kwargs)
+
+        x_1.partial_fit(df.iloc[:3])
+        x_2.partial_fit(df.iloc[3:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={
+                "mapping_": x.mapping_,
+                "rare_levels_record_": x.rare_levels_record_,
+            },
+            msg="attributes after merge_sufficient_stats",
+        )
+
 
 class TestTransform(object):
     """Tests for GroupRareLevelsTransformer.transform()."""
@@ -423,3 +523,36 @@ class TestTransform(object):
             expected=expected,
             msg_tag="Unexpected values in GroupRareLevelsTransformer.transform (with weights)",
         )
+
+
+class TestTransformRecord(object):
+    """Tests for GroupRareLevelsTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=GroupRareLevelsTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    @pytest.mark.parametrize(
+        "mapping",
+        [
+            {"b": ["a", np.NaN], "c": ["e", "c", "a"]},
+            {"b": ["a", None], "c": ["e", "c", "a"]},
+            {"b": ["a"], "c": ["e"]},
+        ],
+    )
+    def test_same_as_transform(self, mapping):
+        """Test that transform_record gives the same values as transform for each row, with
+        null values kept only if they match a null level."""
+
+        df = d.create_df_5()
+
+        x = GroupRareLevelsTransformer(columns=["b", "c"], cut_off_percent=0.2)
+        x.mapping_ = mapping
+
+        h.assert_transform_record_equal(
+            x, df, "GroupRareLevelsTransformer.transform_record"
+        )
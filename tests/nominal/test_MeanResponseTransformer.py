@@ -6,6 +6,9 @@ import pandas as pd
 import numpy as np
 
 import tubular
+from sklearn.base import clone
+from sklearn.exceptions import NotFittedError
+from sklearn.model_selection import KFold
 from tubular.nominal import MeanResponseTransformer
 
 
@@ -17,8 +20,16 @@ class TestInit(object):
 
         h.test_function_arguments(
             func=MeanResponseTransformer.__init__,
-            expected_arguments=["self", "response_column", "columns", "weights_column"],
-            expected_default_values=(None, None),
+            expected_arguments=[
+                "self",
+                "response_column",
+                "columns",
+                "weights_column",
+                "cv",
+                "random_state",
+                "smoothing",
+            ],
+            expected_default_values=(None, None, None, None, None),
         )
 
     def test_class_methods(self):
@@ -96,14 +107,58 @@ class TestInit(object):
     def test_values_passed_in_init_set_to_attribute(self):
         """Test that the values passed in init are saved in an attribute of the same name."""
 
-        x = MeanResponseTransformer(response_column="aaa")
+        x = MeanResponseTransformer(response_column="aaa", cv=3, random_state=1)
 
         h.test_object_attributes(
             obj=x,
-            expected_attributes={"response_column": "aaa"},
+            expected_attributes={"response_column": "aaa", "cv": 3, "random_state": 1},
             msg="Attributes for MeanResponseTransformer set in init",
         )
 
+    def test_cv_not_int_error(self):
+        """Test that an exception is raised if cv is not None or an int."""
+
+        with pytest.raises(TypeError, match="cv should be None or an int but got"):
+
+            MeanResponseTransformer(response_column="a", cv=2.0)
+
+    @pytest.mark.parametrize("smoothing", ["a", True, [1]])
+    def test_smoothing_type_error(self, smoothing):
+        """Test that an exception is raised if smoothing is not None, 'auto' or a number."""
+
+        with pytest.raises(
+            TypeError, match="smoothing should be None, 'auto' or a number but got"
+        ):
+
+            MeanResponseTransformer(response_column="a", smoothing=smoothing)
+
+    def test_smoothing_negative_error(self):
+        """Test that an exception is raised if smoothing is negative."""
+
+        with pytest.raises(
+            ValueError, match="smoothing should not be negative but got -1"
+        ):
+
+            MeanResponseTransformer(response_column="a", smoothing=-1)
+
+    def test_smoothing_auto_weights_error(self):
+        """Test that an exception is raised if smoothing is 'auto' and weights_column is set."""
+
+        with pytest.raises(
+            ValueError, match="smoothing 'auto' cannot be used with weights_column"
+        ):
+
+            MeanResponseTransformer(
+                response_column="a", weights_column="b", smoothing="auto"
+            )
+
+    def test_cv_less_than_2_error(self):
+        """Test that an exception is raised if cv is less than 2."""
+
+        with pytest.raises(ValueError, match="cv should be at least 2 but got 1"):
+
+            MeanResponseTransformer(response_column="a", cv=1)
+
 
 class TestFit(object):
     """Tests for MeanResponseTransformer.fit()"""
@@ -263,6 +318,601 @@ class TestFit(object):
 
             x.fit(df)
 
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_n_jobs_same_as_serial(self, n_jobs):
+        """Test that fitting columns in parallel gives the same mappings as fitting them one at a time."""
+
+        df = d.create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(
+            response_column="a", columns=["b", "c", "d", "f"], weights_column="e"
+        )
+
+        x.fit(df)
+
+        x_parallel = MeanResponseTransformer(
+            response_column="a",
+            columns=["b", "c", "d", "f"],
+            weights_column="e",
+            n_jobs=n_jobs,
+        )
+
+        x_parallel.fit(df)
+
+        h.test_object_attributes(
+            obj=x_parallel,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after fit with n_jobs",
+        )
+
+
+def create_out_of_fold_df():
+    """Create data with repeated levels for out-of-fold encoding tests."""
+
+    rng = np.random.default_rng(0)
+
+    df = pd.DataFrame(
+        {
+            "b": rng.choice(["a", "b", "c", "d", "e"], 60),
+            "c": pd.Categorical(
+                rng.choice(["x", "y", "z"], 60), categories=["w", "x", "y", "z"]
+            ),
+            "d": rng.integers(0, 30, 60),
+            "response": rng.random(60),
+            "weights": rng.random(60),
+        }
+    )
+
+    return df
+
+
+def expected_out_of_fold(df, columns, weights_column, folds, smoothing=None):
+    """Out-of-fold encodings from fitting a MeanResponseTransformer on the other folds."""
+
+    expected = df.copy()
+
+    expected[columns] = np.NaN
+
+    for fold in np.unique(folds):
+
+        other = df.loc[folds != fold]
+
+        x = MeanResponseTransformer(
+            response_column="response",
+            weights_column=weights_column,
+            columns=columns,
+            smoothing=smoothing,
+        ).fit(other)
+
+        if weights_column is None:
+
+            fold_prior = other["response"].mean()
+
+        else:
+
+            fold_prior = other["response"].sum() / other["weights"].sum()
+
+        for c in columns:
+
+            fold_levels = df.loc[folds == fold, c].astype(object)
+
+            expected.loc[folds == fold, c] = [
+                x.mappings[c][k] if k in set(other[c]) else fold_prior
+                for k in fold_levels
+            ]
+
+    return expected
+
+
+class TestFitTransform(object):
+    """Tests for MeanResponseTransformer.fit_transform()."""
+
+    def test_arguments(self):
+        """Test that fit_transform has expected arguments."""
+
+        h.test_function_arguments(
+            func=MeanResponseTransformer.fit_transform,
+            expected_arguments=["self", "X", "y"],
+            expected_default_values=(None,),
+        )
+
+    def test_cv_none_same_as_fit_transform(self):
+        """Test that the output is the same as fit then transform if cv is not set."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(response_column="response", columns=["b", "d"])
+
+        expected = x.fit(df).transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=MeanResponseTransformer(
+                response_column="response", columns=["b", "d"]
+            ).fit_transform(df),
+            expected=expected,
+            msg_tag="fit_transform output with cv None",
+        )
+
+    @pytest.mark.parametrize("weights_column", [None, "weights"])
+    @pytest.mark.parametrize("random_state", [None, 2])
+    def test_same_as_fit_on_other_folds(self, weights_column, random_state):
+        """Test that each row is encoded with the mean response of its level in the other
+        folds, or of all rows in the other folds if the level is only in its own fold."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(
+            response_column="response",
+            weights_column=weights_column,
+            columns=["b", "c", "d"],
+            cv=4,
+            random_state=random_state,
+        )
+
+        df_transformed = x.fit_transform(df)
+
+        expected = expected_out_of_fold(
+            df, ["b", "c", "d"], weights_column, x.fold_indices(df)
+        )
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="out-of-fold encodings",
+            check_exact=False,
+        )
+
+    @pytest.mark.parametrize(
+        "weights_column, smoothing", [(None, 3), (None, "auto"), ("weights", 0.5)]
+    )
+    def test_smoothed_same_as_fit_on_other_folds(self, weights_column, smoothing):
+        """Test that the out-of-fold encodings are smoothed towards the prior of the other folds
+        as in fit."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(
+            response_column="response",
+            weights_column=weights_column,
+            columns=["b", "c", "d"],
+            cv=4,
+            smoothing=smoothing,
+        )
+
+        df_transformed = x.fit_transform(df)
+
+        expected = expected_out_of_fold(
+            df, ["b", "c", "d"], weights_column, x.fold_indices(df), smoothing
+        )
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="smoothed out-of-fold encodings",
+            check_exact=False,
+        )
+
+    @pytest.mark.parametrize("weights_column", [None, "weights"])
+    def test_mappings_same_as_fit(self, weights_column):
+        """Test that the mappings are learnt from all rows, as in fit."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(
+            response_column="response",
+            weights_column=weights_column,
+            columns=["b", "c", "d"],
+        ).fit(df)
+
+        x_cv = MeanResponseTransformer(
+            response_column="response",
+            weights_column=weights_column,
+            columns=["b", "c", "d"],
+            cv=3,
+        )
+
+        x_cv.fit_transform(df)
+
+        h.test_object_attributes(
+            obj=x_cv,
+            expected_attributes={"mappings": x.mappings},
+            msg="mappings after fit_transform with cv",
+        )
+
+    def test_levels_only_in_own_fold(self):
+        """Test that levels only in their own fold are encoded with the mean response of the
+        other folds."""
+
+        df = d.create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(response_column="a", columns=["b"], cv=2)
+
+        df_transformed = x.fit_transform(df)
+
+        h.assert_series_equal_msg(
+            actual=df_transformed["b"],
+            expected=pd.Series([5.0, 5.0, 5.0, 2.0, 2.0, 2.0], name="b"),
+            msg_tag="encodings of levels only in own fold",
+        )
+
+    def test_input_not_modified(self):
+        """Test that X is not modified by fit_transform with cv."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(response_column="response", columns=["b"], cv=3)
+
+        x.fit_transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=create_out_of_fold_df(),
+            msg_tag="X modified by fit_transform",
+        )
+
+    def test_nulls_error(self):
+        """Test that an exception is raised for nulls, as in transform."""
+
+        df = create_out_of_fold_df()
+
+        df.loc[5, "b"] = np.NaN
+
+        x = MeanResponseTransformer(response_column="response", columns=["b"], cv=3)
+
+        with pytest.raises(
+            ValueError,
+            match="nulls would be introduced into column b from levels not present in mapping",
+        ):
+
+            x.fit_transform(df)
+
+    @pytest.mark.parametrize("random_state", [None, 5])
+    @pytest.mark.parametrize("n_rows", [60, 59, 3])
+    def test_folds_same_as_kfold(self, random_state, n_rows):
+        """Test that rows are split into folds as the test rows from sklearn KFold."""
+
+        df = create_out_of_fold_df().iloc[:n_rows]
+
+        x = MeanResponseTransformer(
+            response_column="response", cv=3, random_state=random_state
+        )
+
+        expected = np.empty(n_rows, dtype=int)
+
+        k_fold = KFold(
+            n_splits=3, shuffle=random_state is not None, random_state=random_state
+        )
+
+        for fold, (_, rows) in enumerate(k_fold.split(df)):
+
+            expected[rows] = fold
+
+        np.testing.assert_array_equal(x.fold_indices(df), expected)
+
+    def test_cv_more_than_rows_error(self):
+        """Test that an exception is raised if there are fewer rows than folds."""
+
+        df = create_out_of_fold_df().iloc[:2]
+
+        x = MeanResponseTransformer(response_column="response", cv=3)
+
+        with pytest.raises(ValueError, match="cv is 3 but X only has 2 rows"):
+
+            x.fold_indices(df)
+
+
+class TestSmoothing(object):
+    """Tests for the smoothing of MeanResponseTransformer mappings."""
+
+    @pytest.mark.parametrize("weights_column", [None, "weights"])
+    def test_m_estimate(self, weights_column):
+        """Test that the mappings are the m-estimate of the mean response."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(
+            response_column="response",
+            weights_column=weights_column,
+            columns=["b"],
+            smoothing=4,
+        )
+
+        x.fit(df)
+
+        weight = df["response"] * 0 + 1 if weights_column is None else df["weights"]
+
+        prior = df["response"].sum() / weight.sum()
+
+        level_sums = df.assign(weight=weight).groupby("b")[["response", "weight"]].sum()
+
+        expected = (level_sums["response"] + 4 * prior) / (level_sums["weight"] + 4)
+
+        h.assert_series_equal_msg(
+            actual=pd.Series(x.mappings["b"]),
+            expected=expected.rename(None).rename_axis(None),
+            msg_tag="m-estimate mappings",
+            check_exact=False,
+        )
+
+    def test_auto(self):
+        """Test that the mappings are the empirical Bayes blend of the level and prior mean
+        response, and the prior for unused categories."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(
+            response_column="response", columns=["b", "c"], smoothing="auto"
+        )
+
+        x.fit(df)
+
+        prior = df["response"].mean()
+        variance = df["response"].var(ddof=0)
+
+        for c in ["b", "c"]:
+
+            level_stats = df.groupby(c)["response"].agg(
+                mean="mean", count="count", var=lambda r: r.var(ddof=0)
+            )
+
+            blend = (
+                variance
+                * level_stats["count"]
+                / (variance * level_stats["count"] + level_stats["var"])
+            )
+
+            expected = (blend * level_stats["mean"] + (1 - blend) * prior).fillna(prior)
+
+            h.assert_series_equal_msg(
+                actual=pd.Series(x.mappings[c]),
+                expected=pd.Series(expected.to_dict()),
+                msg_tag=f"auto smoothed mappings for {c}",
+                check_exact=False,
+            )
+
+    def test_zero_same_as_none(self):
+        """Test that smoothing of 0 gives the same mappings as no smoothing."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(response_column="response", columns=["b", "d"])
+
+        x.fit(df)
+
+        x_0 = MeanResponseTransformer(
+            response_column="response", columns=["b", "d"], smoothing=0
+        )
+
+        x_0.fit(df)
+
+        h.test_object_attributes(
+            obj=x_0,
+            expected_attributes={"mappings": x.mappings},
+            msg="mappings with smoothing 0",
+        )
+
+    def test_level_stats(self):
+        """Test that the sums by level are kept in the level_stats_ attribute."""
+
+        df = d.create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(response_column="a", columns=["f"])
+
+        x.fit(df)
+
+        h.assert_equal_dispatch(
+            expected=[False, True],
+            actual=x.level_stats_["f"]["levels"].tolist(),
+            msg="levels in level_stats_",
+        )
+
+        for k, expected in [
+            ("response_sum", [6.0, 15.0]),
+            ("weight_sum", [3, 3]),
+            ("response_sq_sum", [14.0, 77.0]),
+        ]:
+
+            np.testing.assert_array_equal(x.level_stats_["f"][k], np.array(expected))
+
+
+class TestSetSmoothing(object):
+    """Tests for MeanResponseTransformer.set_smoothing()."""
+
+    def test_arguments(self):
+        """Test that set_smoothing has expected arguments."""
+
+        h.test_function_arguments(
+            func=MeanResponseTransformer.set_smoothing,
+            expected_arguments=["self", "smoothing"],
+        )
+
+    @pytest.mark.parametrize("smoothing", [None, 2, 10.5, "auto"])
+    def test_same_as_refit(self, smoothing):
+        """Test that changing the smoothing gives the same mappings as fitting with it."""
+
+        df = create_out_of_fold_df()
+
+        expected = MeanResponseTransformer(
+            response_column="response", columns=["b", "c", "d"], smoothing=smoothing
+        ).fit(df)
+
+        x = MeanResponseTransformer(
+            response_column="response", columns=["b", "c", "d"], smoothing=1
+        ).fit(df)
+
+        x_returned = x.set_smoothing(smoothing)
+
+        assert x_returned is x, "set_smoothing did not return self"
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "mappings": expected.mappings,
+                "smoothing_": smoothing,
+                "smoothing": 1,
+            },
+            msg="attributes after set_smoothing",
+        )
+
+    def test_init_params_unchanged(self):
+        """Test that get_params and clone give the smoothing passed to init after set_smoothing."""
+
+        df = create_out_of_fold_df()
+
+        x = MeanResponseTransformer(
+            response_column="response", columns=["b"], smoothing=1
+        ).fit(df)
+
+        x.set_smoothing(5)
+
+        assert (
+            x.get_params()["smoothing"] == 1
+        ), "smoothing in get_params changed by set_smoothing"
+
+        x_cloned = clone(x)
+
+        assert x_cloned.smoothing == 1, "smoothing of clone changed by set_smoothing"
+
+        x.fit(df)
+
+        assert x.smoothing_ == 1, "smoothing_ not reset to smoothing in fit"
+
+    def test_transform_uses_new_smoothing(self):
+        """Test that transform uses the mappings for the new smoothing."""
+
+        df = create_out_of_fold_df()
+
+        expected = (
+            MeanResponseTransformer(
+                response_column="response", columns=["b"], smoothing=5
+            )
+            .fit(df)
+            .transform(df)
+        )
+
+        x = MeanResponseTransformer(response_column="response", columns=["b"])
+
+        x.fit(df)
+
+        x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=x.set_smoothing(5).transform(df),
+            expected=expected,
+            msg_tag="transform after set_smoothing",
+        )
+
+    def test_not_fitted_error(self):
+        """Test that an exception is raised if the transformer is not fitted."""
+
+        x = MeanResponseTransformer(response_column="response", columns=["b"])
+
+        with pytest.raises(NotFittedError):
+
+            x.set_smoothing(2)
+
+    def test_smoothing_checked(self):
+        """Test that an exception is raised for an invalid smoothing."""
+
+        x = MeanResponseTransformer(
+            response_column="response", weights_column="weights", columns=["b"]
+        )
+
+        with pytest.raises(
+            ValueError, match="smoothing 'auto' cannot be used with weights_column"
+        ):
+
+            x.set_smoothing("auto")
+
+
+class TestPartialFit(object):
+    """Tests for MeanResponseTransformer.partial_fit() and MeanResponseTransformer.finalize()."""
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (
+                d.create_MeanResponseTransformer_test_df(),
+                {"response_column": "a", "columns": ["b", "c", "d", "f"]},
+            ),
+            (
+                d.create_MeanResponseTransformer_test_df(),
+                {
+                    "response_column": "a",
+                    "columns": ["b", "c", "d", "f"],
+                    "weights_column": "e",
+                },
+            ),
+            (
+                d.create_MeanResponseTransformer_test_df(),
+                {
+                    "response_column": "a",
+                    "columns": ["b", "c", "d", "f"],
+                    "smoothing": "auto",
+                },
+            ),
+        ],
+    )
+    def test_chunks_same_as_fit(self, df, init_kwargs):
+        """Test that partial_fit on chunks of data then finalize gives the same mappings as fit."""
+
+        x = MeanResponseTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_chunks = MeanResponseTransformer(**init_kwargs)
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after finalize",
+        )
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (
+                d.create_MeanResponseTransformer_test_df(),
+                {"response_column": "a", "columns": ["b", "c", "d", "f"]},
+            ),
+            (
+                d.create_MeanResponseTransformer_test_df(),
+                {
+                    "response_column": "a",
+                    "columns": ["b", "c", "d", "f"],
+                    "weights_column": "e",
+                },
+            ),
+        ],
+    )
+    def test_merged_partitions_same_as_fit(self, df, init_kwargs):
+        """Test that merging the sufficient stats from partitions of the data gives the same
+        mappings as fit."""
+
+        x = MeanResponseTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_1 = MeanResponseTransformer(**init_kwargs)
+        x_2 = MeanResponseTransformer(**init_kwargs)
+
+        x_1.partial_fit(df.iloc[:3])
+        x_2.partial_fit(df.iloc[3:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after merge_sufficient_stats",
+        )
+
 
 class TestTransform(object):
     """Tests for MeanResponseTransformer.transform()."""
@@ -412,3 +1062,28 @@ class TestTransform(object):
         ):
 
             x.transform(df)
+
+
+class TestTransformRecord(object):
+    """Tests for MeanResponseTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=MeanResponseTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(
+            response_column="a", columns=["b", "c", "d", "e", "f"]
+        ).fit(df)
+
+        h.assert_transform_record_equal(
+            x, df, "MeanResponseTransformer.transform_record"
+        )
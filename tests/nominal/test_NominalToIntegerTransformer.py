@@ -6,6 +6,7 @@ import tubular
 from tubular.nominal import NominalToIntegerTransformer
 
 import pandas as pd
+import numpy as np
 
 
 class TestInit(object):
@@ -192,6 +193,153 @@ class TestFit(object):
         )
 
 
+class TestPartialFit(object):
+    """Tests for NominalToIntegerTransformer.partial_fit() and NominalToIntegerTransformer.finalize()."""
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (d.create_df_1(), {"columns": ["a", "b"], "start_encoding": 1}),
+            (d.create_df_5(), {"columns": ["b", "c"]}),
+        ],
+    )
+    def test_chunks_same_as_fit(self, df, init_kwargs):
+        """Test that partial_fit on chunks of data then finalize gives the same mappings as fit."""
+
+        x = NominalToIntegerTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_chunks = NominalToIntegerTransformer(**init_kwargs)
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after finalize",
+        )
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (d.create_df_1(), {"columns": ["a", "b"], "start_encoding": 1}),
+            (d.create_df_5(), {"columns": ["b", "c"]}),
+        ],
+    )
+    def test_merged_partitions_same_as_fit(self, df, init_kwargs):
+        """Test that merging the sufficient stats from partitions of the data gives the same
+        mappings as fit."""
+
+        x = NominalToIntegerTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_1 = NominalToIntegerTransformer(**init_kwargs)
+        x_2 = NominalToIntegerTransformer(**init_kwargs)
+
+        x_1.partial_fit(df.iloc[:3])
+        x_2.partial_fit(df.iloc[3:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after merge_sufficient_stats",
+        )
+
+
+class TestCompileMappings(object):
+    """Tests for NominalToIntegerTransformer.compile_mappings()."""
+
+    def test_arguments(self):
+        """Test that compile_mappings has expected arguments."""
+
+        h.test_function_arguments(
+            func=NominalToIntegerTransformer.compile_mappings,
+            expected_arguments=["self"],
+        )
+
+    def test_tables_set_in_fit(self):
+        """Test that the mapping tables and inverse mappings are set in fit."""
+
+        df = pd.DataFrame({"a": ["x", np.NaN, "y", "x"]})
+
+        x = NominalToIntegerTransformer(columns="a", start_encoding=2)
+
+        x.fit(df)
+
+        levels, codes = x.mapping_tables_["a"]
+
+        h.assert_equal_dispatch(
+            expected=pd.Index(["x", np.NaN, "y"]),
+            actual=levels,
+            msg="levels in mapping_tables_",
+        )
+
+        np.testing.assert_array_equal(codes, np.array([2, 3, 4]))
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "inverse_mapping_": {"a": {2: "x", 3: np.NaN, 4: "y"}}
+            },
+            msg="inverse_mapping_ attribute",
+        )
+
+    def test_tables_not_rebuilt_if_mappings_unchanged(self):
+        """Test that the tables are only compiled again if the mappings attribute changes."""
+
+        x = NominalToIntegerTransformer(columns="a")
+
+        x.mappings = {"a": {"x": 0, "y": 1}}
+
+        tables = x.compile_mappings()
+
+        assert (
+            x.compile_mappings()["a"] is tables["a"]
+        ), "tables compiled again with unchanged mappings"
+
+        x.mappings = {"a": {"x": 1, "y": 0}}
+
+        np.testing.assert_array_equal(x.compile_mappings()["a"][1], np.array([1, 0]))
+
+    def test_in_place_changes_used(self):
+        """Test that changes made to the mappings attribute in place after fit are used in
+        transform, inverse_transform and inverse_mapping_."""
+
+        df = pd.DataFrame({"a": ["x", "y", "x"]})
+
+        x = NominalToIntegerTransformer(columns="a").fit(df)
+
+        x.transform(df)
+
+        x.mappings["a"]["x"] = 5
+
+        df_transformed = x.transform(df)
+
+        np.testing.assert_array_equal(
+            df_transformed["a"].to_numpy(), np.array([5, 1, 5])
+        )
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"inverse_mapping_": {"a": {5: "x", 1: "y"}}},
+            msg="inverse_mapping_ attribute",
+        )
+
+        h.assert_frame_equal_msg(
+            actual=x.inverse_transform(df_transformed),
+            expected=df,
+            msg_tag="inverse_transform after mappings changed in place",
+        )
+
+
 class TestTransform(object):
     """Tests for NominalToIntegerTransformer.transform()."""
 
@@ -314,6 +462,45 @@ class TestTransform(object):
             msg_tag="Unexpected values in NominalToIntegerTransformer.transform",
         )
 
+    def test_X_not_modified_if_error(self):
+        """Test that no columns are changed if a later column cannot be mapped, when copy is False."""
+
+        df = d.create_df_1()
+
+        x = NominalToIntegerTransformer(columns=["a", "b"], copy=False)
+
+        x.fit(df)
+
+        df["b"] = df["b"] + "z"
+
+        with pytest.raises(
+            ValueError,
+            match="nulls would be introduced into column b from levels not present in mapping",
+        ):
+
+            x.transform(df)
+
+        h.assert_equal_dispatch(
+            expected=[1, 2, 3, 4, 5, 6],
+            actual=df["a"].tolist(),
+            msg="column a after error in transform",
+        )
+
+    def test_categorical_column(self):
+        """Test that categorical columns are mapped by category, as with pd.Series.map."""
+
+        df = pd.DataFrame({"a": pd.Categorical(["x", "y", "x"])})
+
+        x = NominalToIntegerTransformer(columns="a").fit(df)
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=pd.DataFrame({"a": pd.Categorical([0, 1, 0])}),
+            msg_tag="Unexpected values in NominalToIntegerTransformer.transform",
+        )
+
 
 class TestInverseTransform(object):
     """Tests for NominalToIntegerTransformer.inverse_transform()."""
@@ -413,3 +600,127 @@ class TestInverseTransform(object):
             actual=x2.mappings,
             msg="Impute values not changed in inverse_transform",
         )
+
+    def test_non_consecutive_codes(self):
+        """Test that levels are mapped back when the codes in the mappings are not consecutive."""
+
+        df = pd.DataFrame({"a": ["x", "y", np.NaN, "x"]}, index=[3, 2, 1, 0])
+
+        x = NominalToIntegerTransformer(columns="a")
+
+        x.mappings = {"a": {"x": 10, "y": -2, np.NaN: 4}}
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=x.inverse_transform(df_transformed),
+            expected=df,
+            msg_tag="transform reverse does not get back to original",
+        )
+
+    def test_categorical_column(self):
+        """Test that categorical columns are mapped back to the original levels."""
+
+        df = pd.DataFrame({"a": pd.Categorical(["x", "y", "x"])})
+
+        x = NominalToIntegerTransformer(columns="a").fit(df)
+
+        df_transformed_back = x.inverse_transform(x.transform(df))
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed_back,
+            expected=df,
+            msg_tag="transform reverse does not get back to original",
+        )
+
+    def test_categorical_column_null_level(self):
+        """Test that a null level is decoded to null, not a category, for categorical columns."""
+
+        df = pd.DataFrame({"a": ["x", np.NaN, "y", "x"]})
+
+        x = NominalToIntegerTransformer(columns="a", start_encoding=3).fit(df)
+
+        df_transformed = x.transform(df)
+
+        df_transformed["a"] = pd.Categorical(df_transformed["a"], ordered=True)
+
+        df_transformed_back = x.inverse_transform(df_transformed)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed_back,
+            expected=pd.DataFrame(
+                {
+                    "a": pd.Categorical(
+                        ["x", np.NaN, "y", "x"], categories=["x", "y"], ordered=True
+                    )
+                }
+            ),
+            msg_tag="categorical inverse_transform with null level",
+        )
+
+    def test_categorical_column_replace_not_used(self, mocker):
+        """Test that categorical columns are not decoded with pd.Series.replace."""
+
+        df = pd.DataFrame({"a": pd.Categorical(["x", "y", "x"])})
+
+        x = NominalToIntegerTransformer(columns="a").fit(df)
+
+        df_transformed = x.transform(df)
+
+        spy = mocker.spy(pd.Series, "replace")
+
+        x.inverse_transform(df_transformed)
+
+        assert spy.call_count == 0, "pd.Series.replace called in inverse_transform"
+
+
+class TestTransformRecord(object):
+    """Tests for NominalToIntegerTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=NominalToIntegerTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_1()
+
+        x = NominalToIntegerTransformer(columns=["a", "b"], start_encoding=1).fit(df)
+
+        h.assert_transform_record_equal(
+            x, df, "NominalToIntegerTransformer.transform_record"
+        )
+
+    def test_mappings_updated(self):
+        """Test that changes to the mappings attribute after fit are used."""
+
+        df = d.create_df_1()
+
+        x = NominalToIntegerTransformer(columns=["a", "b"]).fit(df)
+
+        x.transform_record({"a": 1, "b": "a"})
+
+        x.mappings["a"][1] = 100
+
+        assert (
+            x.transform_record({"a": 1, "b": "a"})["a"] == 100
+        ), "changes to mappings not used in transform_record"
+
+    def test_unmapped_level_error(self):
+        """Test that an exception is raised if a level is not in the mapping."""
+
+        df = d.create_df_1()
+
+        x = NominalToIntegerTransformer(columns=["a", "b"]).fit(df)
+
+        with pytest.raises(
+            ValueError,
+            match=r"nulls would be introduced into column b from levels not present in mapping: \['z'\]",
+        ):
+
+            x.transform_record({"a": 1, "b": "z"})
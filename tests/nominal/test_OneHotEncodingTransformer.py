@@ -3,6 +3,7 @@ import tubular.testing.test_data as d
 import tubular.testing.helpers as h
 
 import pandas as pd
+import numpy as np
 import sklearn
 
 import tubular
@@ -24,8 +25,10 @@ class TestInit(object):
                 "drop_original",
                 "copy",
                 "verbose",
+                "output",
+                "max_levels",
             ],
-            expected_default_values=(None, "_", False, True, False),
+            expected_default_values=(None, "_", False, True, False, "dense", 100),
         )
 
     def test_class_methods(self):
@@ -114,6 +117,46 @@ class TestInit(object):
             call_pos_args[0] is x
         ), f"Unexpected positional arg (self) in OneHotEncoder.__init__ call -\n  Expected: self\n  Actual: {call_pos_args[0]}"
 
+    def test_one_hot_encoder_init_sparse_output(self, mocker):
+        """Test that OneHotEncoder.init is called with sparse True if output is sparse."""
+
+        mocker.patch("sklearn.preprocessing.OneHotEncoder.__init__")
+
+        OneHotEncodingTransformer(output="sparse")
+
+        h.assert_equal_dispatch(
+            expected={"sparse": True, "handle_unknown": "ignore"},
+            actual=sklearn.preprocessing.OneHotEncoder.__init__.call_args_list[0][1],
+            msg="kwargs for OneHotEncoder.__init__ in OneHotEncodingTransformer.init",
+        )
+
+    def test_output_value_error(self):
+        """Test that an exception is raised if output is not dense or sparse."""
+
+        with pytest.raises(
+            ValueError, match="output should be 'dense' or 'sparse' but got csc"
+        ):
+
+            OneHotEncodingTransformer(output="csc")
+
+    def test_max_levels_type_error(self):
+        """Test that an exception is raised if max_levels is not None or an int."""
+
+        with pytest.raises(
+            TypeError, match="max_levels should be None or an int but got"
+        ):
+
+            OneHotEncodingTransformer(max_levels=10.0)
+
+    def test_max_levels_value_error(self):
+        """Test that an exception is raised if max_levels is not greater than 0."""
+
+        with pytest.raises(
+            ValueError, match="max_levels should be greater than 0 but got 0"
+        ):
+
+            OneHotEncodingTransformer(max_levels=0)
+
     def test_values_passed_in_init_set_to_attribute(self):
         """Test that the values passed in init are saved in an attribute of the same name."""
 
@@ -123,7 +166,12 @@ class TestInit(object):
 
         h.test_object_attributes(
             obj=x,
-            expected_attributes={"separator": "x", "drop_original": True},
+            expected_attributes={
+                "separator": "x",
+                "drop_original": True,
+                "output": "dense",
+                "max_levels": 100,
+            },
             msg="Attributes for OneHotEncodingTransformer set in init",
         )
 
@@ -202,7 +250,8 @@ class TestFit(object):
 
         x = OneHotEncodingTransformer(columns="b")
 
-        mocker.patch("sklearn.preprocessing.OneHotEncoder.fit")
+        # spy rather than patch as fit uses the categories_ learnt by OneHotEncoder.fit
+        mocker.spy(sklearn.preprocessing.OneHotEncoder, "fit")
 
         x.fit(df)
 
@@ -256,6 +305,48 @@ class TestFit(object):
 
             x.fit(df)
 
+    def test_fields_with_over_max_levels_error(self):
+        """Test that fit raises an error for fields with more levels than max_levels."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], max_levels=2)
+
+        with pytest.raises(
+            ValueError,
+            match="column b has over 2 unique values - consider another type of encoding",
+        ):
+
+            x.fit(df)
+
+    def test_max_levels_none_no_limit(self):
+        """Test that fields with more than 100 levels can be fit if max_levels is None."""
+
+        df = pd.DataFrame({"a": [f"level_{i}" for i in range(150)]})
+
+        x = OneHotEncodingTransformer(columns="a", output="sparse", max_levels=None)
+
+        x.fit(df)
+
+        assert len(x.categories_[0]) == 150, "unexpected number of categories"
+
+    def test_dummy_columns_set(self):
+        """Test that the names of the dummy columns are set in fit."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], separator="|")
+
+        x.fit(df)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "dummy_columns_": ["b|x", "b|y", "b|z", "c|a", "c|b", "c|c"]
+            },
+            msg="dummy_columns_ attribute",
+        )
+
     def test_fit_returns_self(self):
         """Test fit returns self?"""
 
@@ -551,6 +642,32 @@ class TestTransform(object):
             msg="renaming columns feature in OneHotEncodingTransformer.transform",
         )
 
+    def test_names_not_recomputed(self, mocker):
+        """Test that transform uses the dummy column names from fit rather than building and
+        renaming the names from OneHotEncoder."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], separator="|").fit(df)
+
+        x.dummy_columns_ = ["d1", "d2", "d3", "d4", "d5", "d6"]
+
+        get_feature_names_spy = mocker.spy(
+            sklearn.preprocessing.OneHotEncoder, "get_feature_names"
+        )
+
+        df_transformed = x.transform(df)
+
+        assert (
+            get_feature_names_spy.call_count == 0
+        ), "get_feature_names called in transform"
+
+        h.assert_equal_dispatch(
+            expected=["a", "b", "c", "d1", "d2", "d3", "d4", "d5", "d6"],
+            actual=list(df_transformed.columns.values),
+            msg="columns output from transform",
+        )
+
     def test_warning_generated_by_unseen_categories(self):
         """Test OneHotEncodingTransformer.transform triggers a warning for unseen categories."""
 
@@ -621,3 +738,196 @@ class TestTransform(object):
             actual=list(set(["a", "b", "c"]) - set(df_transformed.columns)),
             msg="original columns not kept",
         )
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.uint8, bool])
+    def test_sparse_output(self, dtype):
+        """Test that the dummy columns have pd.SparseDtype and the same values as the dense output,
+        when output is sparse."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], dtype=dtype).fit(df)
+
+        x_sparse = OneHotEncodingTransformer(
+            columns=["b", "c"], output="sparse", dtype=dtype
+        ).fit(df)
+
+        df_transformed = x_sparse.transform(df)
+
+        dummy_columns = x.dummy_column_names()
+
+        for c in dummy_columns:
+
+            assert df_transformed[c].dtype == pd.SparseDtype(
+                dtype, 0
+            ), f"unexpected dtype for column {c} - {df_transformed[c].dtype}"
+
+        df_transformed[dummy_columns] = df_transformed[dummy_columns].sparse.to_dense()
+
+        h.assert_frame_equal_msg(
+            expected=x.transform(df),
+            actual=df_transformed,
+            msg_tag="values in sparse output",
+        )
+
+    @pytest.mark.parametrize("dtype", [np.uint8, bool])
+    def test_compact_dense_output(self, dtype):
+        """Test that the dummy columns have the dtype passed to OneHotEncoder."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns="b", dtype=dtype).fit(df)
+
+        df_transformed = x.transform(df)
+
+        expected = TestTransform.expected_df_1()
+
+        expected[["b_x", "b_y", "b_z"]] = expected[["b_x", "b_y", "b_z"]].astype(dtype)
+
+        h.assert_frame_equal_msg(
+            expected=expected,
+            actual=df_transformed,
+            msg_tag="compact dense output",
+        )
+
+
+class TestTransformCsr(object):
+    """Tests for OneHotEncodingTransformer.transform_csr()."""
+
+    @pytest.mark.parametrize("output", ["dense", "sparse"])
+    def test_same_values_as_transform(self, output):
+        """Test that the CSR matrix has the same values as the dummy columns from transform."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], output=output).fit(df)
+
+        X_dummies = x.transform_csr(df)
+
+        assert X_dummies.format == "csr", f"unexpected format {X_dummies.format}"
+
+        expected = (
+            OneHotEncodingTransformer(columns=["b", "c"])
+            .fit(df)
+            .transform(df)[x.dummy_column_names()]
+        )
+
+        np.testing.assert_array_equal(X_dummies.toarray(), expected.to_numpy())
+
+    def test_nulls_in_X_error(self):
+        """Test that an exception is raised if X has nulls in the columns to encode."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns="b").fit(df)
+
+        df.loc[0, "b"] = np.NaN
+
+        with pytest.raises(
+            ValueError, match="column b has nulls - replace before proceeding"
+        ):
+
+            x.transform_csr(df)
+
+    def test_dense_dummies_not_created(self, mocker):
+        """Test that the matrix is not built from the dense output of OneHotEncoder.transform."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], output="dense").fit(df)
+
+        spy = mocker.spy(sklearn.preprocessing.OneHotEncoder, "transform")
+
+        x.transform_csr(df)
+
+        assert spy.call_count == 0, "OneHotEncoder.transform called in transform_csr"
+
+    def test_unseen_levels_and_categorical(self):
+        """Test that unseen levels have no non-zero values and categorical columns are encoded
+        by category, with the same values as transform."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"]).fit(df)
+
+        df_new = df.copy()
+        df_new.loc[0, "b"] = "unseen"
+        df_new["c"] = df_new["c"].astype("category")
+
+        X_dummies = x.transform_csr(df_new)
+
+        assert X_dummies.has_sorted_indices, "indices not sorted within rows"
+
+        assert X_dummies.dtype == x.dtype, f"unexpected dtype {X_dummies.dtype}"
+
+        expected = x.transform(df_new)[x.dummy_column_names()]
+
+        np.testing.assert_array_equal(X_dummies.toarray(), expected.to_numpy())
+
+        assert X_dummies[0].nnz == 1, "unseen level in first row has non-zero value"
+
+
+class TestDummyColumnNames(object):
+    """Tests for OneHotEncodingTransformer.dummy_column_names()."""
+
+    def test_names_use_separator(self):
+        """Test that the names are built from the columns, separator and levels."""
+
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], separator="|").fit(df)
+
+        h.assert_equal_dispatch(
+            expected=["b|x", "b|y", "b|z", "c|a", "c|b", "c|c"],
+            actual=x.dummy_column_names(),
+            msg="dummy column names",
+        )
+
+
+class TestTransformRecord(object):
+    """Tests for OneHotEncodingTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=OneHotEncodingTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    @pytest.mark.parametrize("drop_original", [True, False])
+    @pytest.mark.parametrize("output", ["dense", "sparse"])
+    @pytest.mark.parametrize("dtype", [np.int8, np.float64])
+    def test_same_as_transform(self, drop_original, output, dtype):
+        """Test that transform_record gives the same values as transform for each row,
+        including unseen levels."""
+
+        x = OneHotEncodingTransformer(
+            columns=["b", "c"], drop_original=drop_original, output=output, dtype=dtype
+        ).fit(d.create_df_7())
+
+        h.assert_transform_record_equal(
+            x, d.create_df_8(), "OneHotEncodingTransformer.transform_record"
+        )
+
+    def test_nulls_error(self):
+        """Test that an exception is raised if a value is null."""
+
+        x = OneHotEncodingTransformer(columns=["b", "c"]).fit(d.create_df_7())
+
+        with pytest.raises(
+            ValueError, match="column c has nulls - replace before proceeding"
+        ):
+
+            x.transform_record({"a": 1, "b": "x", "c": None})
+
+    def test_warning_generated_by_unseen_categories(self):
+        """Test that a warning is generated for unseen categories if verbose is True."""
+
+        x = OneHotEncodingTransformer(columns=["b", "c"], verbose=True).fit(
+            d.create_df_7()
+        )
+
+        with pytest.warns(Warning, match="column b has unseen categories"):
+
+            x.transform_record({"a": 1, "b": "unseen", "c": "a"})
@@ -263,6 +263,109 @@ class TestFit(object):
 
             x.fit(df)
 
+    @pytest.mark.parametrize("n_jobs", [2, -1])
+    def test_n_jobs_same_as_serial(self, n_jobs):
+        """Test that fitting columns in parallel gives the same mappings as fitting them one at a time."""
+
+        df = d.create_OrdinalEncoderTransformer_test_df()
+
+        x = OrdinalEncoderTransformer(response_column="a", columns=["b", "c", "d", "f"])
+
+        x.fit(df)
+
+        x_parallel = OrdinalEncoderTransformer(
+            response_column="a", columns=["b", "c", "d", "f"], n_jobs=n_jobs
+        )
+
+        x_parallel.fit(df)
+
+        h.test_object_attributes(
+            obj=x_parallel,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after fit with n_jobs",
+        )
+
+
+class TestPartialFit(object):
+    """Tests for OrdinalEncoderTransformer.partial_fit() and OrdinalEncoderTransformer.finalize()."""
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (
+                d.create_OrdinalEncoderTransformer_test_df(),
+                {"response_column": "a", "columns": ["b", "c", "d", "f"]},
+            ),
+            (
+                d.create_OrdinalEncoderTransformer_test_df(),
+                {
+                    "response_column": "a",
+                    "columns": ["b", "c", "d", "f"],
+                    "weights_column": "e",
+                },
+            ),
+        ],
+    )
+    def test_chunks_same_as_fit(self, df, init_kwargs):
+        """Test that partial_fit on chunks of data then finalize gives the same mappings as fit."""
+
+        x = OrdinalEncoderTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_chunks = OrdinalEncoderTransformer(**init_kwargs)
+
+        for chunk in [df.iloc[:2], df.iloc[2:5], df.iloc[5:]]:
+
+            x_chunks.partial_fit(chunk)
+
+        x_chunks.finalize()
+
+        h.test_object_attributes(
+            obj=x_chunks,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after finalize",
+        )
+
+    @pytest.mark.parametrize(
+        "df, init_kwargs",
+        [
+            (
+                d.create_OrdinalEncoderTransformer_test_df(),
+                {"response_column": "a", "columns": ["b", "c", "d", "f"]},
+            ),
+            (
+                d.create_OrdinalEncoderTransformer_test_df(),
+                {
+                    "response_column": "a",
+                    "columns": ["b", "c", "d", "f"],
+                    "weights_column": "e",
+                },
+            ),
+        ],
+    )
+    def test_merged_partitions_same_as_fit(self, df, init_kwargs):
+        """Test that merging the sufficient stats from partitions of the data gives the same
+        mappings as fit."""
+
+        x = OrdinalEncoderTransformer(**init_kwargs)
+
+        x.fit(df)
+
+        x_1 = OrdinalEncoderTransformer(**init_kwargs)
+        x_2 = OrdinalEncoderTransformer(**init_kwargs)
+
+        x_1.partial_fit(df.iloc[:3])
+        x_2.partial_fit(df.iloc[3:])
+
+        x_1.merge_sufficient_stats(x_2).finalize()
+
+        h.test_object_attributes(
+            obj=x_1,
+            expected_attributes={"mappings": x.mappings},
+            msg="attributes after merge_sufficient_stats",
+        )
+
 
 class TestTransform(object):
     """Tests for OrdinalEncoderTransformer.transform()."""
@@ -292,8 +395,8 @@ class TestTransform(object):
             func=OrdinalEncoderTransformer.transform, expected_arguments=["self", "X"]
         )
 
-    def test_check_is_fitted_called(self, mocker):
-        """Test that BaseTransformer check_mappable_rows called."""
+    def test_map_column_called(self, mocker):
+        """Test that BaseNominalTransformer map_column called, which checks rows are mappable."""
 
         df = d.create_OrdinalEncoderTransformer_test_df()
 
@@ -301,16 +404,17 @@ class TestTransform(object):
 
         x.fit(df)
 
-        expected_call_args = {0: {"args": (df,), "kwargs": {}}}
+        spy = mocker.spy(tubular.nominal.BaseNominalTransformer, "map_column")
 
-        with h.assert_function_call(
-            mocker,
-            tubular.nominal.BaseNominalTransformer,
-            "check_mappable_rows",
-            expected_call_args,
-        ):
+        x.transform(df)
 
-            x.transform(df)
+        assert spy.call_count == 1, "unexpected number of calls to map_column"
+
+        h.assert_series_equal_msg(
+            actual=spy.call_args_list[0][0][1],
+            expected=df["b"],
+            msg_tag="column passed to map_column",
+        )
 
     def test_super_transform_called(self, mocker):
         """Test that BaseMappingTransformMixin.transform called."""
@@ -408,3 +512,28 @@ class TestTransform(object):
         ):
 
             x.transform(df)
+
+
+class TestTransformRecord(object):
+    """Tests for OrdinalEncoderTransformer.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=OrdinalEncoderTransformer.transform_record,
+            expected_arguments=["self", "record"],
+        )
+
+    def test_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_OrdinalEncoderTransformer_test_df()
+
+        x = OrdinalEncoderTransformer(
+            response_column="a", columns=["b", "c", "d", "e", "f"]
+        ).fit(df)
+
+        h.assert_transform_record_equal(
+            x, df, "OrdinalEncoderTransformer.transform_record"
+        )
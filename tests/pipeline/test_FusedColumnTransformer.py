@@ -0,0 +1,298 @@
+import pytest
+import numpy as np
+import tubular.testing.test_data as d
+import tubular.testing.helpers as h
+
+import tubular
+from sklearn.exceptions import NotFittedError
+from tubular.pipeline import FusedColumnTransformer
+from tubular.imputers import MeanImputer, NullIndicator, ArbitraryImputer
+from tubular.capping import CappingTransformer
+from tubular.mapping import MappingTransformer
+
+
+def create_transformers():
+    """Create list of transformers for FusedColumnTransformer tests."""
+
+    transformers = [
+        ("impute", MeanImputer(columns="a")),
+        ("cap", CappingTransformer(capping_values={"a": [2, 5]})),
+        ("impute_b", ArbitraryImputer(impute_value="z", columns=["b", "c"])),
+        ("map", MappingTransformer(mappings={"c": {"a": "x", "b": "y"}})),
+    ]
+
+    return transformers
+
+
+def apply_in_turn(transformers, df):
+    """Fit then transform df with each transformer in turn."""
+
+    for _, transformer in transformers:
+
+        df = transformer.fit_transform(df)
+
+    return df
+
+
+class TestInit(object):
+    """Tests for FusedColumnTransformer.init()."""
+
+    def test_arguments(self):
+        """Test that init has expected arguments."""
+
+        h.test_function_arguments(
+            func=FusedColumnTransformer.__init__,
+            expected_arguments=["self", "transformers"],
+        )
+
+    def test_inheritance(self):
+        """Test that FusedColumnTransformer inherits from BaseTransformer."""
+
+        x = FusedColumnTransformer(create_transformers())
+
+        h.assert_inheritance(x, tubular.base.BaseTransformer)
+
+    def test_values_passed_in_init_set_to_attribute(self):
+        """Test that transformers is set and columns is the union of the transformers' columns."""
+
+        transformers = create_transformers()
+
+        x = FusedColumnTransformer(transformers)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "transformers": transformers,
+                "columns": ["a", "b", "c"],
+            },
+            msg="Attributes for FusedColumnTransformer set in init",
+        )
+
+    @pytest.mark.parametrize("transformers", [[], ("impute", MeanImputer())])
+    def test_transformers_not_non_empty_list_error(self, transformers):
+        """Test an error is raised if transformers is not a non-empty list."""
+
+        with pytest.raises(ValueError, match="transformers should be a non-empty list"):
+
+            FusedColumnTransformer(transformers)
+
+    @pytest.mark.parametrize(
+        "step", [MeanImputer(columns="a"), ("impute", "a"), ("a", "b", "c")]
+    )
+    def test_step_not_named_transformer_error(self, step):
+        """Test an error is raised if an item in transformers is not a (name, transformer) tuple."""
+
+        with pytest.raises(
+            TypeError,
+            match="each item in transformers should be a \\(name, transformer\\) tuple with a tubular transformer",
+        ):
+
+            FusedColumnTransformer([step])
+
+    def test_columns_not_set_error(self):
+        """Test an error is raised if a transformer does not have columns set."""
+
+        with pytest.raises(ValueError, match="columns not set for transformer impute"):
+
+            FusedColumnTransformer([("impute", MeanImputer())])
+
+
+class TestFit(object):
+    """Tests for FusedColumnTransformer.fit()."""
+
+    def test_fit_returns_self(self):
+        """Test fit returns self."""
+
+        df = d.create_df_2()
+
+        x = FusedColumnTransformer(create_transformers())
+
+        assert x.fit(df) is x, "Returned value from fit not as expected."
+
+    def test_fitted_same_as_in_turn(self):
+        """Test that each transformer is fit on the output of the transformers before it."""
+
+        df = d.create_df_2()
+
+        expected = create_transformers()
+
+        apply_in_turn(expected, df)
+
+        x = FusedColumnTransformer(create_transformers())
+
+        x.fit(df)
+
+        h.assert_equal_dispatch(
+            expected=expected[0][1].impute_values_,
+            actual=x.transformers[0][1].impute_values_,
+            msg="impute_values_ of first transformer",
+        )
+
+        h.assert_equal_dispatch(
+            expected=expected[1][1].capping_values,
+            actual=x.transformers[1][1].capping_values,
+            msg="capping_values of second transformer",
+        )
+
+    def test_fit_input_not_modified(self):
+        """Test that X is not modified by fit."""
+
+        df = d.create_df_2()
+
+        x = FusedColumnTransformer(create_transformers())
+
+        x.fit(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_2(),
+            msg_tag="X modified in FusedColumnTransformer.fit",
+        )
+
+
+class TestStepColumnFunctions(object):
+    """Tests for FusedColumnTransformer.step_column_functions()."""
+
+    def test_functions_for_each_step(self):
+        """Test that the column functions of each transformer are returned in order."""
+
+        df = d.create_df_2()
+
+        transformers = create_transformers()
+
+        x = FusedColumnTransformer(transformers)
+
+        x.fit(df)
+
+        step_column_functions = x.step_column_functions()
+
+        h.assert_equal_dispatch(
+            expected=[
+                (name, transformer, sorted(transformer.columns))
+                for name, transformer in transformers
+            ],
+            actual=[
+                (name, transformer, sorted(column_functions.keys()))
+                for name, transformer, column_functions in step_column_functions
+            ],
+            msg="column functions for each step",
+        )
+
+
+class TestColumnFunctionChains(object):
+    """Tests for FusedColumnTransformer.column_function_chains()."""
+
+    def test_functions_in_order(self):
+        """Test that each column has a function from each transformer that uses it."""
+
+        df = d.create_df_2()
+
+        x = FusedColumnTransformer(create_transformers())
+
+        x.fit(df)
+
+        column_function_chains = x.column_function_chains()
+
+        h.assert_equal_dispatch(
+            expected={"a": 2, "b": 1, "c": 2},
+            actual={c: len(chain) for c, chain in column_function_chains.items()},
+            msg="number of functions for each column",
+        )
+
+    def test_not_fusable_error(self):
+        """Test an error is raised if a transformer does not implement column_functions."""
+
+        x = FusedColumnTransformer(
+            [
+                ("impute", MeanImputer(columns="a")),
+                ("nulls", NullIndicator(columns="a")),
+            ]
+        )
+
+        x.fit(d.create_df_2())
+
+        with pytest.raises(
+            TypeError,
+            match="transformer nulls \\(NullIndicator\\) does not implement column_functions so cannot be fused",
+        ):
+
+            x.column_function_chains()
+
+
+class TestTransform(object):
+    """Tests for FusedColumnTransformer.transform()."""
+
+    def test_output_same_as_in_turn(self):
+        """Test that the output is the same as applying each transformer in turn."""
+
+        transformers = create_transformers()
+
+        expected = apply_in_turn(transformers, d.create_df_2())
+
+        x = FusedColumnTransformer(transformers)
+
+        h.assert_frame_equal_msg(
+            actual=x.transform(d.create_df_2()),
+            expected=expected,
+            msg_tag="FusedColumnTransformer.transform output",
+        )
+
+    def test_input_not_modified(self):
+        """Test that X is not modified by transform when copy is True."""
+
+        df = d.create_df_2()
+
+        x = FusedColumnTransformer(create_transformers())
+
+        x.fit(df)
+
+        x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_2(),
+            msg_tag="X modified in FusedColumnTransformer.transform",
+        )
+
+    def test_not_fitted_error(self):
+        """Test an error is raised if the transformers are not fitted."""
+
+        x = FusedColumnTransformer(create_transformers())
+
+        with pytest.raises(NotFittedError):
+
+            x.transform(d.create_df_2())
+
+
+class TestTransformRecord(object):
+    """Tests for FusedColumnTransformer.transform_record()."""
+
+    def test_output_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_2()
+
+        x = FusedColumnTransformer(create_transformers())
+
+        x.fit(df)
+
+        h.assert_transform_record_equal(
+            x, df, "FusedColumnTransformer.transform_record"
+        )
+
+    def test_record_not_modified(self):
+        """Test that the input record is not modified when copy is True."""
+
+        df = d.create_df_2()
+
+        x = FusedColumnTransformer(create_transformers())
+
+        x.fit(df)
+
+        record = {"a": np.NaN, "b": "a", "c": np.NaN}
+
+        x.transform_record(record)
+
+        assert np.isnan(record["a"]) and np.isnan(
+            record["c"]
+        ), "input record modified by transform_record"
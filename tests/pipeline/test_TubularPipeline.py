@@ -0,0 +1,673 @@
+import pytest
+import re
+import pandas as pd
+import numpy as np
+import tubular.testing.test_data as d
+import tubular.testing.helpers as h
+from sklearn.pipeline import Pipeline, FeatureUnion
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import FunctionTransformer
+
+import tubular
+from tubular.pipeline import TubularPipeline, FusedColumnTransformer
+from tubular.imputers import MeanImputer, NullIndicator, ArbitraryImputer
+from tubular.capping import CappingTransformer
+from tubular.mapping import MappingTransformer
+
+
+def create_steps():
+    """Create list of steps for TubularPipeline tests."""
+
+    steps = [
+        ("nulls", NullIndicator(columns=["a", "b"])),
+        ("impute", MeanImputer(columns="a")),
+        ("cap", CappingTransformer(capping_values={"a": [2, 5]})),
+        ("map", MappingTransformer(mappings={"c": {"a": "x", "b": "y"}})),
+    ]
+
+    return steps
+
+
+class TestInit(object):
+    """Tests for TubularPipeline.init()."""
+
+    def test_arguments(self):
+        """Test that init has expected arguments."""
+
+        h.test_function_arguments(
+            func=TubularPipeline.__init__,
+            expected_arguments=["self", "steps", "memory", "verbose", "copy"],
+            expected_default_values=(None, False, True),
+        )
+
+    def test_inheritance(self):
+        """Test that TubularPipeline inherits from sklearn Pipeline."""
+
+        x = TubularPipeline(create_steps())
+
+        h.assert_inheritance(x, Pipeline)
+
+    def test_copy_non_bool_error(self):
+        """Test an error is raised if copy is not specified as a bool."""
+
+        with pytest.raises(ValueError, match="copy must be a bool"):
+
+            TubularPipeline(create_steps(), copy=1)
+
+    def test_values_passed_in_init_set_to_attribute(self):
+        """Test that the values passed in init are saved in attributes of the same name."""
+
+        steps = create_steps()
+
+        x = TubularPipeline(steps, copy=False)
+
+        h.test_object_attributes(
+            obj=x,
+            expected_attributes={"steps": steps, "copy": False},
+            msg="Attributes for TubularPipeline set in init",
+        )
+
+
+class TestTransform(object):
+    """Tests for TubularPipeline.transform()."""
+
+    def test_output_same_as_sklearn_pipeline(self):
+        """Test that the output is the same as the equivalent sklearn Pipeline."""
+
+        df = d.create_df_2()
+
+        expected = Pipeline(create_steps()).fit(df).transform(df)
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="TubularPipeline.transform output different to sklearn Pipeline",
+        )
+
+    def test_input_not_modified(self):
+        """Test that X is not modified by transform."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_2(),
+            msg_tag="X modified in TubularPipeline.transform",
+        )
+
+    def test_df_copied_once(self, mocker):
+        """Test that pd.DataFrame.copy is called only once, not once per step."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        spy = mocker.spy(pd.DataFrame, "copy")
+
+        x.transform(df)
+
+        assert (
+            spy.call_count == 1
+        ), f"Unexpected number of calls to pd.DataFrame.copy -\n  Expected: 1\n  Actual: {spy.call_count}"
+
+    def test_no_copy_when_copy_false(self, mocker):
+        """Test that pd.DataFrame.copy is not called if copy is False, and X is modified in place."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline([("impute", MeanImputer(columns="a"))], copy=False)
+
+        x.fit(df)
+
+        spy = mocker.spy(pd.DataFrame, "copy")
+
+        df_transformed = x.transform(df)
+
+        assert (
+            spy.call_count == 0
+        ), f"Unexpected number of calls to pd.DataFrame.copy -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+        assert df_transformed is df, "X not modified in place when copy is False"
+
+    def test_steps_copy_after_pipeline_transform(self, mocker):
+        """Test that steps copy X again when called outside of the pipeline."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        x.transform(df)
+
+        expected_call_args = {0: {"args": (), "kwargs": {}}}
+
+        with h.assert_function_call(
+            mocker, pd.DataFrame, "copy", expected_call_args, return_value=df
+        ):
+
+            x.steps[1][1].transform(df)
+
+    @pytest.mark.parametrize("method", ["transform", "fit_transform"])
+    def test_feature_union_branches_copy(self, method):
+        """Test that tubular transformers in the branches of a FeatureUnion step still copy X, so
+        branches using the same columns each transform the data passed to the step."""
+
+        df = pd.DataFrame({"a": [1, np.NaN, 3]})
+
+        def create_union():
+
+            return FeatureUnion(
+                [
+                    ("i", ArbitraryImputer(impute_value=0, columns=["a"])),
+                    ("j", ArbitraryImputer(impute_value=99, columns=["a"])),
+                ]
+            )
+
+        x = TubularPipeline([("union", create_union())])
+
+        expected = Pipeline([("union", create_union())]).fit_transform(df)
+
+        if method == "transform":
+
+            x.fit(df)
+
+        np.testing.assert_array_equal(
+            getattr(x, method)(df), expected, err_msg="FeatureUnion step output"
+        )
+
+        np.testing.assert_array_equal(
+            expected, np.array([[1, 1], [0, 99], [3, 3]]), err_msg="expected output"
+        )
+
+    def test_nested_feature_union_branches_copy(self):
+        """Test that tubular transformers in a FeatureUnion nested within a Pipeline step still
+        copy X, after a tubular step that does not."""
+
+        df = pd.DataFrame({"a": [1, np.NaN, 3], "b": [np.NaN, 2, 3]})
+
+        x = TubularPipeline(
+            [
+                ("impute_b", ArbitraryImputer(impute_value=-1, columns=["b"])),
+                (
+                    "nested",
+                    Pipeline(
+                        [
+                            (
+                                "union",
+                                FeatureUnion(
+                                    [
+                                        (
+                                            "i",
+                                            ArbitraryImputer(
+                                                impute_value=0, columns=["a"]
+                                            ),
+                                        ),
+                                        (
+                                            "j",
+                                            ArbitraryImputer(
+                                                impute_value=99, columns=["a"]
+                                            ),
+                                        ),
+                                    ]
+                                ),
+                            )
+                        ]
+                    ),
+                ),
+            ]
+        )
+
+        x.fit(df)
+
+        np.testing.assert_array_equal(
+            x.transform(df),
+            np.array([[1, -1, 1, -1], [0, 2, 99, 2], [3, 3, 3, 3]]),
+            err_msg="nested FeatureUnion step output",
+        )
+
+        h.assert_equal_dispatch(
+            expected=pd.DataFrame({"a": [1, np.NaN, 3], "b": [np.NaN, 2, 3]}),
+            actual=df,
+            msg="X not changed by the pipeline",
+        )
+
+
+class TestFuseSteps(object):
+    """Tests for TubularPipeline.fuse_steps()."""
+
+    def create_fusable_steps():
+        """Create list of steps with runs of steps that can be fused."""
+
+        steps = [
+            ("impute", MeanImputer(columns="a")),
+            ("cap", CappingTransformer(capping_values={"a": [2, 5]})),
+            ("nulls", NullIndicator(columns=["b"])),
+            ("impute_b", ArbitraryImputer(impute_value="z", columns=["b", "c"])),
+            ("map", MappingTransformer(mappings={"c": {"a": "x", "b": "y"}})),
+            ("map_b", MappingTransformer(mappings={"b": {"z": "w"}})),
+        ]
+
+        return steps
+
+    def test_arguments(self):
+        """Test that fuse_steps has expected arguments."""
+
+        h.test_function_arguments(
+            func=TubularPipeline.fuse_steps, expected_arguments=["self"]
+        )
+
+    def test_runs_of_steps_fused(self):
+        """Test that each run of consecutive steps that can be fused is replaced by a
+        FusedColumnTransformer and other steps are kept."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(TestFuseSteps.create_fusable_steps())
+
+        x.fit(df)
+
+        x_fused = x.fuse_steps()
+
+        h.assert_equal_dispatch(
+            expected=["impute__cap", "nulls", "impute_b__map__map_b"],
+            actual=[name for name, _ in x_fused.steps],
+            msg="names of steps in fused pipeline",
+        )
+
+        h.assert_equal_dispatch(
+            expected=[FusedColumnTransformer, NullIndicator, FusedColumnTransformer],
+            actual=[type(step) for _, step in x_fused.steps],
+            msg="types of steps in fused pipeline",
+        )
+
+        assert (
+            x_fused.steps[1][1] is x.steps[2][1]
+        ), "step that cannot be fused not kept in fused pipeline"
+
+    def test_single_step_not_fused(self):
+        """Test that a step that could be fused, but has no neighbouring steps that can be
+        fused, is kept as it is."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        x_fused = x.fuse_steps()
+
+        h.assert_equal_dispatch(
+            expected=["nulls", "impute__cap__map"],
+            actual=[name for name, _ in x_fused.steps],
+            msg="names of steps in fused pipeline",
+        )
+
+    def test_output_same_as_transform(self):
+        """Test that the fused pipeline gives the same output as the original pipeline."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(TestFuseSteps.create_fusable_steps())
+
+        x.fit(df)
+
+        h.assert_frame_equal_msg(
+            actual=x.fuse_steps().transform(df),
+            expected=x.transform(df),
+            msg_tag="fused pipeline output different to TubularPipeline.transform",
+        )
+
+    def create_checked_steps():
+        """Create list of steps for tests of errors from the fused pipeline."""
+
+        steps = [
+            ("impute", MeanImputer(columns=["a", "d"])),
+            ("cap", CappingTransformer(capping_values={"a": [2, 5], "d": [1, 4]})),
+            ("map", MappingTransformer(mappings={"c": {"a": "x", "b": "y"}})),
+        ]
+
+        return steps
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda df: df.drop(columns="d"),
+            lambda df: df.drop(columns="c"),
+            lambda df: df.assign(a=df["a"].astype(str), d=df["d"].astype(str)),
+            lambda df: df.assign(d=df["d"].astype(str)),
+            lambda df: df.iloc[:0],
+            lambda df: df["a"],
+        ],
+        ids=[
+            "first step column missing",
+            "last step column missing",
+            "non-numeric columns",
+            "non-numeric column",
+            "no rows",
+            "not a DataFrame",
+        ],
+    )
+    def test_same_errors_as_transform(self, change):
+        """Test that the fused pipeline raises the same errors as the original pipeline on
+        data the steps reject."""
+
+        df = d.create_df_2()
+        df["d"] = df["a"] * 2
+
+        x = TubularPipeline(TestFuseSteps.create_checked_steps())
+
+        x.fit(df)
+
+        df_bad = change(df)
+
+        with pytest.raises(Exception) as expected_error:
+
+            x.transform(df_bad)
+
+        with pytest.raises(
+            type(expected_error.value), match=re.escape(str(expected_error.value))
+        ):
+
+            x.fuse_steps().transform(df_bad)
+
+    def test_later_steps_check_transformed_values(self):
+        """Test that the values checked for each fused step are the output of the steps before
+        it, so columns made numeric by an earlier step can be capped, as in the original
+        pipeline."""
+
+        df = d.create_df_2()
+
+        steps = [
+            ("impute", ArbitraryImputer(impute_value="a", columns="b")),
+            (
+                "map",
+                MappingTransformer(
+                    mappings={"b": {k: i for i, k in enumerate("abcdef")}}
+                ),
+            ),
+            ("cap", CappingTransformer(capping_values={"b": [1, 4]})),
+        ]
+
+        x = TubularPipeline(steps)
+
+        x.fit(df)
+
+        h.assert_frame_equal_msg(
+            actual=x.fuse_steps().transform(df),
+            expected=x.transform(df),
+            msg_tag="fused pipeline output different to TubularPipeline.transform",
+        )
+
+    def test_input_not_modified(self):
+        """Test that X is not modified by transform of the fused pipeline."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(TestFuseSteps.create_fusable_steps())
+
+        x.fit(df)
+
+        x.fuse_steps().transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_2(),
+            msg_tag="X modified in fused pipeline transform",
+        )
+
+    def test_pipeline_attributes_kept(self):
+        """Test that the copy and verbose attributes are the same in the fused pipeline."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps(), verbose=True, copy=False)
+
+        x.fit(df)
+
+        x_fused = x.fuse_steps()
+
+        h.test_object_attributes(
+            obj=x_fused,
+            expected_attributes={"copy": False, "verbose": True},
+            msg="attributes of fused pipeline",
+        )
+
+
+class TestTransformRecord(object):
+    """Tests for TubularPipeline.transform_record()."""
+
+    def test_arguments(self):
+        """Test that transform_record has expected arguments."""
+
+        h.test_function_arguments(
+            func=TubularPipeline.transform_record, expected_arguments=["self", "record"]
+        )
+
+    def test_output_same_as_transform(self):
+        """Test that transform_record gives the same values as transform for each row."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        h.assert_transform_record_equal(x, df, "TubularPipeline.transform_record")
+
+    def test_steps_without_record_path(self):
+        """Test that tubular transformers without a fast path for single records and steps
+        that are not tubular transformers are applied to a single row DataFrame."""
+
+        df = d.create_df_2()
+
+        steps = create_steps() + [
+            (
+                "dataframe_method",
+                tubular.base.DataFrameMethodTransformer(
+                    new_column_name="d",
+                    pd_method_name="sum",
+                    columns=["a", "a_nulls"],
+                    pd_method_kwargs={"axis": 1},
+                ),
+            ),
+            (
+                "function",
+                FunctionTransformer(lambda X: X.assign(e=X["a"] * 2)),
+            ),
+        ]
+
+        x = TubularPipeline(steps)
+
+        x.fit(df)
+
+        h.assert_transform_record_equal(x, df, "TubularPipeline.transform_record")
+
+    @pytest.mark.parametrize("copy", [True, False])
+    def test_record_copied(self, copy):
+        """Test that the input record is only modified if copy is False."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps(), copy=copy)
+
+        x.fit(df)
+
+        record = {"a": np.NaN, "b": "a", "c": "a"}
+
+        output = x.transform_record(record)
+
+        assert (output is record) is not copy, "unexpected copy of record"
+
+    def test_non_dict_error(self):
+        """Test an error is raised if record is not a dict."""
+
+        x = TubularPipeline(create_steps())
+
+        with pytest.raises(ValueError, match="record should be a dict"):
+
+            x.transform_record(pd.Series({"a": 1}))
+
+
+class TestTransformStream(object):
+    """Tests for TubularPipeline.transform_stream()."""
+
+    def test_output_same_as_transform(self):
+        """Test that the transformed chunks are the same as transforming all the data at once."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        expected = x.transform(df)
+
+        chunks = [df.iloc[:3], df.iloc[3:5], df.iloc[5:]]
+
+        output = list(x.transform_stream(iter(chunks)))
+
+        assert len(output) == 3, f"expected 3 chunks but got {len(output)}"
+
+        h.assert_frame_equal_msg(
+            actual=pd.concat(output),
+            expected=expected,
+            msg_tag="concatenated output of transform_stream",
+        )
+
+    def test_chunks_read_lazily(self):
+        """Test that each chunk is passed through the pipeline before the next chunk is read."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        chunks_read = []
+
+        def chunk_source():
+
+            for i in range(3):
+
+                chunks_read.append(i)
+
+                yield df.iloc[2 * i : 2 * i + 2]
+
+        stream = x.transform_stream(chunk_source())
+
+        next(stream)
+
+        assert chunks_read == [0], f"expected one chunk read but got {chunks_read}"
+
+    def test_input_chunks_not_modified(self):
+        """Test that the input chunks are not modified."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        chunks = [df.iloc[:3].copy(), df.iloc[3:].copy()]
+
+        list(x.transform_stream(chunks))
+
+        h.assert_frame_equal_msg(
+            actual=pd.concat(chunks),
+            expected=d.create_df_2(),
+            msg_tag="input chunks modified by transform_stream",
+        )
+
+
+class TestFit(object):
+    """Tests for TubularPipeline.fit() and TubularPipeline.fit_transform()."""
+
+    def test_fit_returns_self(self):
+        """Test fit returns self."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x_fitted = x.fit(df)
+
+        assert x_fitted is x, "Returned value from TubularPipeline.fit not as expected."
+
+    def test_fit_input_not_modified(self):
+        """Test that X is not modified by fit."""
+
+        df = d.create_df_2()
+
+        x = TubularPipeline(create_steps())
+
+        x.fit(df)
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_2(),
+            msg_tag="X modified in TubularPipeline.fit",
+        )
+
+    def test_fit_transform_output_same_as_sklearn_pipeline(self):
+        """Test that the output of fit_transform is the same as the equivalent sklearn Pipeline."""
+
+        df = d.create_df_2()
+
+        expected = Pipeline(create_steps()).fit_transform(df)
+
+        df_transformed = TubularPipeline(create_steps()).fit_transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="TubularPipeline.fit_transform output different to sklearn Pipeline",
+        )
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_2(),
+            msg_tag="X modified in TubularPipeline.fit_transform",
+        )
+
+    def test_predict_with_final_estimator(self):
+        """Test that predict gives the same output as the equivalent sklearn Pipeline."""
+
+        df = d.create_df_3()
+        y = pd.Series(np.arange(df.shape[0]))
+
+        steps = [
+            ("impute", MeanImputer(columns=["a", "b", "c"])),
+            ("set", tubular.misc.SetValueTransformer(columns="c", value=1)),
+            ("model", LinearRegression()),
+        ]
+
+        expected = Pipeline(steps).fit(df, y).predict(df)
+
+        x = TubularPipeline(steps).fit(df, y)
+
+        h.assert_equal_dispatch(
+            expected=list(expected),
+            actual=list(x.predict(df)),
+            msg="TubularPipeline.predict output different to sklearn Pipeline",
+        )
+
+        h.assert_frame_equal_msg(
+            actual=df,
+            expected=d.create_df_3(),
+            msg_tag="X modified in TubularPipeline.predict",
+        )
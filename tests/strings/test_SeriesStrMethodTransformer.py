@@ -243,6 +243,31 @@ class TestTransform(object):
             msg_tag="Unexpected values in SeriesStrMethodTransformer.transform with pad, overwriting original column",
         )
 
+    @pytest.mark.parametrize(
+        "df, expected",
+        h.index_preserved_params(d.create_df_7(), expected_df_1()),
+    )
+    @pytest.mark.parametrize("n_jobs", [None, 2])
+    def test_expected_output_chunk_rows(self, df, expected, n_jobs):
+        """Test that the output from transform is the same when transforming in blocks of rows."""
+
+        x = SeriesStrMethodTransformer(
+            new_column_name="b_new",
+            pd_method_name="find",
+            columns=["b"],
+            pd_method_kwargs={"sub": "a"},
+            n_jobs=n_jobs,
+            chunk_rows=2,
+        )
+
+        df_transformed = x.transform(df)
+
+        h.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in SeriesStrMethodTransformer.transform with chunk_rows",
+        )
+
     @pytest.mark.parametrize(
         "df, new_column_name, pd_method_name, columns, pd_method_kwargs",
         [
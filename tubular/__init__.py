@@ -7,5 +7,6 @@ from tubular import mapping
 from tubular import misc
 from tubular import nominal
 from tubular import numeric
+from tubular import pipeline
 from tubular import strings
 from tubular import testing
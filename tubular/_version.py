@@ -1 +1 @@
-__version__ = "0.2.14"
+__version__ = "0.3.0"
@@ -3,13 +3,223 @@ This module contains transformers that other transformers in the package inherit
 from. These transformers contain key checks to be applied in all cases.
 """
 
+import threading
 import pandas as pd
+from contextlib import contextmanager
+from functools import wraps
+from joblib import Parallel, delayed
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted
 
 from tubular._version import __version__
 
 
+_copy_elision_state = threading.local()
+
+# used by copy_elision when no transformers are given, so that no transformer copies X
+_all_transformers = object()
+
+
+@contextmanager
+def copy_elision(transformers=None):
+    """Context manager within which BaseTransformer.transform does not copy X, regardless of the
+    copy attribute of the transformer.
+
+    This is intended for use when the caller has already taken a private copy of the data, e.g.
+    TubularPipeline copies X once before the first step so later steps can work in place on that
+    copy. If transformers is given only those transformers skip copying, so transformers nested
+    within other estimators, e.g. the branches of a FeatureUnion that each need an unmodified X,
+    still copy. The setting is local to the current thread and contexts can be nested, with the
+    innermost context applying.
+
+    Parameters
+    ----------
+    transformers : None or list, default = None
+        Transformers that do not copy X within the context. If None no transformer copies X.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from tubular.imputers import MeanImputer
+    >>> df = pd.DataFrame({"a": [1.0, None, 3.0]})
+    >>> imputer = MeanImputer(columns="a").fit(df)
+    >>> df_copy = df.copy()
+    >>> with copy_elision([imputer]):
+    ...     df_transformed = imputer.transform(df_copy)
+    >>> df_transformed is df_copy
+    True
+
+    """
+
+    previous = getattr(_copy_elision_state, "transformers", None)
+
+    # the transformers are referenced by id, they are kept alive by the transformers argument
+    _copy_elision_state.transformers = (
+        _all_transformers
+        if transformers is None
+        else {id(transformer) for transformer in transformers}
+    )
+
+    try:
+
+        yield
+
+    finally:
+
+        _copy_elision_state.transformers = previous
+
+
+def copy_elided(transformer):
+    """Check whether copying X has been switched off for a transformer by copy_elision.
+
+    Parameters
+    ----------
+    transformer : object
+        Transformer to check.
+
+    Returns
+    -------
+    elided : bool
+        Whether transformer is called within a copy_elision context that applies to it.
+
+    """
+
+    transformers = getattr(_copy_elision_state, "transformers", None)
+
+    if transformers is None:
+
+        return False
+
+    return transformers is _all_transformers or id(transformer) in transformers
+
+
+_row_blocks_state = threading.local()
+
+
+def row_blocks(transform):
+    """Decorator for transform methods that splits X into blocks of rows when the chunk_rows
+    attribute of the transformer is set, see BaseTransformer.transform_row_blocks.
+
+    Transform methods defined on subclasses of BaseTransformer are decorated automatically. X is
+    transformed in one go if chunk_rows is None, X has no more than chunk_rows rows or the call is
+    made while transforming a block, e.g. a call to super().transform.
+    """
+
+    @wraps(transform)
+    def wrapper(self, X):
+
+        chunk_rows = getattr(self, "chunk_rows", None)
+
+        if (
+            chunk_rows is None
+            or getattr(_row_blocks_state, "active", False)
+            or not isinstance(X, pd.DataFrame)
+            or X.shape[0] <= chunk_rows
+        ):
+
+            return transform(self, X)
+
+        return self.transform_row_blocks(transform, X)
+
+    return wrapper
+
+
+def transform_chunks(transform, chunks):
+    """Generator that applies a transform function to each chunk of data from an iterable of
+    DataFrames, used by the transform_stream methods of BaseTransformer and TubularPipeline.
+
+    Chunks are only read from chunks as the transformed chunks are requested and no reference
+    is kept to a chunk once the next one is requested, so only one chunk needs to be held in
+    memory at a time.
+
+    Parameters
+    ----------
+    transform : callable
+        Function to apply to each chunk, e.g. the transform method of a transformer.
+
+    chunks : iterable of pd.DataFrame
+        Chunks of data to transform.
+
+    Yields
+    ------
+    X : pd.DataFrame
+        Each chunk transformed with transform.
+
+    """
+
+    for chunk in chunks:
+
+        chunk = transform(chunk)
+
+        yield chunk
+
+        # drop the reference to the transformed chunk before the next chunk is read
+        del chunk
+
+
+def transform_row_block(transformer, transform, X_block):
+    """Transform a single block of rows for BaseTransformer.transform_row_blocks.
+
+    This is a module level function, rather than a closure, so that it can be pickled and sent to
+    the workers of process based joblib backends, where the row blocks flag is then set in the
+    worker. The previous value of the flag is restored afterwards.
+
+    Parameters
+    ----------
+    transformer : BaseTransformer
+        Transformer to apply.
+
+    transform : callable
+        Undecorated transform method, called as transform(transformer, X_block).
+
+    X_block : pd.DataFrame
+        Block of rows to transform.
+
+    Returns
+    -------
+    X_block : pd.DataFrame
+        Transformed block of rows.
+
+    """
+
+    active = getattr(_row_blocks_state, "active", False)
+
+    _row_blocks_state.active = True
+
+    try:
+
+        # the block is a private copy so the transform can work on it in place
+        with copy_elision([transformer]):
+
+            return transform(transformer, X_block.copy())
+
+    finally:
+
+        _row_blocks_state.active = active
+
+
+def is_null_value(value):
+    """Check whether a single value is null, i.e. None, np.NaN, pd.NaT or pd.NA, as pd.isnull
+    would for the same value in a pd.Series.
+
+    This is used when transforming single records, see BaseTransformer.transform_record, and
+    avoids the overhead of pd.isnull for scalars.
+
+    Parameters
+    ----------
+    value : object
+        Value to check.
+
+    Returns
+    -------
+    is_null : bool
+        True if value is null.
+
+    """
+
+    return value is None or value is pd.NA or value != value
+
+
 class BaseTransformer(TransformerMixin, BaseEstimator):
     """Base tranformer class which all other transformers in the package inherit from.
 
@@ -22,12 +232,25 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
         Columns to apply the transformer to. If a str is passed this is put into a list. Value passed
         in columns is saved in the columns attribute on the object.
 
-    copy : bool, default = True
-        Should X be copied before tansforms are applied?
+    copy : bool or str, default = True
+        Should X be copied before tansforms are applied? If "columns" then only the columns in the
+        columns attribute are copied and all other columns are shared with the input X, see the
+        copy_columns method.
 
     verbose : bool, default = False
         Should statements be printed when methods are run?
 
+    n_jobs : None or int, default = None
+        Number of jobs used to fit columns in parallel, for transformers that use the
+        fit_by_column method, and to transform blocks of rows in parallel if chunk_rows is set.
+        None means one job at a time and -1 means using all processors. See fit_by_column and
+        transform_row_blocks.
+
+    chunk_rows : None or int, default = None
+        If set, transform splits X into blocks of at most chunk_rows rows which are transformed
+        separately (in parallel if n_jobs is set) and concatenated, see transform_row_blocks. Can
+        only be set for transformers with the row_independent attribute True.
+
     **kwds
         Arbitrary keyword arguments.
 
@@ -37,18 +260,64 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
         Either a list of str values giving which columns in a input pandas.DataFrame the transformer
         will be applied to - or None.
 
-    copy : bool
+    copy : bool or str
         Should X be copied before tansforms are applied?
 
     verbose : bool
         Print statements to show which methods are being run or not.
 
+    n_jobs : None or int
+        Number of jobs used to fit columns or transform blocks of rows in parallel.
+
+    chunk_rows : None or int
+        Maximum number of rows transformed in one block.
+
+    row_independent : bool
+        Class attribute, True if each row of the output of transform depends only on the same
+        row of X and the fitted attributes. Only transformers with row_independent True can split
+        X into blocks of rows in transform. False by default, subclasses that meet this should set
+        it to True.
+
+    Transformers with a fast path for single records implement transform_record with plain
+    python lookups on the fitted attributes. Subclasses that override transform without also
+    overriding transform_record fall back to the DataFrame path in
+    BaseTransformer.transform_record, so the output of transform_record is always consistent
+    with transform.
+
     version_ : str
         Version number (__version__ attribute from _version.py).
 
     """
 
-    def __init__(self, columns=None, copy=True, verbose=False, **kwargs):
+    row_independent = False
+
+    def __init_subclass__(cls, **kwargs):
+
+        super().__init_subclass__(**kwargs)
+
+        if "transform" in cls.__dict__:
+
+            cls.transform = row_blocks(cls.__dict__["transform"])
+
+            # a transform_record or column_functions inherited from a parent class may not match
+            # the new transform
+            if "transform_record" not in cls.__dict__:
+
+                cls.transform_record = BaseTransformer.transform_record
+
+            if "column_functions" not in cls.__dict__:
+
+                cls.column_functions = BaseTransformer.column_functions
+
+    def __init__(
+        self,
+        columns=None,
+        copy=True,
+        verbose=False,
+        n_jobs=None,
+        chunk_rows=None,
+        **kwargs,
+    ):
 
         self.version_ = __version__
 
@@ -97,14 +366,46 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
                     "columns must be a string or list with the columns to be pre-processed (if specified)"
                 )
 
-        if not isinstance(copy, bool):
+        if not (
+            isinstance(copy, bool) or (isinstance(copy, str) and copy == "columns")
+        ):
 
-            raise ValueError("copy must be a bool")
+            raise ValueError(f"copy must be a bool or 'columns' but got {copy}")
 
         else:
 
             self.copy = copy
 
+        if n_jobs is not None:
+
+            if not isinstance(n_jobs, int) or isinstance(n_jobs, bool) or n_jobs == 0:
+
+                raise ValueError(
+                    f"n_jobs must be None or a non-zero int but got {n_jobs}"
+                )
+
+        self.n_jobs = n_jobs
+
+        if chunk_rows is not None:
+
+            if (
+                not isinstance(chunk_rows, int)
+                or isinstance(chunk_rows, bool)
+                or chunk_rows < 1
+            ):
+
+                raise ValueError(
+                    f"chunk_rows must be None or a positive int but got {chunk_rows}"
+                )
+
+            if not type(self).row_independent:
+
+                raise ValueError(
+                    f"{type(self).__name__} is not row independent so chunk_rows cannot be set"
+                )
+
+        self.chunk_rows = chunk_rows
+
     def fit(self, X, y=None):
         """Base transformer fit method, checks X and y types. Currently only pandas DataFrames are allowed for X
         and DataFrames or Series for y.
@@ -161,6 +462,10 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
 
         Transform calls the columns_check method which will check columns in columns attribute are in X.
 
+        If the copy attribute is "columns" only the columns in the columns attribute are copied, see
+        the copy_columns method. X is not copied when transform is called within the copy_elision
+        context manager.
+
         Parameters
         ----------
         X : pd.DataFrame
@@ -179,9 +484,15 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
 
             print("BaseTransformer.transform() called")
 
-        if self.copy:
+        if self.copy and not copy_elided(self):
+
+            if self.copy == "columns":
 
-            X = X.copy()
+                X = self.copy_columns(X)
+
+            else:
+
+                X = X.copy()
 
         if not X.shape[0] > 0:
 
@@ -189,6 +500,242 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
 
         return X
 
+    def transform_record(self, record):
+        """Transform a single record, given as a dict of column names and values, and return the
+        transformed record as a dict.
+
+        This is intended for scoring one row at a time, e.g. in an online API, where the
+        overhead of creating and checking a DataFrame for each row is significant. This default
+        implementation creates a DataFrame with a single row from record, transforms it with the
+        transform method and returns the row as a dict. Transformers that can apply their
+        fitted attributes directly to python values override this, see check_record, giving
+        the same values as this method.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed values for each column.
+
+        """
+
+        # the single row DataFrame is only used here so does not need to be copied in transform
+        with copy_elision([self]):
+
+            X = self.transform(pd.DataFrame([record]))
+
+        record = X.to_dict("records")[0]
+
+        return record
+
+    def column_functions(self):
+        """Functions that apply the transform to each column separately, used to fuse
+        consecutive steps of a pipeline into a single pass over the columns, see
+        tubular.pipeline.FusedColumnTransformer.
+
+        Transformers where each column in the columns attribute is transformed using only the
+        values of that column and the fitted attributes, and no other columns are changed or
+        added, can implement this to return a dict of functions for each column. Each is called
+        as function(X_c) with the values of the column and returns the transformed values, the
+        same as from transform. This default returns None, meaning the transformer cannot be
+        fused. Subclasses that override transform without also overriding column_functions
+        return None.
+
+        Returns
+        -------
+        column_functions : None or dict
+            Function to transform each column in the columns attribute.
+
+        """
+
+        return None
+
+    def check_column_functions_input(self, X_columns):
+        """Make the checks on the values of the columns in the columns attribute that transform
+        makes before transforming them, for transformers that implement column_functions.
+
+        This is called by tubular.pipeline.FusedColumnTransformer before the column functions
+        are applied, with the values of the columns as transformed by the transformers before
+        it, so the same errors are raised as applying the transformers in turn. This default
+        makes no checks. Transformers that implement column_functions and check the values or
+        dtypes of X in transform should override this.
+
+        Parameters
+        ----------
+        X_columns : dict
+            pd.Series of the values of each column in the columns attribute.
+
+        """
+
+        pass
+
+    def check_record(self, record, attributes=None):
+        """Method to check that record is a dict with all the columns in the columns attribute and
+        to copy it if requested, for the transform_record method of transformers with a fast path
+        for single records. This is the equivalent of BaseTransformer.transform for a record.
+
+        If the copy attribute is True or "columns" a shallow copy of record is made, unless this
+        is called within the copy_elision context manager.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        attributes : None or list, default = None
+            Attributes that must be set on the transformer, checked with hasattr. The
+            check_is_fitted method, which has a relatively large overhead for a single record,
+            is only called to raise the error if any are missing.
+
+        Returns
+        -------
+        record : dict
+            Input record, copied if specified by user.
+
+        """
+
+        if attributes is not None:
+
+            for attribute in attributes:
+
+                if not hasattr(self, attribute):
+
+                    self.check_is_fitted(attributes)
+
+        if not isinstance(record, dict):
+
+            raise ValueError("record should be a dict")
+
+        if self.columns is None:
+
+            raise ValueError("columns not set")
+
+        for c in self.columns:
+
+            if c not in record:
+
+                raise ValueError("variable " + c + " is not in record")
+
+        if self.copy and not copy_elided(self):
+
+            record = record.copy()
+
+        return record
+
+    def transform_stream(self, chunks):
+        """Generator that applies the transform method to each chunk of data from an iterable of
+        DataFrames, e.g. from pd.read_csv with chunksize set or the row groups of a parquet file.
+
+        Chunks are only read from chunks as the transformed chunks are requested and no reference
+        is kept to a chunk once the next one is requested, so only one chunk needs to be held in
+        memory at a time.
+
+        Parameters
+        ----------
+        chunks : iterable of pd.DataFrame
+            Chunks of data to transform.
+
+        Yields
+        ------
+        X : pd.DataFrame
+            Each chunk transformed with the transform method.
+
+        """
+
+        yield from transform_chunks(self.transform, chunks)
+
+    def transform_row_blocks(self, transform, X):
+        """Apply a transform method to blocks of at most chunk_rows rows of X and concatenate the
+        results, preserving the index of X.
+
+        Blocks are transformed with joblib.Parallel, preferring threads, if the n_jobs attribute is
+        set and one at a time otherwise. As with fit_by_column a different joblib backend can be
+        used by calling transform within a joblib.parallel_backend context, e.g. a process based
+        backend such as "loky" for transformers that hold the GIL. Each block is copied once
+        before it is transformed, regardless of the copy attribute, so X is never modified.
+
+        This is called by transform when chunk_rows is set and X has more than chunk_rows rows. It
+        is only valid for transformers where each output row depends only on the same input row,
+        see the row_independent attribute.
+
+        Parameters
+        ----------
+        transform : callable
+            Undecorated transform method, called as transform(self, X_block).
+
+        X : pd.DataFrame
+            Data to transform.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Transformed blocks of X concatenated in their original order.
+
+        """
+
+        blocks = (
+            X.iloc[i : i + self.chunk_rows]
+            for i in range(0, X.shape[0], self.chunk_rows)
+        )
+
+        if self.n_jobs is None or self.n_jobs == 1:
+
+            results = [
+                transform_row_block(self, transform, X_block) for X_block in blocks
+            ]
+
+        else:
+
+            results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(transform_row_block)(self, transform, X_block)
+                for X_block in blocks
+            )
+
+        X = pd.concat(results, axis=0)
+
+        return X
+
+    def copy_columns(self, X):
+        """Method to copy only the columns in the columns attribute of X.
+
+        A new DataFrame is created where the columns in the columns attribute are deep copies and all
+        other columns are views of the data in X, so the cost of the copy does not depend on the
+        number of columns in X that the transformer does not use. Modifying the copied columns in place
+        or assigning new columns does not change X, but modifying the other columns in place would.
+
+        With pandas versions where DataFrames are always consolidated on creation, or if X has
+        duplicated column names, this falls back to a full copy of X.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to copy.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Input X with columns in the columns attribute copied.
+
+        """
+
+        if not X.columns.is_unique:
+
+            return X.copy()
+
+        columns = set(self.columns)
+
+        X_copy = pd.DataFrame(
+            {c: X[c].copy() if c in columns else X[c] for c in X.columns}, copy=False
+        )
+
+        X_copy.columns = X.columns
+
+        return X_copy
+
     def check_is_fitted(self, attribute):
         """Check if particular attributes are on the object. This is useful to do before running transform to avoid
         trying to transform data without first running the fit method.
@@ -204,6 +751,69 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
 
         check_is_fitted(self, attribute)
 
+    def schema_checked(self, check, X, dtypes=None):
+        """Check whether a check has already passed for data with the same schema as X, so it
+        does not need to be repeated.
+
+        The schema is the columns of X, the columns attribute and, if passed, the dtypes of X.
+        As pd.Index objects are immutable, the columns of X are first compared by identity so
+        this is constant time when X shares its columns with the last data checked, e.g. batches
+        sliced from the same DataFrame. Otherwise the columns are compared with pd.Index.equals.
+
+        Parameters
+        ----------
+        check : str
+            Name of the check.
+
+        X : pd.DataFrame
+            Data to check.
+
+        dtypes : list or None, default = None
+            Dtypes of X, if the check depends on them.
+
+        Returns
+        -------
+        schema_checked : bool
+            Whether the check passed for the last data checked and it has the same schema as X.
+
+        """
+
+        checked = getattr(self, "_checked_schemas", {}).get(check)
+
+        if checked is None:
+
+            return False
+
+        checked_columns, checked_X_columns, checked_dtypes = checked
+
+        return (
+            checked_columns == self.columns
+            and (checked_X_columns is X.columns or checked_X_columns.equals(X.columns))
+            and checked_dtypes == dtypes
+        )
+
+    def set_schema_checked(self, check, X, dtypes=None):
+        """Record that a check has passed for data with the schema of X, see schema_checked.
+
+        Parameters
+        ----------
+        check : str
+            Name of the check.
+
+        X : pd.DataFrame
+            Data the check has passed for.
+
+        dtypes : list or None, default = None
+            Dtypes of X, if the check depends on them.
+
+        """
+
+        if not hasattr(self, "_checked_schemas"):
+
+            self._checked_schemas = {}
+
+        self._checked_schemas[check] = (list(self.columns), X.columns, dtypes)
+
     def columns_check(self, X):
         """Method to check that the columns attribute is set and all values are present in X.
 
@@ -226,12 +836,19 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
 
             raise ValueError("self.columns should be a list")
 
+        if self.schema_checked("columns", X):
+
+            return
+
+        # membership of the pd.Index uses its hash table rather than scanning the values
         for c in self.columns:
 
-            if c not in X.columns.values:
+            if c not in X.columns:
 
                 raise ValueError("variable " + c + " is not in X")
 
+        self.set_schema_checked("columns", X)
+
     def columns_set_or_check(self, X):
         """Function to check or set columns attribute.
 
@@ -256,6 +873,270 @@ class BaseTransformer(TransformerMixin, BaseEstimator):
 
             self.columns_check(X)
 
+    def check_numeric_columns(self, X):
+        """Method to check all columns (specicifed in self.columns) in X are all numeric.
+
+        The check is skipped if it has passed for data with the same columns and dtypes as X,
+        see schema_checked.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data containing columns to check.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Input X.
+
+        """
+
+        dtypes = X.dtypes.values.tolist()
+
+        if self.schema_checked("numeric", X, dtypes):
+
+            return X
+
+        column_dtypes = dict(zip(X.columns, dtypes))
+
+        non_numeric_columns = [
+            c
+            for c in self.columns
+            if not pd.api.types.is_numeric_dtype(column_dtypes[c])
+        ]
+
+        if non_numeric_columns:
+
+            raise TypeError(
+                f"The following columns are not numeric in X; {non_numeric_columns}"
+            )
+
+        self.set_schema_checked("numeric", X, dtypes)
+
+        return X
+
+    def fit_by_column(self, fit_column, X, other_columns=None):
+        """Call fit_column for each column in the columns attribute, in parallel if the n_jobs
+        attribute is set.
+
+        Columns are fit with joblib.Parallel, preferring threads as most of the work in fitting
+        (numpy and pandas sorting, grouping and aggregation) releases the GIL. A different joblib
+        backend, e.g. processes with "loky" or a dask cluster, can be used by calling fit within a
+        joblib.parallel_backend context. Only the data needed to fit each column is passed to
+        fit_column. Results are returned in the order of the columns attribute, regardless of
+        the order in which the jobs finish.
+
+        Parameters
+        ----------
+        fit_column : callable
+            Function called as fit_column(X_c, c) for each column c, returning the fitted values
+            for that column. Must be picklable to use process based backends, e.g. a method of the
+            transformer.
+
+        X : pd.DataFrame
+            Data to fit the transformer on.
+
+        other_columns : None or list, default = None
+            Other columns of X needed to fit each column, e.g. a response or weights column. If
+            None then X_c is the pd.Series X[c], otherwise X_c is a pd.DataFrame of c followed by
+            other_columns.
+
+        Returns
+        -------
+        fitted_values : dict
+            Output of fit_column for each column in the columns attribute.
+
+        """
+
+        if other_columns is None:
+
+            column_data = ((X[c], c) for c in self.columns)
+
+        else:
+
+            column_data = (
+                (X[[c] + [o for o in other_columns if o != c]], c) for c in self.columns
+            )
+
+        if self.n_jobs is None or self.n_jobs == 1:
+
+            results = [fit_column(X_c, c) for X_c, c in column_data]
+
+        else:
+
+            results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(fit_column)(X_c, c) for X_c, c in column_data
+            )
+
+        fitted_values = dict(zip(self.columns, results))
+
+        return fitted_values
+
+
+class BasePartialFitMixin(object):
+    """Mixin class with methods to fit a transformer on chunks of data, from sufficient statistics
+    that are accumulated with partial_fit or merged from transformers fit on other partitions of
+    the data with merge_sufficient_stats, then used to set the fitted attributes with finalize.
+
+    Transformers using this mixin must also inherit from BaseTransformer and implement the
+    sufficient_stats and finalize methods.
+    """
+
+    def partial_fit(self, X, y=None):
+        """Update the sufficient statistics used to fit the transformer with a chunk of data.
+
+        This allows transformers to be fit on data that does not fit in memory, by calling
+        partial_fit on each chunk in turn and then finalize to set the fitted attributes. The
+        sufficient statistics for each chunk are calculated with the sufficient_stats method and
+        combined with those from previous chunks with the combine_sufficient_stats method. Both of
+        these, and finalize, must be implemented by the transformer.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to fit the transformer on.
+
+        y : None or pd.DataFrame or pd.Series, default = None
+            Optional argument only required for the transformer to work with sklearn pipelines.
+
+        Returns
+        -------
+        self : BasePartialFitMixin
+            Transformer with updated sufficient_stats_ attribute.
+
+        """
+
+        BaseTransformer.fit(self, X, y)
+
+        chunk_stats = self.sufficient_stats(X)
+
+        if hasattr(self, "sufficient_stats_"):
+
+            self.sufficient_stats_ = self.combine_sufficient_stats(
+                self.sufficient_stats_, chunk_stats
+            )
+
+        else:
+
+            self.sufficient_stats_ = chunk_stats
+
+        return self
+
+    def merge_sufficient_stats(self, other):
+        """Merge the sufficient statistics from another transformer, e.g. one that has been
+        partial_fit on a different partition of the data, into this transformer.
+
+        Parameters
+        ----------
+        other : BasePartialFitMixin
+            Transformer of the same type with sufficient_stats_ for the same columns. This is
+            not modified.
+
+        Returns
+        -------
+        self : BasePartialFitMixin
+            Transformer with merged sufficient_stats_ attribute.
+
+        """
+
+        if not isinstance(other, type(self)):
+
+            raise TypeError(
+                f"other should be a {type(self).__name__} but got {type(other)}"
+            )
+
+        other.check_is_fitted(["sufficient_stats_"])
+
+        if hasattr(self, "sufficient_stats_"):
+
+            if sorted(other.sufficient_stats_.keys()) != sorted(
+                self.sufficient_stats_.keys()
+            ):
+
+                raise ValueError(
+                    f"other has sufficient stats for columns {list(other.sufficient_stats_.keys())} but expected {list(self.sufficient_stats_.keys())}"
+                )
+
+            self.sufficient_stats_ = self.combine_sufficient_stats(
+                self.sufficient_stats_, other.sufficient_stats_
+            )
+
+        else:
+
+            self.columns = list(other.sufficient_stats_.keys())
+
+            self.sufficient_stats_ = self.combine_sufficient_stats(
+                other.sufficient_stats_, {}
+            )
+
+        return self
+
+    def sufficient_stats(self, X):
+        """Calculate the sufficient statistics needed to fit the transformer from a chunk of data.
+
+        Transformers using this mixin must implement this method, returning a dict of
+        statistics for each column in the columns attribute.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to calculate statistics from.
+
+        """
+
+        raise NotImplementedError(
+            f"sufficient_stats is not implemented for {type(self).__name__}"
+        )
+
+    def combine_sufficient_stats(self, stats, other_stats):
+        """Combine two dicts of sufficient statistics by column.
+
+        Statistics for columns in stats but not in other_stats are copied. By default statistics
+        are pd.Series or pd.DataFrame objects, e.g. sums and counts by level, which are added
+        together with missing values filled with 0. Transformers with other statistics should
+        override this method.
+
+        Parameters
+        ----------
+        stats : dict
+            Sufficient statistics for each column.
+
+        other_stats : dict
+            Sufficient statistics for each column to combine with stats.
+
+        Returns
+        -------
+        combined_stats : dict
+            Combined sufficient statistics for each column. Neither input is modified.
+
+        """
+
+        combined_stats = {}
+
+        for c in stats.keys():
+
+            if c in other_stats.keys():
+
+                combined_stats[c] = stats[c].add(other_stats[c], fill_value=0)
+
+            else:
+
+                combined_stats[c] = stats[c].copy()
+
+        return combined_stats
+
+    def finalize(self):
+        """Set the fitted attributes of the transformer from the sufficient_stats_ attribute
+        accumulated with partial_fit.
+
+        Transformers using this mixin must implement this method.
+
+        """
+
+        raise NotImplementedError(
+            f"finalize is not implemented for {type(self).__name__}"
+        )
+
 
 class ReturnKeyDict(dict):
     """Dict class that implements __missing__ method to return the key if it is not present in the dict
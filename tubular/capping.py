@@ -6,11 +6,430 @@ import pandas as pd
 import numpy as np
 import warnings
 import copy
+from functools import partial
 
-from tubular.base import BaseTransformer
+from tubular.base import BaseTransformer, BasePartialFitMixin, is_null_value
 
 
-class CappingTransformer(BaseTransformer):
+class TDigest(object):
+    """Mergeable sketch of a (weighted) distribution, used to calculate approximate quantiles.
+
+    The sketch summarises the data as a sorted set of centroids (mean, weight and count of
+    observations) in the style of the t-digest of Dunning and Ertl. Centroids are merged using the
+    k1 scale function, k(q) = compression / (2 * pi) * arcsin(2q - 1), so each centroid covers at
+    most one unit of k. This keeps more, smaller, centroids in the tails of the distribution and
+    at most compression + 1 centroids in total. The error in the rank of an estimated
+    quantile q is at most about pi * sqrt(q * (1 - q)) / compression, so roughly 0.3% of the
+    data for the 1st and 99th percentiles with the default compression of 100, and is typically
+    much smaller.
+
+    Data can be added in chunks with update and sketches built on separate partitions of the
+    data can be combined with merge. Observations are buffered and only merged into centroids once
+    there are more than 5 * compression of them, so until then quantiles are exact and the same
+    as those from CappingTransformer.weighted_quantile.
+
+    Parameters
+    ----------
+    compression : int or float, default = 100
+        Controls the number of centroids kept and so the accuracy of the sketch.
+
+    Attributes
+    ----------
+    compression : int or float
+        compression argument.
+
+    means : np.array
+        Means of the centroids, in sorted order.
+
+    weights : np.array
+        Total weight of the observations in each centroid.
+
+    counts : np.array
+        Number of observations in each centroid.
+
+    min : float
+        Minimum value added to the sketch.
+
+    max : float
+        Maximum value added to the sketch.
+
+    """
+
+    def __init__(self, compression=100):
+
+        if type(compression) not in [int, float]:
+
+            raise TypeError(
+                f"compression should be an int or float but got {type(compression)}"
+            )
+
+        if not compression > 0:
+
+            raise ValueError(
+                f"compression should be greater than 0 but got {compression}"
+            )
+
+        self.compression = compression
+        self.means = np.array([], dtype=np.float64)
+        self.weights = np.array([], dtype=np.float64)
+        self.counts = np.array([], dtype=np.float64)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer = []
+
+    def update(self, values, sample_weight=None):
+        """Add observations to the sketch. Null values and zero weight observations are ignored.
+
+        Parameters
+        ----------
+        values : pd.Series or np.array
+            Values to add to the sketch.
+
+        sample_weight : pd.Series or np.array or None, default = None
+            Sample weights for each item in values. If not supplied then unit weights will be used.
+            Weights are not checked here, see CappingTransformer.check_sample_weight.
+
+        Returns
+        -------
+        self : TDigest
+            Updated sketch.
+
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+
+        if sample_weight is None:
+
+            sample_weight = np.ones(len(values))
+
+        else:
+
+            sample_weight = np.asarray(sample_weight, dtype=np.float64)
+
+        keep_filter = ~np.isnan(values) & ~(sample_weight == 0)
+        values = values[keep_filter]
+        sample_weight = sample_weight[keep_filter]
+
+        if len(values) > 0:
+
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+
+            self._buffer.append((values, sample_weight, np.ones(len(values))))
+
+            self.compress_if_full()
+
+        return self
+
+    def merge(self, other):
+        """Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other : TDigest
+            Sketch to merge in, this is not modified.
+
+        Returns
+        -------
+        self : TDigest
+            Updated sketch.
+
+        """
+
+        if not isinstance(other, TDigest):
+
+            raise TypeError(f"other should be a TDigest but got {type(other)}")
+
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        self._buffer.append((other.means, other.weights, other.counts))
+        self._buffer.extend(other._buffer)
+
+        self.compress_if_full()
+
+        return self
+
+    def collect(self):
+        """Sort the buffered observations into the centroids, without merging any centroids."""
+
+        if len(self._buffer) > 0:
+
+            means = np.concatenate([self.means] + [b[0] for b in self._buffer])
+            weights = np.concatenate([self.weights] + [b[1] for b in self._buffer])
+            counts = np.concatenate([self.counts] + [b[2] for b in self._buffer])
+
+            sorter = np.argsort(means, kind="stable")
+
+            self.means = means[sorter]
+            self.weights = weights[sorter]
+            self.counts = counts[sorter]
+
+            self._buffer = []
+
+    def compress_if_full(self):
+        """Call compress if there are more than 5 * compression centroids and buffered observations."""
+
+        n_centroids = len(self.means) + sum([len(b[0]) for b in self._buffer])
+
+        if n_centroids > 5 * self.compression:
+
+            self.compress()
+
+    def scale(self, quantiles):
+        """k1 scale function, shifted so that it runs from 0 to compression / 2.
+
+        Parameters
+        ----------
+        quantiles : np.array
+            Quantiles between 0 and 1.
+
+        Returns
+        -------
+        k : np.array
+            Value of the scale function for each quantile.
+
+        """
+
+        k = (
+            self.compression
+            / (2 * np.pi)
+            * (np.arcsin(np.clip(2 * quantiles - 1, -1, 1)) + np.pi / 2)
+        )
+
+        return k
+
+    def scale_limits(self):
+        """Calculate the value of the scale function at the left and right edge of each centroid.
+
+        Returns
+        -------
+        k_left : np.array
+            Scale function at the cumulative % of weight before each centroid.
+
+        k_right : np.array
+            Scale function at the cumulative % of weight including each centroid.
+
+        """
+
+        cumulative_weights = np.cumsum(self.weights)
+
+        k_left = self.scale(
+            (cumulative_weights - self.weights) / cumulative_weights[-1]
+        )
+        k_right = self.scale(cumulative_weights / cumulative_weights[-1])
+
+        return k_left, k_right
+
+    def merge_groups(self, groups):
+        """Merge consecutive centroids with the same group id into one centroid with the weighted
+        mean of the group, using np.bincount. Groups with a single centroid keep the exact mean.
+
+        Parameters
+        ----------
+        groups : np.array
+            Non decreasing integer group id for each centroid, starting at 0 with no gaps.
+
+        """
+
+        group_weights = np.bincount(groups, weights=self.weights)
+        group_sums = np.bincount(groups, weights=self.weights * self.means)
+        group_counts = np.bincount(groups, weights=self.counts)
+        group_sizes = np.bincount(groups)
+
+        first_in_group = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+        self.means = np.where(
+            group_sizes == 1, self.means[first_in_group], group_sums / group_weights
+        )
+        self.weights = group_weights
+        self.counts = group_counts
+
+    def compress(self):
+        """Merge centroids so that each one covers at most one unit on the k1 scale.
+
+        Small consecutive centroids in the same quarter unit of the scale function are first merged
+        together with np.bincount, so that large chunks of data are reduced quickly. Then adjacent
+        centroids are merged in order while the merged centroid covers at most one unit.
+        """
+
+        self.collect()
+
+        if len(self.means) == 0:
+
+            return
+
+        k_left, k_right = self.scale_limits()
+
+        quarter_units = np.floor(2 * (k_left + k_right))
+        large = (k_right - k_left) > 0.25
+
+        new_group = (quarter_units[1:] != quarter_units[:-1]) | large[1:] | large[:-1]
+
+        self.merge_groups(np.cumsum(np.r_[0, new_group]))
+
+        k_left, k_right = self.scale_limits()
+
+        groups = np.zeros(len(self.means), dtype=np.int64)
+        group = 0
+        group_k_left = k_left[0]
+
+        for i in range(1, len(self.means)):
+
+            if k_right[i] - group_k_left > 1:
+
+                group += 1
+                group_k_left = k_left[i]
+
+            groups[i] = group
+
+        self.merge_groups(groups)
+
+    def quantile(self, quantiles, midpoint=False):
+        """Calculate approximate quantiles from the sketch.
+
+        Each centroid is placed at the average cumulative % of weight (including the observation
+        itself) of the observations it contains, assuming they have equal weights, and quantiles
+        are interpolated between the centroids and the minimum and maximum values. This matches
+        the interpolation in CappingTransformer.weighted_quantile, so results are exact if no
+        centroids have been merged.
+
+        If midpoint is True each centroid is instead placed at the cumulative weight up to the
+        midpoint of the centroid, with the minimum and maximum at 0 and 1. For unweighted data
+        with no merged centroids quantile 0.5 is then the same as the median from pd.Series.median,
+        i.e. the average of the middle two values if there are an even number of values.
+
+        Parameters
+        ----------
+        quantiles : list or np.array
+            Quantiles to calculate. Must all be between 0 and 1.
+
+        midpoint : bool, default = False
+            Should centroids be placed at the midpoint of their weight?
+
+        Returns
+        -------
+        interp_quantiles : list
+            List containing computed quantiles.
+
+        """
+
+        self.collect()
+
+        if len(self.means) == 0:
+
+            raise ValueError("no values have been added to the TDigest")
+
+        total_weight = np.sum(self.weights)
+
+        if midpoint:
+
+            return self.midpoint_quantile(quantiles, total_weight)
+
+        positions = np.cumsum(self.weights) - self.weights * (self.counts - 1) / (
+            2 * self.counts
+        )
+        positions = positions / total_weight
+        values = self.means
+
+        if self.counts[0] > 1:
+
+            positions = np.r_[
+                self.weights[0] / self.counts[0] / total_weight, positions
+            ]
+            values = np.r_[self.min, values]
+
+        if self.counts[-1] > 1:
+
+            positions = np.r_[positions, 1.0]
+            values = np.r_[values, self.max]
+
+        interp_quantiles = list(np.interp(np.array(quantiles), positions, values))
+
+        return interp_quantiles
+
+    def midpoint_quantile(self, quantiles, total_weight):
+        """Interpolate quantiles with centroids placed at the midpoint of their weight, see the
+        quantile method.
+
+        Positions are kept in units of weight, rather than divided by the total weight, so that
+        the interpolation weights are exact for unit weights, e.g. the median of an even number of
+        values is calculated exactly as the average of the middle two values.
+
+        Parameters
+        ----------
+        quantiles : list or np.array
+            Quantiles to calculate. Must all be between 0 and 1.
+
+        total_weight : float
+            Total weight of the centroids.
+
+        Returns
+        -------
+        interp_quantiles : list
+            List containing computed quantiles.
+
+        """
+
+        positions = np.r_[0.0, np.cumsum(self.weights) - self.weights / 2, total_weight]
+        values = np.r_[self.min, self.means, self.max]
+
+        targets = np.array(quantiles, dtype=np.float64) * total_weight
+
+        upper = np.clip(
+            np.searchsorted(positions, targets, side="right"), 1, len(positions) - 1
+        )
+        lower = upper - 1
+
+        fraction = np.clip(
+            (targets - positions[lower]) / (positions[upper] - positions[lower]), 0, 1
+        )
+
+        interp_quantiles = list(
+            (1 - fraction) * values[lower] + fraction * values[upper]
+        )
+
+        return interp_quantiles
+
+
+def combine_tdigests(sketches, other_sketches, compression):
+    """Merge two dicts of TDigest sketches by key, e.g. the sketches of each column of two
+    partitions of the data.
+
+    Sketches for keys in sketches but not in other_sketches are copied.
+
+    Parameters
+    ----------
+    sketches : dict
+        TDigest sketch for each key.
+
+    other_sketches : dict
+        TDigest sketch for each key to merge with sketches.
+
+    compression : int or float
+        Compression of the merged sketches.
+
+    Returns
+    -------
+    combined_sketches : dict
+        Merged TDigest sketch for each key in sketches. Neither input is modified.
+
+    """
+
+    combined_sketches = {}
+
+    for key in sketches.keys():
+
+        combined_sketches[key] = TDigest(compression).merge(sketches[key])
+
+        if key in other_sketches.keys():
+
+            combined_sketches[key].merge(other_sketches[key])
+
+    return combined_sketches
+
+
+class CappingTransformer(BaseTransformer, BasePartialFitMixin):
     """Transformer to cap numeric values at both or either minimum and maximum values.
 
     For max capping any values above the cap value will be set to the cap. Similarly for min capping
@@ -40,6 +459,14 @@ class CappingTransformer(BaseTransformer):
         Optional weights column argument that can be used in combination with quantiles. Not used
         if capping_values is supplied. Allows weighted quantiles to be calculated.
 
+    sketch_compression : int or float or None, default = None
+        If supplied (with quantiles) then approximate quantiles are learnt using a TDigest sketch
+        per column, with this compression, rather than sorting the full columns. This allows capping
+        values to be fit from chunks of data with update_sketches or combined from separate
+        partitions with merge_sketches, or equivalently with partial_fit and
+        merge_sufficient_stats. Higher values give more accurate quantiles, see TDigest. Not used
+        if capping_values is supplied.
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseTransformer.init method.
 
@@ -55,13 +482,27 @@ class CappingTransformer(BaseTransformer):
     weights_column : str or None
         weights_column argument.
 
+    sketch_compression : int or float or None
+        sketch_compression argument.
+
+    quantile_sketches_ : dict
+        TDigest sketch for each column, only set if sketch_compression is supplied and fit or
+        update_sketches has been run.
+
     _replacement_values : dict
         Replacement values when capping is applied. Will be a copy of capping_values.
 
     """
 
+    row_independent = True
+
     def __init__(
-        self, capping_values=None, quantiles=None, weights_column=None, **kwargs
+        self,
+        capping_values=None,
+        quantiles=None,
+        weights_column=None,
+        sketch_compression=None,
+        **kwargs,
     ):
 
         if capping_values is None and quantiles is None:
@@ -105,8 +546,23 @@ class CappingTransformer(BaseTransformer):
 
             super().__init__(columns=list(quantiles.keys()), **kwargs)
 
+        if sketch_compression is not None:
+
+            if type(sketch_compression) not in [int, float]:
+
+                raise TypeError(
+                    f"sketch_compression should be an int or float but got {type(sketch_compression)}"
+                )
+
+            if not sketch_compression > 0:
+
+                raise ValueError(
+                    f"sketch_compression should be greater than 0 but got {sketch_compression}"
+                )
+
         self.quantiles = quantiles
         self.weights_column = weights_column
+        self.sketch_compression = sketch_compression
         self._replacement_values = copy.deepcopy(self.capping_values)
 
     def check_capping_values_dict(self, capping_values_dict, dict_name):
@@ -183,29 +639,214 @@ class CappingTransformer(BaseTransformer):
 
         super().fit(X, y)
 
-        if self.quantiles is not None:
+        if self.quantiles is not None and self.sketch_compression is not None:
 
-            for col in self.columns:
+            self.quantile_sketches_ = {
+                col: TDigest(self.sketch_compression) for col in self.columns
+            }
 
-                if self.weights_column is None:
+            self.update_sketches(X)
 
-                    cap_values = self.prepare_quantiles(
-                        X[col], self.quantiles[col], self.weights_column
-                    )
+        elif self.quantiles is not None:
 
-                else:
+            if self.weights_column is None:
 
-                    cap_values = self.prepare_quantiles(
-                        X[col], self.quantiles[col], X[self.weights_column]
-                    )
+                sample_weight = None
+
+            else:
+
+                sample_weight = X[self.weights_column]
+
+            learnt_capping_values = self.batch_weighted_quantiles(
+                X, self.quantiles, sample_weight
+            )
 
-                self.capping_values[col] = cap_values
+            for col in self.columns:
+
+                self.capping_values[col] = learnt_capping_values[col]
 
         else:
 
             warnings.warn("quantiles not set so no fitting done in CappingTransformer")
 
-        self._replacement_values = copy.deepcopy(self.capping_values)
+        self._replacement_values = copy.deepcopy(self.capping_values)
+
+        return self
+
+    def update_sketches(self, X):
+        """Update the quantile sketches with a chunk of data and set the capping values from the
+        updated sketches.
+
+        This allows capping values to be fit on data that is too large to fit in memory, by calling
+        update_sketches on each chunk in turn. Requires quantiles and sketch_compression to be set.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            A chunk of data with required columns to be capped (and weights_column if set).
+
+        Returns
+        -------
+        self : CappingTransformer
+            Transformer with updated sketches and capping values.
+
+        """
+
+        if self.quantiles is None or self.sketch_compression is None:
+
+            raise ValueError(
+                "quantiles and sketch_compression must be set to use quantile sketches"
+            )
+
+        self.columns_check(X)
+
+        if self.weights_column is None:
+
+            sample_weight = None
+
+        else:
+
+            sample_weight = self.check_sample_weight(X[self.weights_column])
+
+        if not hasattr(self, "quantile_sketches_"):
+
+            self.quantile_sketches_ = {
+                col: TDigest(self.sketch_compression) for col in self.columns
+            }
+
+        for col in self.columns:
+
+            self.quantile_sketches_[col].update(
+                X[col].to_numpy(dtype=np.float64, na_value=np.NaN), sample_weight
+            )
+
+        self.set_capping_values_from_sketches()
+
+        return self
+
+    def merge_sketches(self, other):
+        """Merge the quantile sketches from another CappingTransformer, e.g. one fit on a different
+        partition of the data, into this transformer and set the capping values from the merged
+        sketches.
+
+        Parameters
+        ----------
+        other : CappingTransformer
+            Transformer with quantile_sketches_ for the same columns. This is not modified.
+
+        Returns
+        -------
+        self : CappingTransformer
+            Transformer with merged sketches and capping values.
+
+        """
+
+        if self.quantiles is None or self.sketch_compression is None:
+
+            raise ValueError(
+                "quantiles and sketch_compression must be set to use quantile sketches"
+            )
+
+        if not isinstance(other, CappingTransformer):
+
+            raise TypeError(
+                f"other should be a CappingTransformer but got {type(other)}"
+            )
+
+        other.check_is_fitted(["quantile_sketches_"])
+
+        if sorted(other.quantile_sketches_.keys()) != sorted(self.columns):
+
+            raise ValueError(
+                f"other has sketches for columns {list(other.quantile_sketches_.keys())} but expected {self.columns}"
+            )
+
+        if hasattr(self, "quantile_sketches_"):
+
+            self.quantile_sketches_ = combine_tdigests(
+                self.quantile_sketches_,
+                other.quantile_sketches_,
+                self.sketch_compression,
+            )
+
+        else:
+
+            self.quantile_sketches_ = combine_tdigests(
+                other.quantile_sketches_, {}, self.sketch_compression
+            )
+
+        self.set_capping_values_from_sketches()
+
+        return self
+
+    def set_capping_values_from_sketches(self):
+        """Set the capping_values and _replacement_values attributes from the quantile sketches."""
+
+        for col in self.columns:
+
+            col_quantiles = self.quantiles[col]
+
+            results_no_none = self.quantile_sketches_[col].quantile(
+                [q for q in col_quantiles if q is not None]
+            )
+
+            self.capping_values[col] = [
+                None if q is None else results_no_none.pop(0) for q in col_quantiles
+            ]
+
+        self._replacement_values = copy.deepcopy(self.capping_values)
+
+    def partial_fit(self, X, y=None):
+        """Update the quantile sketches with a chunk of data, for the BasePartialFitMixin
+        interface. This is the same as update_sketches, the quantile_sketches_ attribute holds
+        the sufficient statistics.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data with required columns to be capped (and weights_column if set).
+
+        y : None
+            Required for pipeline.
+
+        Returns
+        -------
+        self : CappingTransformer
+            Transformer with updated sketches and capping values.
+
+        """
+
+        BaseTransformer.fit(self, X, y)
+
+        return self.update_sketches(X)
+
+    def merge_sufficient_stats(self, other):
+        """Merge the quantile sketches from another CappingTransformer, for the
+        BasePartialFitMixin interface. This is the same as merge_sketches.
+
+        Parameters
+        ----------
+        other : CappingTransformer
+            Transformer with quantile_sketches_ for the same columns. This is not modified.
+
+        Returns
+        -------
+        self : CappingTransformer
+            Transformer with merged sketches and capping values.
+
+        """
+
+        return self.merge_sketches(other)
+
+    def finalize(self):
+        """Set the capping values from the quantile sketches, for the BasePartialFitMixin
+        interface. The capping values are already set by partial_fit and
+        merge_sufficient_stats, so this only checks that there are sketches.
+        """
+
+        self.check_is_fitted(["quantile_sketches_"])
+
+        self.set_capping_values_from_sketches()
 
         return self
 
@@ -319,7 +960,35 @@ class CappingTransformer(BaseTransformer):
         if sample_weight is None:
             sample_weight = np.ones(len(values))
         else:
-            sample_weight = np.array(sample_weight)
+            sample_weight = self.check_sample_weight(sample_weight)
+
+        values = np.array(values)
+        quantiles = np.array(quantiles)
+
+        zero_weight_filter = ~(sample_weight == 0)
+        values = values[zero_weight_filter]
+        sample_weight = sample_weight[zero_weight_filter]
+
+        interp_quantiles = self.interpolate_quantiles(values, quantiles, sample_weight)
+
+        return interp_quantiles
+
+    def check_sample_weight(self, sample_weight):
+        """Method to check sample weights are valid for calculating weighted quantiles.
+
+        Parameters
+        ----------
+        sample_weight : pd.Series or np.array
+            Sample weights to check.
+
+        Returns
+        -------
+        sample_weight : np.array
+            Sample weights converted to a numpy array.
+
+        """
+
+        sample_weight = np.array(sample_weight)
 
         if np.isnan(sample_weight).sum() > 0:
             raise ValueError("null values in sample weights")
@@ -333,16 +1002,68 @@ class CappingTransformer(BaseTransformer):
         if sample_weight.sum() <= 0:
             raise ValueError("total sample weights are not greater than 0")
 
-        values = np.array(values)
-        quantiles = np.array(quantiles)
+        return sample_weight
+
+    def interpolate_quantiles(self, values, quantiles, sample_weight=None):
+        """Method to calculate quantiles from values and sample weights that have already been
+        checked and had zero weight observations removed.
+
+        Null values are filtered out, then the values are sorted and the quantiles interpolated
+        from the cumulative % of weight for each observation, as described in weighted_quantile.
+
+        If sample_weight is None then unit weights are used and rather than sorting all of the values,
+        only the values either side of each requested quantile are found with np.partition. The
+        results are the same as using weighted_quantile with unit weights.
+
+        Parameters
+        ----------
+        values : np.array
+            Float values to calculate quantiles from.
+
+        quantiles : np.array
+            Quantiles to calculate. Must all be between 0 and 1.
+
+        sample_weight : np.array or None, default = None
+            Sample weights for each item in values, with no zero weights.
+
+        Returns
+        -------
+        interp_quantiles : list
+            List containing computed quantiles.
+
+        """
 
         nan_filter = ~np.isnan(values)
-        values = values[nan_filter]
-        sample_weight = sample_weight[nan_filter]
 
-        zero_weight_filter = ~(sample_weight == 0)
-        values = values[zero_weight_filter]
-        sample_weight = sample_weight[zero_weight_filter]
+        if not nan_filter.all():
+
+            values = values[nan_filter]
+
+            if sample_weight is not None:
+
+                sample_weight = sample_weight[nan_filter]
+
+        if sample_weight is None and len(values) > 0:
+
+            n = len(values)
+
+            # the cumulative % of weight at position i in the sorted values is (i + 1) / n, find the
+            # positions either side of each quantile allowing for rounding in quantiles * n
+            positions = np.floor(quantiles * n).astype(int) - 1
+            positions = positions[:, np.newaxis] + np.arange(-1, 3)
+            positions = np.unique(np.clip(positions, 0, n - 1))
+
+            values = np.partition(values, positions)
+
+            interp_quantiles = list(
+                np.interp(quantiles, (positions + 1) / n, values[positions])
+            )
+
+            return interp_quantiles
+
+        if sample_weight is None:
+
+            sample_weight = np.ones(len(values))
 
         sorter = np.argsort(values, kind="stable")
         values = values[sorter]
@@ -355,12 +1076,79 @@ class CappingTransformer(BaseTransformer):
 
         return interp_quantiles
 
+    def batch_weighted_quantiles(self, X, quantiles, sample_weight=None):
+        """Method to calculate weighted quantiles for multiple columns.
+
+        Gives the same results as calling prepare_quantiles for each column in turn, but the sample
+        weights are only checked once and zero weight observations are removed once for all columns.
+        If sample_weight is None, the quantiles are found without fully sorting each column, see
+        interpolate_quantiles.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data containing columns to calculate quantiles from.
+
+        quantiles : dict
+            Quantiles to calculate for each column. The keys in the dict should be the column names
+            and each item in the dict should be a list of length 2, containing quantiles between 0
+            and 1 or None.
+
+        sample_weight : pd.Series or np.array or None, default = None
+            Sample weights for each row in X. If not supplied then unit weights will be used.
+
+        Returns
+        -------
+        results : dict
+            Computed quantiles for each column, with None in the same positions as in quantiles.
+
+        """
+
+        if sample_weight is not None:
+
+            sample_weight = self.check_sample_weight(sample_weight)
+
+            zero_weight_filter = ~(sample_weight == 0)
+
+            if zero_weight_filter.all():
+
+                zero_weight_filter = None
+
+            else:
+
+                sample_weight = sample_weight[zero_weight_filter]
+
+        results = {}
+
+        for col, col_quantiles in quantiles.items():
+
+            values = X[col].to_numpy(dtype=np.float64, na_value=np.NaN)
+
+            if sample_weight is not None and zero_weight_filter is not None:
+
+                values = values[zero_weight_filter]
+
+            quantiles_no_none = np.array([q for q in col_quantiles if q is not None])
+
+            results_no_none = self.interpolate_quantiles(
+                values, quantiles_no_none, sample_weight
+            )
+
+            results[col] = [
+                None if q is None else results_no_none.pop(0) for q in col_quantiles
+            ]
+
+        return results
+
     def transform(self, X):
         """Apply capping to columns in X.
 
         If cap_value_max is set, any values above cap_value_max will be set to cap_value_max. If cap_value_min
         is set any values below cap_value_min will be set to cap_value_min. Only works or numeric columns.
 
+        Columns with float64 dtype are capped together with the apply_fused_capping method, other numeric
+        columns are capped one at a time.
+
         Parameters
         ----------
         X : pd.DataFrame
@@ -390,15 +1178,310 @@ class CappingTransformer(BaseTransformer):
 
         X = super().transform(X)
 
-        numeric_column_types = X[self.columns].apply(
-            pd.api.types.is_numeric_dtype, axis=0
+        self.check_numeric_columns(X)
+
+        float_columns = [c for c in self.columns if X[c].dtype == np.float64]
+
+        if len(float_columns) > 0:
+
+            X = self.apply_fused_capping(X, float_columns)
+
+        for col in self.columns:
+
+            if col in float_columns:
+
+                continue
+
+            X = self.apply_column_capping(X, col)
+
+        return X
+
+    def apply_column_capping(self, X, col):
+        """Apply capping to a single column of X, in place, with boolean indexing. This is used for
+        columns without float64 dtype, which are not capped by apply_fused_capping.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to apply capping to.
+
+        col : str
+            Numeric column in X to apply capping to.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Input X with min and max capping applied to col.
+
+        """
+
+        cap_value_min = self.capping_values[col][0]
+        cap_value_max = self.capping_values[col][1]
+
+        replacement_min = self._replacement_values[col][0]
+        replacement_max = self._replacement_values[col][1]
+
+        if cap_value_min is not None:
+
+            X.loc[X[col] < cap_value_min, col] = replacement_min
+
+        if cap_value_max is not None:
+
+            X.loc[X[col] > cap_value_max, col] = replacement_max
+
+        return X
+
+    def cap_column(self, X_c, c):
+        """Apply capping to the values of a single column, giving the same values as transform.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column with capping values in the capping_values attribute.
+
+        Returns
+        -------
+        X_c : pd.Series
+            Values of column c with min and max capping applied.
+
+        """
+
+        if not pd.api.types.is_numeric_dtype(X_c):
+
+            raise TypeError(f"The following columns are not numeric in X; {[c]}")
+
+        if X_c.dtype == np.float64:
+
+            cap_value_min, cap_value_max = self.capping_values[c]
+            replacement_min, replacement_max = self._replacement_values[c]
+
+            values = X_c.to_numpy()
+
+            # comparisons with nulls are False, so nulls are unchanged as in apply_fused_capping
+            if cap_value_min is not None:
+
+                values = np.where(values < cap_value_min, replacement_min, values)
+
+            if cap_value_max is not None:
+
+                values = np.where(values > cap_value_max, replacement_max, values)
+
+            X_c = pd.Series(values, index=X_c.index, name=X_c.name, dtype=np.float64)
+
+        else:
+
+            # the column is copied so the capping does not modify X_c in place
+            X = X_c.to_frame(name=c).copy()
+
+            X = self.apply_column_capping(X, c)
+
+            X_c = X[c].rename(X_c.name)
+
+        return X_c
+
+    def column_functions(self):
+        """Functions to cap each column separately with the cap_column method, see
+        BaseTransformer.column_functions.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to cap each column in the columns attribute.
+
+        """
+
+        self.check_is_fitted(["capping_values"])
+        self.check_is_fitted(["_replacement_values"])
+
+        if self.capping_values == {}:
+
+            raise ValueError(
+                "capping_values attribute is an empty dict - perhaps the fit method has not been run yet"
+            )
+
+        if self._replacement_values == {}:
+
+            raise ValueError(
+                "_replacement_values attribute is an empty dict - perhaps the fit method has not been run yet"
+            )
+
+        column_functions = {c: partial(self.cap_column, c=c) for c in self.columns}
+
+        return column_functions
+
+    def check_column_functions_input(self, X_columns):
+        """Check that the columns to cap are all numeric, as transform does with
+        check_numeric_columns, see BaseTransformer.check_column_functions_input.
+
+        Parameters
+        ----------
+        X_columns : dict
+            pd.Series of the values of each column in the columns attribute.
+
+        """
+
+        non_numeric_columns = [
+            c
+            for c in self.columns
+            if not pd.api.types.is_numeric_dtype(X_columns[c].dtype)
+        ]
+
+        if non_numeric_columns:
+
+            raise TypeError(
+                f"The following columns are not numeric in X; {non_numeric_columns}"
+            )
+
+    def apply_fused_capping(self, X, columns):
+        """Apply capping to multiple float64 columns at once.
+
+        The columns are extracted as a single 2d array and the minimum then maximum capping values
+        are applied to all columns together, using per column vectors of capping and replacement
+        values. If the replacement values are the capping values (i.e. not for the
+        OutOfRangeNullTransformer) np.clip is used, otherwise np.where. A missing capping value is
+        treated as -inf or inf, i.e. no capping. Only columns that have values outside of the capping
+        values are written back to X, in place.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to apply capping to.
+
+        columns : list
+            Columns in X with float64 dtype to apply capping to.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Input X with min and max capping applied to the specified columns.
+
+        """
+
+        cap_values_min = np.array(
+            [
+                -np.inf
+                if self.capping_values[c][0] is None
+                else self.capping_values[c][0]
+                for c in columns
+            ],
+            dtype=np.float64,
+        )
+
+        cap_values_max = np.array(
+            [
+                np.inf
+                if self.capping_values[c][1] is None
+                else self.capping_values[c][1]
+                for c in columns
+            ],
+            dtype=np.float64,
+        )
+
+        replacements_min = np.array(
+            [
+                np.NaN
+                if self._replacement_values[c][0] is None
+                else self._replacement_values[c][0]
+                for c in columns
+            ],
+            dtype=np.float64,
+        )
+
+        replacements_max = np.array(
+            [
+                np.NaN
+                if self._replacement_values[c][1] is None
+                else self._replacement_values[c][1]
+                for c in columns
+            ],
+            dtype=np.float64,
+        )
+
+        # each column is a contiguous row in values
+        values = np.stack([X[c].to_numpy() for c in columns])
+
+        # fmin and fmax ignore nulls, so only columns with values outside the range are changed
+        columns_changed = np.flatnonzero(
+            (np.fmin.reduce(values, axis=1) < cap_values_min)
+            | (np.fmax.reduce(values, axis=1) > cap_values_max)
+        )
+
+        if len(columns_changed) == 0:
+
+            return X
+
+        values = values[columns_changed]
+        cap_values_min = cap_values_min[columns_changed, np.newaxis]
+        cap_values_max = cap_values_max[columns_changed, np.newaxis]
+        replacements_min = replacements_min[columns_changed, np.newaxis]
+        replacements_max = replacements_max[columns_changed, np.newaxis]
+
+        replacements_are_caps = np.all(
+            ((replacements_min == cap_values_min) | np.isinf(cap_values_min))
+            & ((replacements_max == cap_values_max) | np.isinf(cap_values_max))
         )
 
-        if not numeric_column_types.all():
+        if replacements_are_caps:
+
+            np.clip(values, cap_values_min, cap_values_max, out=values)
+
+        else:
+
+            values = np.where(values < cap_values_min, replacements_min, values)
+
+            values = np.where(values > cap_values_max, replacements_max, values)
+
+        for i, values_column in zip(columns_changed, values):
+
+            X.loc[:, columns[i]] = values_column
+
+        return X
+
+    def transform_record(self, record):
+        """Apply capping to the specified columns of a single record, giving the same values as
+        transform.
+
+        Null values, including None, are left unchanged.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with min and max capping applied to the specified columns.
+
+        """
+
+        record = self.check_record(record, ["capping_values", "_replacement_values"])
+
+        if self.capping_values == {}:
+
+            raise ValueError(
+                "capping_values attribute is an empty dict - perhaps the fit method has not been run yet"
+            )
+
+        if self._replacement_values == {}:
 
-            non_numeric_columns = list(
-                numeric_column_types.loc[~numeric_column_types].index
+            raise ValueError(
+                "_replacement_values attribute is an empty dict - perhaps the fit method has not been run yet"
+            )
+
+        non_numeric_columns = [
+            c
+            for c in self.columns
+            if not (
+                isinstance(record[c], (int, float, np.number, np.bool_))
+                or is_null_value(record[c])
             )
+        ]
+
+        if len(non_numeric_columns) > 0:
 
             raise TypeError(
                 f"The following columns are not numeric in X; {non_numeric_columns}"
@@ -406,21 +1489,23 @@ class CappingTransformer(BaseTransformer):
 
         for col in self.columns:
 
-            cap_value_min = self.capping_values[col][0]
-            cap_value_max = self.capping_values[col][1]
+            value = record[col]
 
-            replacement_min = self._replacement_values[col][0]
-            replacement_max = self._replacement_values[col][1]
+            if is_null_value(value):
 
-            if cap_value_min is not None:
+                continue
 
-                X.loc[X[col] < cap_value_min, col] = replacement_min
+            cap_value_min, cap_value_max = self.capping_values[col]
 
-            if cap_value_max is not None:
+            if cap_value_min is not None and value < cap_value_min:
 
-                X.loc[X[col] > cap_value_max, col] = replacement_max
+                record[col] = self._replacement_values[col][0]
 
-        return X
+            elif cap_value_max is not None and value > cap_value_max:
+
+                record[col] = self._replacement_values[col][1]
+
+        return record
 
 
 class OutOfRangeNullTransformer(CappingTransformer):
@@ -455,7 +1540,8 @@ class OutOfRangeNullTransformer(CappingTransformer):
         if capping_values is supplied. Allows weighted quantiles to be calculated.
 
     **kwargs
-        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+        Arbitrary keyword arguments passed onto CappingTransformer.init method, e.g.
+        sketch_compression.
 
     Attributes
     ----------
@@ -525,3 +1611,12 @@ class OutOfRangeNullTransformer(CappingTransformer):
         self.set_replacement_values()
 
         return self
+
+    def set_capping_values_from_sketches(self):
+        """Set the capping_values attribute from the quantile sketches and set all the
+        _replacement_values to null.
+        """
+
+        super().set_capping_values_from_sketches()
+
+        self.set_replacement_values()
@@ -44,6 +44,8 @@ class DateDiffLeapYearTransformer(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(
         self,
         column_lower,
@@ -131,11 +133,100 @@ class DateDiffLeapYearTransformer(BaseTransformer):
 
             return age
 
+    def calculate_age_vectorised(self, X):
+        """Function to calculate age from two date columns in a pd.DataFrame for all rows at once.
+
+        Gives the same results as applying calculate_age to each row but the year, month and day
+        components of both columns are compared with array arithmetic rather than building a
+        pd.Series for every row. Columns of datetime.date or datetime.datetime objects are
+        converted to datetime64 once before the components are extracted.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data containing column_lower and column_upper.
+
+        Returns
+        -------
+        age : pd.Series
+            Year gap between the upper and lower date values for each row in X. Rows where either
+            date value is missing are set to missing_replacement.
+
+        """
+
+        upper = self.date_column_to_datetime64(X[self.columns[1]], "upper")
+        lower = self.date_column_to_datetime64(X[self.columns[0]], "lower")
+
+        nulls = (upper.isnull() | lower.isnull()).to_numpy()
+
+        upper_month_day = upper.dt.month.to_numpy() * 100 + upper.dt.day.to_numpy()
+        lower_month_day = lower.dt.month.to_numpy() * 100 + lower.dt.day.to_numpy()
+
+        age = upper.dt.year.to_numpy() - lower.dt.year.to_numpy()
+
+        age = (
+            age
+            - ((age > 0) & (upper_month_day < lower_month_day))
+            + ((age < 0) & (upper_month_day > lower_month_day))
+        )
+
+        age = np.where(nulls, 0, age).astype("int64")
+
+        if not nulls.any():
+
+            return pd.Series(age, index=X.index)
+
+        # use the same dtype inference as pd.DataFrame.apply does on the row by row results
+        age = age.astype(object)
+        age[nulls] = self.missing_replacement
+
+        return pd.Series(age, index=X.index).infer_objects()
+
+    def date_column_to_datetime64(self, column, column_label):
+        """Function to convert a column of dates to datetime64 so that date components can be extracted.
+
+        Parameters
+        ----------
+        column : pd.Series
+            Column of datetime64 values or datetime.date / datetime.datetime objects.
+
+        column_label : str
+            Either 'upper' or 'lower', used in the error message if the column has unexpected values.
+
+        Returns
+        -------
+        column : pd.Series
+            Input column converted to datetime64.
+
+        """
+
+        if pd.api.types.is_datetime64_any_dtype(column):
+
+            return column
+
+        if column.isnull().all():
+
+            return pd.to_datetime(column)
+
+        if pd.api.types.infer_dtype(column, skipna=True) not in [
+            "date",
+            "datetime",
+            "datetime64",
+        ]:
+
+            raise TypeError(
+                f"{column_label} column values should be datetime.datetime or datetime.date objects"
+            )
+
+        return pd.to_datetime(column)
+
     def transform(self, X):
         """Calculate year gap between the two provided columns.
 
         New column is created under the 'new_column_name', and optionally removes the
-        old date columns.
+        old date columns. The year gap is calculated with calculate_age_vectorised, unless
+        the dates are outside of the range that can be represented by datetime64[ns], in
+        which case calculate_age is applied to each row.
 
         Parameters
         ----------
@@ -151,7 +242,13 @@ class DateDiffLeapYearTransformer(BaseTransformer):
 
         X = super().transform(X)
 
-        X[self.new_column_name] = X.apply(lambda x: self.calculate_age(x), axis=1)
+        try:
+
+            X[self.new_column_name] = self.calculate_age_vectorised(X)
+
+        except pd.errors.OutOfBoundsDatetime:
+
+            X[self.new_column_name] = X.apply(lambda x: self.calculate_age(x), axis=1)
 
         if self.drop_cols:
             X.drop(self.columns, axis=1, inplace=True)
@@ -173,11 +270,13 @@ class DateDifferenceTransformer(BaseTransformer):
         will be used.
     units : str, default = 'D'
         Numpy datetime units, accepted values are 'Y', 'M', 'D', 'h', 'm', 's'
-    copy : bool, default = True
-        Should X be copied prior to transform?
+    copy : bool or str, default = True
+        Should X be copied prior to transform? Passed onto BaseTransformer.init.
     verbose: bool, default = False
     """
 
+    row_independent = True
+
     def __init__(
         self,
         column_lower,
@@ -273,6 +372,8 @@ class ToDatetimeTransformer(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(self, column, new_column_name, to_datetime_kwargs={}, **kwargs):
 
         if not type(column) is str:
@@ -372,6 +473,8 @@ class SeriesDtMethodTransformer(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(
         self, new_column_name, pd_method_name, column, pd_method_kwargs={}, **kwargs
     ):
@@ -518,6 +621,8 @@ class BetweenDatesTransformer(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(
         self,
         column_lower,
@@ -4,17 +4,22 @@ This module contains transformers that deal with imputation of missing values.
 
 import pandas as pd
 import numpy as np
+from functools import partial
 
-from tubular.base import BaseTransformer
+from tubular.base import BaseTransformer, BasePartialFitMixin, is_null_value
+from tubular.capping import TDigest, combine_tdigests
 
 
 class BaseImputer(BaseTransformer):
     """Base imputer class containing standard transform method that will use pd.Series.fillna with the
-    values in the impute_values_ attribute.
+    values in the impute_values_ attribute. Float64 columns with numeric impute values are imputed
+    together as a single block with np.where, see block_impute_columns.
 
     Other imputers in this module should inherit from this class.
     """
 
+    row_independent = True
+
     def transform(self, X):
         """Impute missing values with median values calculated from fit method.
 
@@ -34,12 +39,161 @@ class BaseImputer(BaseTransformer):
 
         X = super().transform(X)
 
+        block_columns = self.block_impute_columns(X)
+
+        if block_columns:
+
+            imputed = self.impute_block(X, block_columns)
+
+            # each column is set in place with .loc, setting X[block_columns] would insert each
+            # column again and copy the rest of a consolidated X every time
+            for i, c in enumerate(block_columns):
+
+                X.loc[:, c] = imputed[:, i]
+
+        block_columns = set(block_columns)
+
         for c in self.columns:
 
-            X[c] = X[c].fillna(self.impute_values_[c])
+            if c not in block_columns:
+
+                X[c] = X[c].fillna(self.impute_values_[c])
 
         return X
 
+    def block_impute_columns(self, X):
+        """Find the columns that can be imputed together as a single 2-D block.
+
+        These are float64 columns with a numeric impute value, where pd.Series.fillna does not
+        change the dtype. Other columns, e.g. object or categorical columns, are imputed one at a
+        time in transform.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to impute.
+
+        Returns
+        -------
+        block_columns : list
+            Columns to impute as a single block.
+
+        """
+
+        if not X.columns.is_unique:
+
+            return []
+
+        dtypes = X.dtypes
+
+        block_columns = [
+            c
+            for c in self.columns
+            if dtypes[c] == np.float64
+            and isinstance(
+                self.impute_values_[c], (int, float, np.integer, np.floating)
+            )
+            and not isinstance(self.impute_values_[c], bool)
+        ]
+
+        return block_columns
+
+    def impute_block(self, X, columns):
+        """Impute missing values in float64 columns with a single np.where call, with the impute
+        values broadcast across the rows.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to impute.
+
+        columns : list
+            Float64 columns to impute, see block_impute_columns.
+
+        Returns
+        -------
+        imputed : np.ndarray
+            Values of columns with nulls imputed.
+
+        """
+
+        # columns are stacked one at a time as selecting X[columns] consolidates X in place, which
+        # would copy columns outside the block that are shared with the input when copy="columns"
+        values = np.column_stack([X[c].to_numpy(dtype=np.float64) for c in columns])
+
+        impute_values = np.array(
+            [self.impute_values_[c] for c in columns], dtype=np.float64
+        )
+
+        imputed = np.where(np.isnan(values), impute_values, values)
+
+        return imputed
+
+    def transform_record(self, record):
+        """Impute null values in a single record with the values calculated from fit method,
+        giving the same values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with nulls imputed for the specified columns.
+
+        """
+
+        record = self.check_record(record, ["impute_values_"])
+
+        for c in self.columns:
+
+            if is_null_value(record[c]):
+
+                record[c] = self.impute_values_[c]
+
+        return record
+
+    def impute_column(self, X_c, c):
+        """Impute missing values in column c with the value calculated from fit method.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column with an impute value in the impute_values_ attribute.
+
+        Returns
+        -------
+        X_c : pd.Series
+            Values of column c with nulls imputed.
+
+        """
+
+        X_c = X_c.fillna(self.impute_values_[c])
+
+        return X_c
+
+    def column_functions(self):
+        """Functions to impute each column separately with the impute_column method, see
+        BaseTransformer.column_functions.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to impute each column in the columns attribute.
+
+        """
+
+        self.check_is_fitted(["impute_values_"])
+
+        column_functions = {c: partial(self.impute_column, c=c) for c in self.columns}
+
+        return column_functions
+
 
 class ArbitraryImputer(BaseImputer):
     """Transformer to impute null values with an arbitrary pre-defined value.
@@ -119,16 +273,101 @@ class ArbitraryImputer(BaseImputer):
 
         return X
 
+    def transform_record(self, record):
+        """Impute null values in a single record with the supplied impute_value, giving the same
+        values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with nulls imputed with the specified impute_value, for the
+            specified columns.
+
+        """
+
+        record = self.check_record(record, ["impute_value"])
+
+        for c in self.columns:
+
+            if is_null_value(record[c]):
+
+                record[c] = self.impute_value
+
+        return record
+
+    def impute_column(self, X_c, c):
+        """Impute missing values in column c with the supplied impute_value, adding it to the
+        categories first for categorical columns as in transform.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column to impute.
+
+        Returns
+        -------
+        X_c : pd.Series
+            Values of column c with nulls imputed.
+
+        """
+
+        if "category" in X_c.dtype.name:
+
+            if self.impute_value not in X_c.cat.categories:
 
-class MedianImputer(BaseImputer):
+                X_c = X_c.cat.add_categories(self.impute_value)
+
+        X_c = X_c.fillna(self.impute_value)
+
+        return X_c
+
+    def column_functions(self):
+        """Functions to impute each column separately with the impute_column method, see
+        BaseTransformer.column_functions.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to impute each column in the columns attribute.
+
+        """
+
+        self.check_is_fitted(["impute_value"])
+
+        for c in self.columns:
+
+            self.impute_values_[c] = self.impute_value
+
+        column_functions = BaseImputer.column_functions(self)
+
+        return column_functions
+
+
+class MedianImputer(BaseImputer, BasePartialFitMixin):
     """Transformer to impute missing values with the median of the supplied columns.
 
+    The transformer can also be fit on chunks of data with partial_fit and finalize, in which
+    case the medians are calculated from a TDigest sketch of each column. These are exact until
+    there are more than 5 * sketch_compression non-null values in a column and approximate after
+    that, see TDigest.
+
     Parameters
     ----------
     columns : None or str or list, default = None
         Columns to impute, if the default of None is supplied all columns in X are used
         when the transform method is called.
 
+    sketch_compression : int or float, default = 100
+        Compression of the TDigest sketches used by partial_fit. Not used by fit.
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseTransformer.init method.
 
@@ -138,12 +377,33 @@ class MedianImputer(BaseImputer):
         Created during fit method. Dictionary of float / int (median) values of columns
         in the columns attribute. Keys of impute_values_ give the column names.
 
+    sketch_compression : int or float
+        Compression of the TDigest sketches used by partial_fit.
+
+    sufficient_stats_ : dict
+        Created during partial_fit method. Dictionary of TDigest sketches of the columns in the
+        columns attribute.
+
     """
 
-    def __init__(self, columns=None, **kwargs):
+    def __init__(self, columns=None, sketch_compression=100, **kwargs):
 
         super().__init__(columns=columns, **kwargs)
 
+        if type(sketch_compression) not in [int, float]:
+
+            raise TypeError(
+                f"sketch_compression should be an int or float but got {type(sketch_compression)}"
+            )
+
+        if not sketch_compression > 0:
+
+            raise ValueError(
+                f"sketch_compression should be greater than 0 but got {sketch_compression}"
+            )
+
+        self.sketch_compression = sketch_compression
+
     def fit(self, X, y=None):
         """Calculate median values to impute with from X.
 
@@ -159,16 +419,101 @@ class MedianImputer(BaseImputer):
 
         super().fit(X, y)
 
+        self.impute_values_ = self.fit_by_column(self.fit_column, X)
+
+        return self
+
+    def fit_column(self, X_c, c):
+        """Calculate the median of a single column, used by fit through fit_by_column.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to calculate the median of.
+
+        c : str
+            Name of the column.
+
+        """
+
+        return X_c.median()
+
+    def sufficient_stats(self, X):
+        """Create a TDigest sketch of each column in a chunk of data, used by partial_fit.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to sketch.
+
+        Returns
+        -------
+        stats : dict
+            TDigest sketch for each column in the columns attribute.
+
+        """
+
+        stats = {}
+
+        for c in self.columns:
+
+            stats[c] = TDigest(self.sketch_compression).update(
+                X[c].to_numpy(dtype=np.float64, na_value=np.NaN)
+            )
+
+        return stats
+
+    def combine_sufficient_stats(self, stats, other_stats):
+        """Merge TDigest sketches by column with combine_tdigests.
+
+        Parameters
+        ----------
+        stats : dict
+            TDigest sketch for each column.
+
+        other_stats : dict
+            TDigest sketch for each column to merge with stats.
+
+        Returns
+        -------
+        combined_stats : dict
+            Merged TDigest sketch for each column. Neither input is modified.
+
+        """
+
+        combined_stats = combine_tdigests(stats, other_stats, self.sketch_compression)
+
+        return combined_stats
+
+    def finalize(self):
+        """Set the impute_values_ attribute to the medians from the sketches accumulated with
+        partial_fit.
+
+        Columns with no non-null values are imputed with null, as in fit.
+
+        """
+
+        self.check_is_fitted(["sufficient_stats_"])
+
         self.impute_values_ = {}
 
         for c in self.columns:
 
-            self.impute_values_[c] = X[c].median()
+            sketch = self.sufficient_stats_[c]
+
+            # min is only less than max once values have been added to the sketch
+            if sketch.min > sketch.max:
+
+                self.impute_values_[c] = np.NaN
+
+            else:
+
+                self.impute_values_[c] = sketch.quantile([0.5], midpoint=True)[0]
 
         return self
 
 
-class MeanImputer(BaseImputer):
+class MeanImputer(BaseImputer, BasePartialFitMixin):
     """Transformer to impute missing values with the mean of the supplied columns.
 
     Parameters
@@ -215,8 +560,51 @@ class MeanImputer(BaseImputer):
 
         return self
 
+    def sufficient_stats(self, X):
+        """Calculate the sum and count of non-null values of each column in a chunk of data, used
+        by partial_fit.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to calculate statistics from.
 
-class ModeImputer(BaseImputer):
+        Returns
+        -------
+        stats : dict
+            pd.Series containing the sum and count for each column in the columns attribute.
+
+        """
+
+        stats = {}
+
+        for c in self.columns:
+
+            stats[c] = pd.Series({"sum": X[c].sum(), "count": X[c].count()})
+
+        return stats
+
+    def finalize(self):
+        """Set the impute_values_ attribute to the means from the sums and counts accumulated with
+        partial_fit.
+        """
+
+        self.check_is_fitted(["sufficient_stats_"])
+
+        self.impute_values_ = {}
+
+        for c in self.columns:
+
+            c_stats = self.sufficient_stats_[c]
+
+            self.impute_values_[c] = (
+                c_stats["sum"] / c_stats["count"] if c_stats["count"] > 0 else np.NaN
+            )
+
+        return self
+
+
+class ModeImputer(BaseImputer, BasePartialFitMixin):
     """Transformer to impute missing values with the mode of the supplied columns.
 
     Parameters
@@ -255,11 +643,75 @@ class ModeImputer(BaseImputer):
 
         super().fit(X, y)
 
+        self.impute_values_ = self.fit_by_column(self.fit_column, X)
+
+        return self
+
+    def fit_column(self, X_c, c):
+        """Calculate the mode of a single column, used by fit through fit_by_column.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to calculate the mode of.
+
+        c : str
+            Name of the column.
+
+        """
+
+        return X_c.mode()[0]
+
+    def sufficient_stats(self, X):
+        """Calculate the frequency of each non-null level of each column in a chunk of data, used
+        by partial_fit.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to calculate statistics from.
+
+        Returns
+        -------
+        stats : dict
+            pd.Series of level frequencies for each column in the columns attribute.
+
+        """
+
+        stats = {}
+
+        for c in self.columns:
+
+            stats[c] = X[c].value_counts()
+
+        return stats
+
+    def finalize(self):
+        """Set the impute_values_ attribute to the modes from the level frequencies accumulated
+        with partial_fit.
+
+        If there are multiple modes the smallest is used, as in fit. Columns with no non-null
+        values in any chunk are imputed with null.
+
+        """
+
+        self.check_is_fitted(["sufficient_stats_"])
+
         self.impute_values_ = {}
 
         for c in self.columns:
 
-            self.impute_values_[c] = X[c].mode()[0]
+            c_counts = self.sufficient_stats_[c]
+
+            if c_counts.empty:
+
+                self.impute_values_[c] = np.NaN
+
+            else:
+
+                modes = c_counts.index[c_counts == c_counts.max()]
+
+                self.impute_values_[c] = modes.sort_values()[0]
 
         return self
 
@@ -326,44 +778,62 @@ class NearestMeanResponseImputer(BaseImputer):
                 f"Response column ({self.response_column}) has null values."
             )
 
-        self.impute_values_ = {}
+        # the response is extracted once and shared by all columns
+        response = X[self.response_column].to_numpy(dtype=np.float64)
 
-        for c in self.columns:
+        self.impute_values_ = self.fit_by_column(
+            partial(self.fit_column, response=response), X
+        )
 
-            c_nulls = X[c].isnull()
+        return self
 
-            if c_nulls.sum() == 0:
+    def fit_column(self, X_c, c, response):
+        """Find the value to impute a single column with, used by fit through fit_by_column.
 
-                if self.use_median_if_no_nulls:
+        The column is factorized and the mean response of each level is calculated with
+        np.bincount on the codes, then the level with the mean response closest to that of the
+        null rows is found with np.argmin. If more than one level is equally close the first, in
+        sorted order, is used.
 
-                    self.impute_values_[c] = X[c].median()
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to impute.
 
-                else:
+        c : str
+            Name of the column to impute.
 
-                    raise ValueError(
-                        f"Column {c} has no missing values, cannot use this transformer."
-                    )
+        response : np.ndarray
+            Values of the response column.
 
-            else:
+        """
+
+        codes, levels = pd.factorize(X_c, sort=True)
+
+        c_nulls = codes == -1
 
-                mean_response_by_levels = pd.DataFrame(
-                    X.loc[~c_nulls].groupby(c)[self.response_column].mean()
-                ).reset_index()
+        if not c_nulls.any():
 
-                mean_response_nulls = X.loc[c_nulls, self.response_column].mean()
+            if self.use_median_if_no_nulls:
 
-                mean_response_by_levels["abs_diff_response"] = np.abs(
-                    mean_response_by_levels[self.response_column] - mean_response_nulls
+                return X_c.median()
+
+            else:
+
+                raise ValueError(
+                    f"Column {c} has no missing values, cannot use this transformer."
                 )
 
-                # take first value having the minimum difference in terms of average resposne
-                self.impute_values_[c] = mean_response_by_levels.loc[
-                    mean_response_by_levels["abs_diff_response"]
-                    == mean_response_by_levels["abs_diff_response"].min(),
-                    c,
-                ].values[0]
+        level_codes = codes[~c_nulls]
 
-        return self
+        mean_response_by_levels = np.bincount(
+            level_codes, weights=response[~c_nulls], minlength=len(levels)
+        ) / np.bincount(level_codes, minlength=len(levels))
+
+        mean_response_nulls = response[c_nulls].mean()
+
+        # np.argmin takes the first value having the minimum difference in average response
+        return levels[np.argmin(np.abs(mean_response_by_levels - mean_response_nulls))]
 
 
 class NullIndicator(BaseTransformer):
@@ -377,6 +847,8 @@ class NullIndicator(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(self, columns=None, **kwds):
 
         super().__init__(columns=columns, **kwds)
@@ -398,3 +870,27 @@ class NullIndicator(BaseTransformer):
             X[f"{c}_nulls"] = X[c].isnull().astype(int)
 
         return X
+
+    def transform_record(self, record):
+        """Add the null indicators for each variable in self.columns to a single record, giving
+        the same values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Input record with indicator values added.
+
+        """
+
+        record = self.check_record(record)
+
+        for c in self.columns:
+
+            record[f"{c}_nulls"] = int(is_null_value(record[c]))
+
+        return record
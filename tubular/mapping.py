@@ -6,8 +6,9 @@ import pandas as pd
 import numpy as np
 import copy
 from collections import OrderedDict
+from functools import partial
 
-from tubular.base import BaseTransformer, ReturnKeyDict
+from tubular.base import BaseTransformer, ReturnKeyDict, is_null_value
 
 
 class BaseMappingTransformer(BaseTransformer):
@@ -32,6 +33,8 @@ class BaseMappingTransformer(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(self, mappings, **kwargs):
 
         if isinstance(mappings, dict):
@@ -80,6 +83,130 @@ class BaseMappingTransformer(BaseTransformer):
 
         return X
 
+    def key_positions(self, X_c, c):
+        """Find which key of the mapping for column c is equal to each value of X_c, in a single
+        pass with a hash index rather than comparing X_c to each key in turn.
+
+        For categorical X_c each category is looked up once and the result indexed with the
+        category codes. Null keys are dropped as they are never equal to any value.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column with a mapping in the mappings attribute.
+
+        Returns
+        -------
+        keys : list
+            Non-null keys of the mapping for column c, in the order of the mapping.
+
+        positions : np.ndarray
+            Position in keys of the key equal to each value of X_c, or -1 if no key is equal.
+
+        """
+
+        keys = [
+            k
+            for k in self.mappings[c].keys()
+            if not (pd.api.types.is_scalar(k) and pd.isnull(k))
+        ]
+
+        key_index = pd.Index(keys, dtype="object", tupleize_cols=False)
+
+        if pd.api.types.is_categorical_dtype(X_c):
+
+            # append -1 so that null values, with code -1, are not matched
+            category_positions = np.append(
+                key_index.get_indexer(X_c.cat.categories), -1
+            )
+
+            positions = category_positions[X_c.cat.codes.to_numpy()]
+
+        else:
+
+            positions = key_index.get_indexer(X_c)
+
+        return keys, positions
+
+    def key_value(self, value, c, default):
+        """Find the value in the mapping for column c of the key equal to a single value, as
+        key_positions would for the same value.
+
+        Parameters
+        ----------
+        value : object
+            Value of column c for a single record.
+
+        c : str
+            Column with a mapping in the mappings attribute.
+
+        default : object
+            Returned if no key is equal to value.
+
+        Returns
+        -------
+        mapped_value : object
+            Value in the mapping for the key equal to value, or default. Null values do not
+            match any key.
+
+        """
+
+        if is_null_value(value):
+
+            return default
+
+        try:
+
+            return self.mappings[c].get(value, default)
+
+        except TypeError:
+
+            return default
+
+    def check_adjust_record(self, record, numeric):
+        """Check that a single record has the columns in the columns attribute and the
+        adjust_column, and that the value of adjust_column is numeric if required, for the
+        transform_record methods of the cross column transformers.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        numeric : bool
+            Should the value of adjust_column be checked to be numeric (or null)?
+
+        Returns
+        -------
+        record : dict
+            Input record, copied if specified by user.
+
+        """
+
+        record = self.check_record(record, ["adjust_column", "mappings"])
+
+        if self.adjust_column not in record:
+
+            raise ValueError("variable " + self.adjust_column + " is not in record")
+
+        if numeric:
+
+            value = record[self.adjust_column]
+
+            if not (
+                isinstance(value, (int, float, np.number, np.bool_))
+                or is_null_value(value)
+            ):
+
+                raise TypeError(
+                    "variable " + self.adjust_column + " must have numeric dtype."
+                )
+
+        return record
+
 
 class BaseMappingTransformMixin(BaseTransformer):
     """Mixin class to apply standard pd.Series.map transform method.
@@ -89,6 +216,8 @@ class BaseMappingTransformMixin(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def transform(self, X):
         """Applies the mapping defined in the mappings dict to each column in the columns
         attribute.
@@ -109,12 +238,158 @@ class BaseMappingTransformMixin(BaseTransformer):
 
         X = super().transform(X)
 
+        mapped_columns = {c: self.map_column(X[c], c) for c in self.columns}
+
+        # columns are only updated once all have been mapped, so X is not partly changed if
+        # map_column raises an error for a later column
         for c in self.columns:
 
-            X[c] = X[c].map(self.mappings[c])
+            X[c] = mapped_columns[c]
 
         return X
 
+    def map_column(self, X_c, c):
+        """Map the values of column c with the mapping for c in the mappings attribute.
+
+        pd.Series.map can only use a fast lookup for mappings without a __missing__ method, for
+        mappings with one, e.g. ReturnKeyDict, each value is looked up in turn in python. In
+        this case the unique values of X_c are found with pd.factorize, each is mapped once
+        and the results are broadcast back to the rows with the codes from pd.factorize. The
+        output is the same as from pd.Series.map. Categorical columns, which pd.Series.map
+        already maps by category, and other extension dtypes are passed to pd.Series.map.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column with a mapping in the mappings attribute.
+
+        Returns
+        -------
+        X_c : pd.Series
+            Mapped values of column c.
+
+        """
+
+        mapping = self.mappings[c]
+
+        if not hasattr(mapping, "__missing__") or pd.api.types.is_extension_array_dtype(
+            X_c
+        ):
+
+            return X_c.map(mapping)
+
+        codes, uniques = pd.factorize(X_c)
+
+        values = pd.Series(uniques, dtype="object")
+
+        null_rows = codes == -1
+
+        if null_rows.any():
+
+            # nulls are not in uniques, in object columns each null is mapped separately as
+            # they may be different objects e.g. None or np.NaN, otherwise they are all the same
+            if pd.api.types.is_object_dtype(X_c):
+
+                null_values = X_c[null_rows]
+
+                codes[null_rows] = len(values) + np.arange(null_values.shape[0])
+
+            else:
+
+                null_values = X_c[null_rows].iloc[:1]
+
+                codes[null_rows] = len(values)
+
+            values = pd.concat(
+                [values, null_values.astype("object")], ignore_index=True
+            )
+
+        # mapping the values as an object pd.Series infers the output dtype as pd.Series.map does
+        mapped_values = values.map(mapping).to_numpy()
+
+        X_c = pd.Series(mapped_values.take(codes), index=X_c.index, name=X_c.name)
+
+        return X_c
+
+    def transform_record(self, record):
+        """Applies the mapping defined in the mappings dict to each column in the columns
+        attribute of a single record, giving the same values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with levels mapped accoriding to mappings dict.
+
+        """
+
+        record = self.check_record(record, ["mappings"])
+
+        # as in transform the record is only updated once all columns have been mapped
+        record.update(self.map_record(record))
+
+        return record
+
+    def map_record(self, record):
+        """Map the values of a single record for each column in the columns attribute with the
+        mappings attribute, as map_column would for the same values.
+
+        Mappings with a __missing__ method, e.g. ReturnKeyDict, are indexed directly so the
+        __missing__ method is used for values not in the mapping, other values not in the
+        mapping are mapped to np.NaN.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        mapped_values : dict
+            Mapped values for each column in the columns attribute.
+
+        """
+
+        mapped_values = {}
+
+        for c in self.columns:
+
+            mapping = self.mappings[c]
+
+            if hasattr(mapping, "__missing__"):
+
+                mapped_values[c] = mapping[record[c]]
+
+            else:
+
+                mapped_values[c] = mapping.get(record[c], np.NaN)
+
+        return mapped_values
+
+    def column_functions(self):
+        """Functions to map each column separately with the map_column method, see
+        BaseTransformer.column_functions.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to map each column in the columns attribute.
+
+        """
+
+        self.check_is_fitted(["mappings"])
+
+        column_functions = {c: partial(self.map_column, c=c) for c in self.columns}
+
+        return column_functions
+
 
 class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
     """Transformer to map values in columns to other values e.g. to merge two levels into one.
@@ -189,6 +464,42 @@ class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
 
         return X
 
+    def transform_record(self, record):
+        """Transform a single record according to the mappings in the mappings attribute dict,
+        giving the same values as transform. This calls
+        BaseMappingTransformMixin.transform_record.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with levels mapped accoriding to mappings dict.
+
+        """
+
+        record = BaseMappingTransformMixin.transform_record(self, record)
+
+        return record
+
+    def column_functions(self):
+        """Functions to map each column separately, from
+        BaseMappingTransformMixin.column_functions.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to map each column in the columns attribute.
+
+        """
+
+        column_functions = BaseMappingTransformMixin.column_functions(self)
+
+        return column_functions
+
 
 class CrossColumnMappingTransformer(BaseMappingTransformer):
     """Transformer to adjust values in one column based on the values of another column.
@@ -244,6 +555,11 @@ class CrossColumnMappingTransformer(BaseMappingTransformer):
     def transform(self, X):
         """Transforms values in given column using the values provided in the adjustments dictionary.
 
+        The keys of the mapping for each column are looked up in a single pass with a hash index
+        (or once per category for categorical columns), so the cost does not grow with the number
+        of keys. Where rows match keys for more than one column the mapping for the last column
+        in mappings is applied. Rows that match no keys are left unchanged.
+
         Parameters
         ----------
         X : pd.DataFrame
@@ -260,20 +576,71 @@ class CrossColumnMappingTransformer(BaseMappingTransformer):
 
         X = super().transform(X)
 
-        if self.adjust_column not in X.columns.values:
+        if self.adjust_column not in X.columns:
 
             raise ValueError("variable " + self.adjust_column + " is not in X")
 
+        # position in mapped_values of the mapping that applies to each row, -1 if none do
+        positions = np.full(X.shape[0], -1, dtype=np.intp)
+
+        mapped_values = []
+
         for i in self.columns:
 
-            for j in self.mappings[i].keys():
+            keys, column_positions = self.key_positions(X[i], i)
 
-                X[self.adjust_column] = np.where(
-                    (X[i] == j), self.mappings[i][j], X[self.adjust_column]
-                )
+            # later columns take precedence over earlier ones, as in the order of mappings
+            matched = column_positions >= 0
+
+            positions[matched] = column_positions[matched] + len(mapped_values)
+
+            mapped_values.extend(self.mappings[i][k] for k in keys)
+
+        if len(mapped_values) > 0:
+
+            mapped_values = pd.Series(mapped_values).to_numpy()
+
+            X[self.adjust_column] = np.where(
+                positions >= 0,
+                mapped_values.take(np.maximum(positions, 0)),
+                X[self.adjust_column],
+            )
 
         return X
 
+    def transform_record(self, record):
+        """Transforms the value of the adjust column in a single record using the values provided
+        in the adjustments dictionary, giving the same values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed record with adjustments applied to specified columns.
+
+        """
+
+        record = self.check_adjust_record(record, numeric=False)
+
+        unmatched = object()
+
+        # later columns take precedence over earlier ones, as in transform
+        mapped_value = unmatched
+
+        for i in self.columns:
+
+            mapped_value = self.key_value(record[i], i, mapped_value)
+
+        if mapped_value is not unmatched:
+
+            record[self.adjust_column] = mapped_value
+
+        return record
+
 
 class CrossColumnMultiplyTransformer(BaseMappingTransformer):
     """Transformer to apply a multiplicative adjustment to values in one column based on the values of another column.
@@ -329,6 +696,10 @@ class CrossColumnMultiplyTransformer(BaseMappingTransformer):
     def transform(self, X):
         """Transforms values in given column using the values provided in the adjustments dictionary.
 
+        Each column in mappings is looked up in a single pass to give a vector of factors, with
+        1 for values not in the mapping, and the adjust column is multiplied by the vector once
+        per column.
+
         Parameters
         ----------
         X : pd.DataFrame
@@ -345,7 +716,7 @@ class CrossColumnMultiplyTransformer(BaseMappingTransformer):
 
         X = super().transform(X)
 
-        if self.adjust_column not in X.columns.values:
+        if self.adjust_column not in X.columns:
 
             raise ValueError("variable " + self.adjust_column + " is not in X")
 
@@ -357,16 +728,45 @@ class CrossColumnMultiplyTransformer(BaseMappingTransformer):
 
         for i in self.columns:
 
-            for j in self.mappings[i].keys():
+            keys, positions = self.key_positions(X[i], i)
 
-                X[self.adjust_column] = np.where(
-                    (X[i] == j),
-                    X[self.adjust_column] * self.mappings[i][j],
-                    X[self.adjust_column],
-                )
+            # factors for each key with 1 appended, taken at position -1 for unmatched values
+            factors = np.array([self.mappings[i][k] for k in keys] + [1])
+
+            X[self.adjust_column] = X[self.adjust_column] * factors[positions]
 
         return X
 
+    def transform_record(self, record):
+        """Transforms the value of the adjust column in a single record using the values provided
+        in the adjustments dictionary, giving the same values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed record with adjustments applied to specified columns.
+
+        """
+
+        record = self.check_adjust_record(record, numeric=True)
+
+        value = record[self.adjust_column]
+
+        if not is_null_value(value):
+
+            for i in self.columns:
+
+                value = value * self.key_value(record[i], i, 1)
+
+            record[self.adjust_column] = value
+
+        return record
+
 
 class CrossColumnAddTransformer(BaseMappingTransformer):
     """Transformer to apply an additive adjustment to values in one column based on the values of another column.
@@ -422,6 +822,10 @@ class CrossColumnAddTransformer(BaseMappingTransformer):
     def transform(self, X):
         """Transforms values in given column using the values provided in the adjustments dictionary.
 
+        Each column in mappings is looked up in a single pass to give a vector of offsets, with
+        0 for values not in the mapping, and the adjust column is added to the vector once
+        per column.
+
         Parameters
         ----------
         X : pd.DataFrame
@@ -438,7 +842,7 @@ class CrossColumnAddTransformer(BaseMappingTransformer):
 
         X = super().transform(X)
 
-        if self.adjust_column not in X.columns.values:
+        if self.adjust_column not in X.columns:
 
             raise ValueError("variable " + self.adjust_column + " is not in X")
 
@@ -450,12 +854,41 @@ class CrossColumnAddTransformer(BaseMappingTransformer):
 
         for i in self.columns:
 
-            for j in self.mappings[i].keys():
+            keys, positions = self.key_positions(X[i], i)
 
-                X[self.adjust_column] = np.where(
-                    (X[i] == j),
-                    X[self.adjust_column] + self.mappings[i][j],
-                    X[self.adjust_column],
-                )
+            # offsets for each key with 0 appended, taken at position -1 for unmatched values
+            offsets = np.array([self.mappings[i][k] for k in keys] + [0])
+
+            X[self.adjust_column] = X[self.adjust_column] + offsets[positions]
 
         return X
+
+    def transform_record(self, record):
+        """Transforms the value of the adjust column in a single record using the values provided
+        in the adjustments dictionary, giving the same values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed record with adjustments applied to specified columns.
+
+        """
+
+        record = self.check_adjust_record(record, numeric=True)
+
+        value = record[self.adjust_column]
+
+        if not is_null_value(value):
+
+            for i in self.columns:
+
+                value = value + self.key_value(record[i], i, 0)
+
+            record[self.adjust_column] = value
+
+        return record
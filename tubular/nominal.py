@@ -5,9 +5,12 @@ This module contains transformers that apply encodings to nominal columns.
 import pandas as pd
 import numpy as np
 import warnings
+from functools import partial
+from scipy import sparse
 from sklearn.preprocessing import OneHotEncoder
+from sklearn.utils import check_random_state
 
-from tubular.base import BaseTransformer
+from tubular.base import BaseTransformer, BasePartialFitMixin, is_null_value
 from tubular.mapping import BaseMappingTransformMixin
 
 
@@ -52,6 +55,9 @@ class BaseNominalTransformer(BaseTransformer):
         """Method to check that all the rows to apply the transformer to are able to be
         mapped according to the values in the mappings dict.
 
+        Transformers that map with BaseMappingTransformMixin.transform do not need to call this
+        as the same check is made by map_column while the rows are mapped.
+
         Raises
         ------
         ValueError
@@ -60,20 +66,266 @@ class BaseNominalTransformer(BaseTransformer):
 
         """
 
+        mapping_tables = self.compile_mappings()
+
+        for c in self.columns:
+
+            levels, values = mapping_tables[c]
+
+            self.check_positions(X[c], c, self.lookup_positions(X[c], levels))
+
+    def compile_mappings(self):
+        """Compile the mappings attribute into arrays of levels and mapped values for each column,
+        used by map_column.
+
+        The levels are held in a pd.Index, so levels are found for each row with a single hash
+        lookup, and the mapped values in an np.ndarray. The compiled mapping_tables_ attribute is
+        kept until the mappings attribute changes, so it is not rebuilt on each call to transform.
+        Changes are found with hash_mappings, so changes made to mappings in place are also used.
+        A dict from each level to the converted mapped value is also compiled for map_record.
+
+        Returns
+        -------
+        mapping_tables : dict
+            Tuple of pd.Index of levels and np.ndarray of mapped values for each column in
+            mappings.
+
+        """
+
         self.check_is_fitted(["mappings"])
 
+        mappings_hash = self.hash_mappings()
+
+        if mappings_hash is None or mappings_hash != getattr(
+            self, "_compiled_mappings_hash", None
+        ):
+
+            self.set_mapping_tables()
+
+            self._compiled_mappings_hash = mappings_hash
+
+        return self.mapping_tables_
+
+    def hash_mappings(self):
+        """Summarise the mappings attribute by the number of levels and a hash of the level, value
+        pairs for each column, so compile_mappings can find if mappings has changed without
+        comparing or copying the whole dict.
+
+        Returns
+        -------
+        mappings_hash : dict or None
+            Tuple of number of levels and hash of the level, value pairs for each column in
+            mappings, or None if any level or value cannot be hashed.
+
+        """
+
+        try:
+
+            mappings_hash = {
+                c: (len(mapping), hash(tuple(mapping.items())))
+                for c, mapping in self.mappings.items()
+            }
+
+        except TypeError:
+
+            mappings_hash = None
+
+        return mappings_hash
+
+    def set_mapping_tables(self):
+        """Set the mapping_tables_ attribute, of levels and mapped values for each column in the
+        mappings attribute, see compile_mappings.
+        """
+
+        self.mapping_tables_ = {}
+        self._record_mappings = {}
+
+        for c, mapping in self.mappings.items():
+
+            levels = pd.Index(list(mapping.keys()), tupleize_cols=False)
+
+            # values are converted as when pd.Series.map converts a dict to a pd.Series
+            values = pd.Series(list(mapping.values())).to_numpy()
+
+            self.mapping_tables_[c] = (levels, values)
+
+            self._record_mappings[c] = dict(zip(mapping.keys(), values))
+
+    @staticmethod
+    def lookup_positions(X_c, index):
+        """Find the position in index of each value of X_c, or -1 for values not in index. For
+        categorical X_c each category is looked up once and the result indexed with the codes.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values to look up.
+
+        index : pd.Index
+            Unique values to find positions in.
+
+        Returns
+        -------
+        positions : np.ndarray
+            Position in index of each value of X_c.
+
+        """
+
+        if pd.api.types.is_categorical_dtype(X_c):
+
+            # append the position of null, for rows with code -1
+            category_positions = np.append(
+                index.get_indexer(X_c.cat.categories),
+                index.get_indexer([np.NaN]),
+            )
+
+            positions = category_positions[X_c.cat.codes.to_numpy()]
+
+        else:
+
+            positions = index.get_indexer(X_c)
+
+        return positions
+
+    @staticmethod
+    def check_positions(X_c, c, positions):
+        """Check that all values of column c were found in the levels of its mapping.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column name, used in the error message.
+
+        positions : np.ndarray
+            Positions of the values of X_c in the levels of the mapping, from lookup_positions.
+
+        Raises
+        ------
+        ValueError
+            If any of the positions are -1, listing (up to 5 of) the levels not in the mapping.
+
+        """
+
+        unmapped_rows = positions == -1
+
+        if unmapped_rows.any():
+
+            unmapped_levels = pd.unique(X_c[unmapped_rows])
+
+            raise ValueError(
+                f"nulls would be introduced into column {c} from levels not present in mapping: "
+                f"{list(unmapped_levels[:5])}{' ...' if len(unmapped_levels) > 5 else ''}"
+            )
+
+    def map_column(self, X_c, c):
+        """Map the values of column c with the compiled mapping for c, checking that all rows are
+        mapped in the same pass, see compile_mappings.
+
+        This is used by BaseMappingTransformMixin.transform for transformers that inherit from
+        both classes, with this class first. Categorical columns are mapped by category with
+        pd.Series.map after the check.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Values of column c.
+
+        c : str
+            Column with a mapping in the mappings attribute.
+
+        Returns
+        -------
+        X_c : pd.Series
+            Mapped values of column c.
+
+        """
+
+        levels, values = self.compile_mappings()[c]
+
+        positions = self.lookup_positions(X_c, levels)
+
+        self.check_positions(X_c, c, positions)
+
+        if pd.api.types.is_categorical_dtype(X_c):
+
+            X_c = X_c.map(self.mappings[c])
+
+        else:
+
+            X_c = pd.Series(values.take(positions), index=X_c.index, name=X_c.name)
+
+        return X_c
+
+    def map_record(self, record):
+        """Map the values of a single record for each column in the columns attribute with the
+        compiled mappings, as map_column would for the same values.
+
+        This is used by BaseMappingTransformMixin.transform_record for transformers that inherit
+        from both classes, with this class first. Null values are looked up in the levels of the
+        mapping with pd.Index.get_indexer, as in map_column, so e.g. np.NaN matches a np.NaN level
+        but not a None level.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        mapped_values : dict
+            Mapped values for each column in the columns attribute.
+
+        Raises
+        ------
+        ValueError
+            If the value of a column is not a level in the mapping for that column.
+
+        """
+
+        mapping_tables = self.compile_mappings()
+
+        mapped_values = {}
+
         for c in self.columns:
 
-            mappable_rows = X[c].isin([k for k in self.mappings[c].keys()]).sum()
+            value = record[c]
 
-            if mappable_rows < X.shape[0]:
+            try:
 
-                raise ValueError(
-                    f"nulls would be introduced into column {c} from levels not present in mapping"
-                )
+                mapped_values[c] = self._record_mappings[c][value]
 
+                continue
 
-class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMixin):
+            except (KeyError, TypeError):
+
+                pass
+
+            if is_null_value(value):
+
+                levels, values = mapping_tables[c]
+
+                position = levels.get_indexer([value])[0]
+
+                if position != -1:
+
+                    mapped_values[c] = values[position]
+
+                    continue
+
+            raise ValueError(
+                f"nulls would be introduced into column {c} from levels not present in mapping: "
+                f"{[value]}"
+            )
+
+        return mapped_values
+
+
+class NominalToIntegerTransformer(
+    BaseNominalTransformer, BaseMappingTransformMixin, BasePartialFitMixin
+):
     """Transformer to convert columns containing nominal values into integer values.
 
     The nominal levels that are mapped to integers are not ordered in any way.
@@ -102,9 +354,13 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
         column) pairs.
 
     inverse_mapping_ : dict
-        Created in inverse_transform. Inverse mapping of mappings. Maps integer value back to categorical
+        Created in compile_mappings. Inverse mapping of mappings. Maps integer value back to categorical
         levels.
 
+    mapping_tables_ : dict
+        Created in compile_mappings. A dict of key (column names) value (tuple of pd.Index of levels and
+        np.ndarray of the integer for each level) pairs, used to encode and decode with arrays.
+
     """
 
     def __init__(self, columns=None, start_encoding=0, **kwargs):
@@ -142,15 +398,107 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
                 k: i for i, k in enumerate(col_values, self.start_encoding)
             }
 
+        self.compile_mappings()
+
+        return self
+
+    def sufficient_stats(self, X):
+        """Find the levels of each column in a chunk of data, in order of appearance, used by
+        partial_fit.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to find levels in.
+
+        Returns
+        -------
+        stats : dict
+            pd.Index of unique levels for each column in the columns attribute.
+
+        """
+
+        stats = {}
+
+        for c in self.columns:
+
+            stats[c] = pd.Index(X[c].unique())
+
+        return stats
+
+    def combine_sufficient_stats(self, stats, other_stats):
+        """Combine levels by column, keeping the order in which levels first appear.
+
+        Parameters
+        ----------
+        stats : dict
+            pd.Index of levels for each column.
+
+        other_stats : dict
+            pd.Index of levels for each column, levels not already in stats are added after
+            those in stats.
+
+        Returns
+        -------
+        combined_stats : dict
+            Combined pd.Index of unique levels for each column.
+
+        """
+
+        combined_stats = {}
+
+        for c in stats.keys():
+
+            if c in other_stats.keys():
+
+                combined_stats[c] = stats[c].append(other_stats[c]).unique()
+
+            else:
+
+                combined_stats[c] = stats[c].copy()
+
+        return combined_stats
+
+    def finalize(self):
+        """Set the mappings attribute from the levels accumulated with partial_fit. Levels are
+        encoded in the order they first appeared in the chunks, as in fit.
+        """
+
+        self.check_is_fitted(["sufficient_stats_"])
+
+        self.mappings = {}
+
+        for c in self.columns:
+
+            self.mappings[c] = {
+                k: i
+                for i, k in enumerate(self.sufficient_stats_[c], self.start_encoding)
+            }
+
+        self.compile_mappings()
+
         return self
 
+    def set_mapping_tables(self):
+        """Set the mapping_tables_ attribute of levels and integer codes, see
+        BaseNominalTransformer.set_mapping_tables, and the inverse_mapping_ attribute from the
+        mappings attribute.
+        """
+
+        self.inverse_mapping_ = {
+            c: {v: k for k, v in mapping.items()}
+            for c, mapping in self.mappings.items()
+        }
+
+        BaseNominalTransformer.set_mapping_tables(self)
+
     def transform(self, X):
         """Transform method to apply integer encoding stored in the mappings attribute to
         each column in the columns attribute.
 
-        This method calls the check_mappable_rows method from BaseNominalTransformer to check that
-        all rows can be mapped then transform from BaseMappingTransformMixin to apply the
-        standard pd.Series.map method.
+        This method calls transform from BaseMappingTransformMixin, which maps each column with
+        the map_column method from BaseNominalTransformer. This checks that all rows can be mapped
+        in the same pass as the mapping.
 
         Parameters
         ----------
@@ -164,15 +512,57 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
 
         """
 
-        self.check_mappable_rows(X)
-
         X = BaseMappingTransformMixin.transform(self, X)
 
         return X
 
+    def transform_record(self, record):
+        """Transform method to apply integer encoding stored in the mappings attribute to each
+        column in the columns attribute of a single record, giving the same values as transform.
+
+        This method calls transform_record from BaseMappingTransformMixin, which maps the values
+        with the map_record method from BaseNominalTransformer.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with levels mapped accoriding to mappings dict.
+
+        """
+
+        record = BaseMappingTransformMixin.transform_record(self, record)
+
+        return record
+
+    def column_functions(self):
+        """Functions to map each column separately, from
+        BaseMappingTransformMixin.column_functions, which maps with the map_column method from
+        BaseNominalTransformer.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to map each column in the columns attribute.
+
+        """
+
+        column_functions = BaseMappingTransformMixin.column_functions(self)
+
+        return column_functions
+
     def inverse_transform(self, X):
         """Converts integer values back to categorical / nominal values. Does the inverse of the transform method.
 
+        Levels are taken from the compiled mapping_tables_ by position, which is found directly
+        from the integer value when the codes are consecutive, and all rows are checked to be
+        mappable in the same pass. Categorical columns stay categorical, rebuilt from the
+        positions with pd.Categorical.from_codes with the levels as the categories.
+
         Parameters
         ----------
         X : pd.DataFrame
@@ -189,30 +579,65 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
 
         self.check_is_fitted(["mappings"])
 
-        self.inverse_mapping_ = {}
+        mapping_tables = self.compile_mappings()
+
+        decoded = {}
 
         for c in self.columns:
 
-            # calculate the reverse mapping
-            self.inverse_mapping_[c] = {v: k for k, v in self.mappings[c].items()}
+            levels, codes = mapping_tables[c]
 
-            mappable_rows = (
-                X[c].isin([k for k, v in self.inverse_mapping_[c].items()]).sum()
-            )
+            start = codes.min()
+
+            if pd.api.types.is_integer_dtype(X[c]) and np.array_equal(
+                codes, np.arange(start, start + codes.shape[0])
+            ):
+
+                # codes are consecutive so the position of each level is the offset from start
+                positions = X[c].to_numpy() - start
+
+                positions[(positions < 0) | (positions >= codes.shape[0])] = -1
 
-            X[c] = X[c].replace(self.inverse_mapping_[c])
+            else:
+
+                positions = self.lookup_positions(X[c], pd.Index(codes))
 
-            if (X.shape[0] - mappable_rows) > 0:
+            if (positions == -1).any():
 
                 raise ValueError(
                     "nulls introduced from levels not present in mapping for column: "
                     + c
                 )
 
+            if pd.api.types.is_categorical_dtype(X[c]):
+
+                # the levels are the categories of the output, so the positions are the codes,
+                # except null levels which cannot be categories and are given the code -1
+                not_null = levels.notna()
+
+                level_codes = np.cumsum(not_null) - 1
+
+                level_codes[~not_null] = -1
+
+                decoded[c] = pd.Categorical.from_codes(
+                    level_codes.take(positions),
+                    categories=levels[not_null],
+                    ordered=X[c].cat.ordered,
+                )
+
+            else:
+
+                decoded[c] = levels.to_numpy().take(positions)
+
+        # columns are only updated once all have been checked
+        for c in self.columns:
+
+            X[c] = decoded[c]
+
         return X
 
 
-class GroupRareLevelsTransformer(BaseNominalTransformer):
+class GroupRareLevelsTransformer(BaseNominalTransformer, BasePartialFitMixin):
     """Transformer to group together rare levels of nominal variables into a new level,
     labelled 'rare' (by default).
 
@@ -337,78 +762,161 @@ class GroupRareLevelsTransformer(BaseNominalTransformer):
 
         if self.weight is not None:
 
-            if self.weight not in X.columns.values:
+            if self.weight not in X.columns:
 
                 raise ValueError("weight " + self.weight + " not in X")
 
-        self.mapping_ = {}
-
-        if self.record_rare_levels:
+        other_columns = None if self.weight is None else [self.weight]
 
-            self.rare_levels_record_ = {}
+        self.set_levels_from_percents(
+            self.fit_by_column(self.fit_column, X, other_columns)
+        )
 
-        if self.weight is None:
+        return self
 
-            for c in self.columns:
+    def fit_column(self, X_c, c):
+        """Calculate the percent of rows or weight for each level, including nulls, of a single
+        column, used by fit through fit_by_column.
 
-                col_percents = X[c].value_counts(dropna=False) / X.shape[0]
+        Parameters
+        ----------
+        X_c : pd.Series or pd.DataFrame
+            Column to calculate level percents for, or a pd.DataFrame containing the column and
+            weight column if weight is set.
 
-                self.mapping_[c] = list(
-                    col_percents.loc[col_percents >= self.cut_off_percent].index.values
-                )
+        c : str
+            Name of the column.
 
-                self.mapping_[c] = sorted(self.mapping_[c], key=str)
+        Returns
+        -------
+        col_percents : pd.Series
+            Percent of rows or weight indexed by level.
 
-                if self.record_rare_levels:
+        """
 
-                    self.rare_levels_record_[c] = list(
-                        col_percents.loc[
-                            col_percents < self.cut_off_percent
-                        ].index.values
-                    )
+        if self.weight is None:
 
-                    self.rare_levels_record_[c] = sorted(
-                        self.rare_levels_record_[c], key=str
-                    )
+            col_percents = X_c.value_counts(dropna=False) / X_c.shape[0]
 
         else:
 
-            for c in self.columns:
+            col_percents = X_c.groupby(c)[self.weight].sum()
 
-                cols_w_percents = X.groupby(c)[self.weight].sum()
+            # nulls are excluded from pandas groupby; https://github.com/pandas-dev/pandas/issues/3729
+            # so add them back in
+            if col_percents.sum() < X_c[self.weight].sum():
 
-                # nulls are excluded from pandas groupby; https://github.com/pandas-dev/pandas/issues/3729
-                # so add them back in
-                if cols_w_percents.sum() < X[self.weight].sum():
+                col_percents[np.NaN] = X_c.loc[X_c[c].isnull(), self.weight].sum()
 
-                    cols_w_percents[np.NaN] = X.loc[X[c].isnull(), self.weight].sum()
+            col_percents = col_percents / X_c[self.weight].sum()
 
-                cols_w_percents = cols_w_percents / X[self.weight].sum()
+        return col_percents
 
-                self.mapping_[c] = list(
-                    cols_w_percents.loc[
-                        cols_w_percents >= self.cut_off_percent
-                    ].index.values
-                )
+    def set_levels_from_percents(self, percents):
+        """Set the mapping_ (and rare_levels_record_) attributes from the percent of rows or
+        weight by level of each column.
+
+        Parameters
+        ----------
+        percents : dict
+            pd.Series of percent of rows or weight indexed by level, for each column in the
+            columns attribute.
 
-                self.mapping_[c] = sorted(self.mapping_[c], key=str)
+        """
 
-                if self.record_rare_levels:
+        self.mapping_ = {}
 
-                    self.rare_levels_record_[c] = list(
-                        cols_w_percents.loc[
-                            cols_w_percents < self.cut_off_percent
-                        ].index.values
-                    )
+        if self.record_rare_levels:
 
-                    self.rare_levels_record_[c] = sorted(
-                        self.rare_levels_record_[c], key=str
-                    )
+            self.rare_levels_record_ = {}
 
-        return self
+        for c in self.columns:
 
-    def transform(self, X):
-        """Grouped rare levels together into a new 'rare' level.
+            col_percents = percents[c]
+
+            self.mapping_[c] = sorted(
+                col_percents.loc[col_percents >= self.cut_off_percent].index.values,
+                key=str,
+            )
+
+            if self.record_rare_levels:
+
+                self.rare_levels_record_[c] = sorted(
+                    col_percents.loc[col_percents < self.cut_off_percent].index.values,
+                    key=str,
+                )
+
+    def sufficient_stats(self, X):
+        """Calculate the number of rows or sum of weight for each level, including nulls, of each
+        column in a chunk of data, used by partial_fit.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to calculate statistics from.
+
+        Returns
+        -------
+        stats : dict
+            pd.Series of number of rows or sum of weight by level for each column in the columns
+            attribute.
+
+        """
+
+        if self.weight is not None:
+
+            if self.weight not in X.columns:
+
+                raise ValueError("weight " + self.weight + " not in X")
+
+        stats = {}
+
+        for c in self.columns:
+
+            if self.weight is None:
+
+                stats[c] = X[c].value_counts(dropna=False)
+
+            else:
+
+                c_weights = X.groupby(c)[self.weight].sum()
+
+                # nulls are excluded from pandas groupby so add them back in, with zero weight if
+                # there are no nulls so the index is consistent across chunks
+                c_weights[np.NaN] = X.loc[X[c].isnull(), self.weight].sum()
+
+                stats[c] = c_weights
+
+        return stats
+
+    def finalize(self):
+        """Set the mapping_ (and rare_levels_record_) attributes from the level frequencies or
+        weights accumulated with partial_fit.
+        """
+
+        self.check_is_fitted(["sufficient_stats_"])
+
+        percents = {}
+
+        for c in self.columns:
+
+            col_totals = self.sufficient_stats_[c]
+
+            # fit only adds a null level to the weights by level if the nulls have non-zero weight
+            if self.weight is not None:
+
+                col_totals = col_totals.loc[
+                    ~(col_totals.index.isnull() & (col_totals == 0))
+                ]
+
+            percents[c] = col_totals / col_totals.sum()
+
+        self.set_levels_from_percents(percents)
+
+        return self
+
+    def transform(self, X):
+        """Grouped rare levels together into a new 'rare' level.
 
         Parameters
         ----------
@@ -452,119 +960,1041 @@ class GroupRareLevelsTransformer(BaseNominalTransformer):
 
         return X
 
+    def transform_record(self, record):
+        """Group rare levels in a single record into the rare level, giving the same values as
+        transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with rare levels grouped into the rare level.
+
+        """
+
+        record = self.check_record(record, ["mapping_"])
+
+        for c in self.columns:
+
+            value = record[c]
+
+            # pd.Series.isin matches np.NaN to np.NaN but not to None, so nulls are checked with it
+            if is_null_value(value):
+
+                is_level = pd.Series([value]).isin(self.mapping_[c]).iloc[0]
+
+            else:
+
+                is_level = value in self.mapping_[c]
+
+            if not is_level:
+
+                record[c] = self.rare_level_name
+
+        return record
+
+
+class BaseMeanResponseStatsMixin(object):
+    """Mixin class with methods to check the response column and calculate the sufficient
+    statistics for the (weighted) mean response by level, used by MeanResponseTransformer and
+    OrdinalEncoderTransformer.
+
+    Transformers using this mixin must have response_column and weights_column attributes.
+    """
+
+    def check_response_column(self, X):
+        """Check that the response and weights columns are in X and the response has no nulls.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data containing response_column and weights_column, if set.
+
+        """
+
+        if self.response_column not in X.columns:
+
+            raise ValueError(f"response {self.response_column} not in X")
+
+        if self.weights_column is not None:
+
+            if self.weights_column not in X.columns:
+
+                raise ValueError(f"weights column {self.weights_column} not in X")
+
+        response_null_count = X[self.response_column].isnull().sum()
+
+        if response_null_count > 0:
+
+            raise ValueError(
+                f"{self.response_column} in X has {response_null_count} null values"
+            )
+
+    def response_and_weights(self, X):
+        """Extract the response and weights as float arrays, once for all columns.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data containing response_column and weights_column, if set.
+
+        Returns
+        -------
+        response : np.ndarray
+            Values of response_column.
+
+        weights : np.ndarray or None
+            Values of weights_column, with nulls as 0 so they are excluded from the sums as in
+            pandas groupby, or None if weights_column is not set.
+
+        """
+
+        response = X[self.response_column].to_numpy(dtype=np.float64)
+
+        if self.weights_column is None:
+
+            weights = None
+
+        else:
+
+            weights = X[self.weights_column].to_numpy(dtype=np.float64, na_value=0)
+
+        return response, weights
+
+    @staticmethod
+    def level_codes(X_c):
+        """Factorize a column into an integer code for each row and the levels the codes refer
+        to. Levels are in sorted order, or category order for categorical columns which includes
+        categories with no rows, as from pandas groupby. Nulls have code -1.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to factorize.
+
+        Returns
+        -------
+        codes : np.ndarray
+            Position of the level of each row in levels, or -1 for nulls.
+
+        levels : pd.Index
+            Levels of the column.
+
+        """
+
+        if isinstance(X_c.dtype, pd.CategoricalDtype):
+
+            codes = X_c.cat.codes.to_numpy()
+            levels = X_c.cat.categories
+
+        else:
+
+            codes, levels = pd.factorize(X_c, sort=True)
+
+        return codes, levels
+
+    @staticmethod
+    def code_sums(codes, n_codes, response, weights):
+        """Sum the response and weights (or number of rows, if weights is None) for each code
+        with np.bincount, excluding rows with code -1.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            Code of each row, between -1 and n_codes - 1.
+
+        n_codes : int
+            Number of codes, the length of the outputs.
+
+        response : np.ndarray
+            Response values.
 
-class MeanResponseTransformer(BaseNominalTransformer, BaseMappingTransformMixin):
+        weights : np.ndarray or None
+            Weights values.
+
+        Returns
+        -------
+        response_sum : np.ndarray
+            Sum of the response for each code.
+
+        weight_sum : np.ndarray
+            Sum of the weights, or number of rows, for each code.
+
+        """
+
+        # nulls have code -1 and are excluded, as in pandas groupby
+        not_null = codes >= 0
+
+        if not not_null.all():
+
+            codes = codes[not_null]
+            response = response[not_null]
+
+            if weights is not None:
+
+                weights = weights[not_null]
+
+        response_sum = np.bincount(codes, weights=response, minlength=n_codes)
+
+        weight_sum = np.bincount(codes, weights=weights, minlength=n_codes)
+
+        return response_sum, weight_sum
+
+    def level_sums(self, X_c, c, response, weights):
+        """Calculate the sum of the response and the sum of weights (or number of rows, if
+        weights is None) for each non-null level of a column.
+
+        The column is factorized once and the sums are calculated with np.bincount on the codes,
+        rather than building a pandas groupby object. Levels are in sorted order, or category
+        order for categorical columns which includes categories with no rows, as from groupby.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to calculate the sums by level for.
+
+        c : str
+            Name of the column.
+
+        response : np.ndarray
+            Response values, from response_and_weights.
+
+        weights : np.ndarray or None
+            Weights values, from response_and_weights.
+
+        Returns
+        -------
+        c_stats : pd.DataFrame
+            Data with response_sum and weight_sum columns, indexed by level.
+
+        """
+
+        codes, levels = self.level_codes(X_c)
+
+        response_sum, weight_sum = self.code_sums(codes, len(levels), response, weights)
+
+        c_stats = pd.DataFrame(
+            {"response_sum": response_sum, "weight_sum": weight_sum},
+            index=pd.Index(levels, name=c),
+        )
+
+        return c_stats
+
+    def mean_response_by_level(self, X_c, c, response, weights):
+        """Calculate the (weighted) mean response for each non-null level of a column, see
+        level_sums.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to calculate the mean response by level for.
+
+        c : str
+            Name of the column.
+
+        response : np.ndarray
+            Response values, from response_and_weights.
+
+        weights : np.ndarray or None
+            Weights values, from response_and_weights.
+
+        Returns
+        -------
+        mean_response : pd.Series
+            Mean response indexed by level.
+
+        """
+
+        c_stats = self.level_sums(X_c, c, response, weights)
+
+        # levels with no rows, i.e. unused categories, have a null mean response as in groupby
+        with np.errstate(divide="ignore", invalid="ignore"):
+
+            mean_response = c_stats["response_sum"] / c_stats["weight_sum"]
+
+        return mean_response
+
+    def fit_mean_response(self, X):
+        """Calculate the (weighted) mean response by level for each column in the columns
+        attribute.
+
+        The response and weights are extracted once for all columns, then each column is
+        factorized once and the sums by level are calculated with np.bincount, see level_sums.
+        Columns are processed through fit_by_column, so in parallel if n_jobs is set.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data containing the columns in the columns attribute, response_column and
+            weights_column, if set.
+
+        Returns
+        -------
+        mean_responses : dict
+            pd.Series of mean response indexed by level, for each column in the columns
+            attribute.
+
+        """
+
+        self.check_response_column(X)
+
+        response, weights = self.response_and_weights(X)
+
+        mean_responses = self.fit_by_column(
+            partial(self.mean_response_by_level, response=response, weights=weights), X
+        )
+
+        return mean_responses
+
+    @staticmethod
+    def rank_mapping(mean_response):
+        """Map levels to the rank of their mean response in ascending order, starting from 1.
+        Levels with equal mean response keep their order.
+
+        Parameters
+        ----------
+        mean_response : pd.Series
+            Mean response indexed by level.
+
+        Returns
+        -------
+        mapping : dict
+            Rank of the mean response for each level.
+
+        """
+
+        ranked_levels = mean_response.sort_values(
+            ascending=True, kind="mergesort"
+        ).index
+
+        mapping = {k: rank for rank, k in enumerate(ranked_levels, start=1)}
+
+        return mapping
+
+    def mean_response_sufficient_stats(self, X):
+        """Calculate the sum of the response and the sum of weights (or number of rows, if
+        weights_column is not set) for each non-null level of each column in a chunk of data,
+        see level_sums.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data containing the columns in the columns attribute, response_column and
+            weights_column, if set.
+
+        Returns
+        -------
+        stats : dict
+            pd.DataFrame with response_sum and weight_sum columns, indexed by level, for each
+            column in the columns attribute.
+
+        """
+
+        self.check_response_column(X)
+
+        response, weights = self.response_and_weights(X)
+
+        stats = {c: self.level_sums(X[c], c, response, weights) for c in self.columns}
+
+        return stats
+
+    def mean_response_from_stats(self, c):
+        """Calculate the mean response by level for a column from the sufficient_stats_ attribute.
+
+        Parameters
+        ----------
+        c : str
+            Column to calculate the mean response by level for.
+
+        Returns
+        -------
+        mean_response : pd.Series
+            Mean response indexed by level.
+
+        """
+
+        c_stats = self.sufficient_stats_[c]
+
+        mean_response = c_stats["response_sum"] / c_stats["weight_sum"]
+
+        return mean_response
+
+
+class MeanResponseTransformer(
+    BaseNominalTransformer,
+    BaseMappingTransformMixin,
+    BaseMeanResponseStatsMixin,
+    BasePartialFitMixin,
+):
     """Transformer to apply mean response encoding. This converts categorical variables to
     numeric by mapping levels to the mean response for that level.
 
-    If a categorical variable contains null values these will not be transformed.
+    If a categorical variable contains null values these will not be transformed.
+
+    If cv is set then fit_transform returns out-of-fold encodings, so the encoding of each row
+    does not use its own response. The rows are split into cv folds and each row is encoded
+    with the mean response for its level in the other folds, or the mean response of all rows
+    in the other folds if its level only occurs in its own fold. The mappings attribute, used
+    by transform, is still learnt from all rows.
+
+    If smoothing is set the mean response of each level is blended with the prior, the mean
+    response of all rows, so levels with few rows get less noisy encodings. A number m gives
+    the m-estimate (response_sum + m * prior) / (weight_sum + m), i.e. the prior counts as m
+    extra rows (or weight) for each level. "auto" gives an empirical Bayes blend, as the "auto"
+    smoothing of sklearn.preprocessing.TargetEncoder, where the weight given to the level mean
+    is n * variance / (n * variance + level_variance) for a level with n rows, the variance of
+    the response and the variance of the response within the level. The sums by level are kept
+    in the level_stats_ attribute, so the smoothing can be changed without refitting with
+    set_smoothing. This sets the smoothing_ attribute, used for the mappings, and leaves the
+    smoothing attribute as passed in init.
+
+    Parameters
+    ----------
+    response_column : str
+        Response column to use to encode the categorical levels.
+
+    columns : None or str or list, default = None
+        Columns to transform, if the default of None is supplied all object and category
+        columns in X are used.
+
+    weights_column : str or None
+        Weights column to use when calculating the mean response.
+
+    cv : None or int, default = None
+        Number of folds for out-of-fold encodings in fit_transform, if None fit_transform is
+        the same as fit then transform.
+
+    random_state : None or int, default = None
+        If set, rows are shuffled with this seed before being split into folds, otherwise the
+        folds are consecutive blocks of rows as in sklearn.model_selection.KFold.
+
+    smoothing : None or float or "auto", default = None
+        Smoothing of the mean response of each level towards the prior. None for no smoothing,
+        a non-negative number for the m-estimate with that weight for the prior or "auto" for
+        the empirical Bayes blend. "auto" cannot be used with weights_column.
+
+    **kwargs
+        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+
+    Attributes
+    ----------
+    response_column : str
+        Response column to use to encode the categorical levels.
+
+    weights_column : str or None
+        Weights column to use when calculating the mean response.
+
+    cv : None or int
+        Number of folds for out-of-fold encodings in fit_transform.
+
+    random_state : None or int
+        Seed used to shuffle rows before they are split into folds.
+
+    smoothing : None or float or "auto"
+        Smoothing of the mean response of each level towards the prior.
+
+    smoothing_ : None or float or "auto"
+        Created in fit. Smoothing used for the mappings, the smoothing attribute unless changed
+        after fit with set_smoothing.
+
+    level_stats_ : dict
+        Created in fit. Dict of key (column names) value (dict of the levels as a pd.Index and
+        np.ndarrays of the response_sum, weight_sum and, if weights_column is not set, the
+        response_sq_sum for each level) pairs.
+
+    mappings : dict
+        Created in fit. Dict of key (column names) value (mapping of categorical levels to numeric,
+        mean response values) pairs.
+
+    """
+
+    def __init__(
+        self,
+        response_column,
+        columns=None,
+        weights_column=None,
+        cv=None,
+        random_state=None,
+        smoothing=None,
+        **kwargs,
+    ):
+
+        if type(response_column) is not str:
+
+            raise TypeError("response_column should be a str")
+
+        if weights_column is not None:
+
+            if type(weights_column) is not str:
+
+                raise TypeError("weights_column should be a str")
+
+            if weights_column == response_column:
+
+                raise ValueError(
+                    "weights_column and response_column are the same column"
+                )
+
+        if cv is not None:
+
+            if type(cv) is not int:
+
+                raise TypeError(f"cv should be None or an int but got {type(cv)}")
+
+            if not cv >= 2:
+
+                raise ValueError(f"cv should be at least 2 but got {cv}")
+
+        self.response_column = response_column
+        self.weights_column = weights_column
+        self.cv = cv
+        self.random_state = random_state
+
+        self.check_smoothing(smoothing)
+
+        self.smoothing = smoothing
+
+        BaseNominalTransformer.__init__(self, columns=columns, **kwargs)
+
+    def fit(self, X, y=None):
+        """Identify mapping of categorical levels to mean response values.
+
+        If the user specified the weights_column arg in when initialising the transformer
+        the weighted mean response will be calculated using that column.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to with catgeorical variable columns to transform and also containing response_column
+            column.
+
+        y : None or pd.DataFrame or pd.Series, default = None
+            Optional argument only required for the transformer to work with sklearn pipelines.
+
+        """
+
+        BaseNominalTransformer.fit(self, X, y)
+
+        self.mappings = {}
+
+        self.check_response_column(X)
+
+        response, weights = self.response_and_weights(X)
+
+        self.smoothing_ = self.smoothing
+
+        self.level_stats_ = self.fit_by_column(
+            partial(self.column_level_stats, response=response, weights=weights), X
+        )
+
+        self.set_mappings_from_level_stats()
+
+        return self
+
+    def check_smoothing(self, smoothing):
+        """Check that smoothing is None, "auto" or a non-negative number.
+
+        Parameters
+        ----------
+        smoothing : None or float or "auto"
+            Value to check.
+
+        """
+
+        if smoothing is None:
+
+            return
+
+        if smoothing == "auto":
+
+            if self.weights_column is not None:
+
+                raise ValueError("smoothing 'auto' cannot be used with weights_column")
+
+            return
+
+        if type(smoothing) not in [int, float]:
+
+            raise TypeError(
+                f"smoothing should be None, 'auto' or a number but got {smoothing}"
+            )
+
+        if not smoothing >= 0:
+
+            raise ValueError(f"smoothing should not be negative but got {smoothing}")
+
+    def set_smoothing(self, smoothing):
+        """Change the smoothing and recalculate the mappings from the level_stats_ attribute,
+        without refitting. The new smoothing is set to the smoothing_ attribute, the smoothing
+        attribute is not changed so get_params still gives the arguments passed to init.
+
+        Parameters
+        ----------
+        smoothing : None or float or "auto"
+            New smoothing, see the smoothing argument of init.
+
+        Returns
+        -------
+        self : MeanResponseTransformer
+            Transformer with mappings for the new smoothing.
+
+        """
+
+        self.check_smoothing(smoothing)
+
+        self.check_is_fitted(["level_stats_"])
+
+        self.smoothing_ = smoothing
+
+        self.set_mappings_from_level_stats()
+
+        return self
+
+    def level_sums_from_codes(self, codes, n_codes, response, weights):
+        """Sum the response, the weights (or number of rows, if weights is None) and, if weights
+        is None, the squared response for each code, see code_sums.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            Code of each row, between -1 and n_codes - 1.
+
+        n_codes : int
+            Number of codes, the length of the outputs.
+
+        response : np.ndarray
+            Response values.
+
+        weights : np.ndarray or None
+            Weights values.
+
+        Returns
+        -------
+        response_sum : np.ndarray
+            Sum of the response for each code.
+
+        weight_sum : np.ndarray
+            Sum of the weights, or number of rows, for each code.
+
+        response_sq_sum : np.ndarray or None
+            Sum of the squared response for each code, None if weights is set.
+
+        """
+
+        response_sum, weight_sum = self.code_sums(codes, n_codes, response, weights)
+
+        if weights is None:
+
+            response_sq_sum, _ = self.code_sums(
+                codes, n_codes, np.square(response), None
+            )
+
+        else:
+
+            response_sq_sum = None
+
+        return response_sum, weight_sum, response_sq_sum
+
+    def column_level_stats(self, X_c, c, response, weights):
+        """Calculate the sums by level of a column kept in the level_stats_ attribute, used by
+        fit through fit_by_column.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to calculate the sums by level for.
+
+        c : str
+            Name of the column.
+
+        response : np.ndarray
+            Response values, from response_and_weights.
+
+        weights : np.ndarray or None
+            Weights values, from response_and_weights.
+
+        Returns
+        -------
+        c_stats : dict
+            Levels as a pd.Index and np.ndarrays of response_sum, weight_sum and
+            response_sq_sum for each level.
+
+        """
+
+        codes, levels = self.level_codes(X_c)
+
+        response_sum, weight_sum, response_sq_sum = self.level_sums_from_codes(
+            codes, len(levels), response, weights
+        )
+
+        c_stats = {
+            "levels": pd.Index(levels, name=c),
+            "response_sum": response_sum,
+            "weight_sum": weight_sum,
+            "response_sq_sum": response_sq_sum,
+        }
+
+        return c_stats
+
+    def smoothed_mean_response(self, response_sum, weight_sum, response_sq_sum):
+        """Calculate the encoding of each level from its sums, smoothed towards the prior as set
+        by the smoothing_ attribute. The prior is the mean response of all levels.
+
+        The sums can also be 2 dimensional, with a row for each fold, in which case each row is
+        smoothed towards its own prior.
+
+        Parameters
+        ----------
+        response_sum : np.ndarray
+            Sum of the response for each level.
+
+        weight_sum : np.ndarray
+            Sum of the weights, or number of rows, for each level.
+
+        response_sq_sum : np.ndarray or None
+            Sum of the squared response for each level, required if smoothing is "auto".
+
+        Returns
+        -------
+        mean_response : np.ndarray
+            Encoding for each level. Levels with no rows are null without smoothing and
+            otherwise the prior.
+
+        """
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+
+            mean_response = response_sum / weight_sum
+
+            if self.smoothing_ is None:
+
+                return mean_response
+
+            total_weight = weight_sum.sum(axis=-1, keepdims=True)
+
+            prior = response_sum.sum(axis=-1, keepdims=True) / total_weight
+
+            if self.smoothing_ == "auto":
+
+                variance = (
+                    response_sq_sum.sum(axis=-1, keepdims=True) / total_weight
+                    - prior**2
+                )
+
+                level_variance = np.maximum(
+                    response_sq_sum / weight_sum - mean_response**2, 0
+                )
+
+                blend = variance * weight_sum / (variance * weight_sum + level_variance)
+
+                # levels with no rows, or no variance in the response at all, get the prior
+                mean_response = np.where(
+                    np.isnan(blend),
+                    prior,
+                    blend * mean_response + (1 - blend) * prior,
+                )
+
+            else:
+
+                mean_response = (response_sum + self.smoothing_ * prior) / (
+                    weight_sum + self.smoothing_
+                )
+
+        return mean_response
+
+    def set_mappings_from_level_stats(self):
+        """Set the mappings attribute from the sums by level in the level_stats_ attribute,
+        smoothed as set by the smoothing_ attribute.
+        """
+
+        self.check_is_fitted(["level_stats_"])
+
+        self.mappings = {}
+
+        for c in self.columns:
+
+            c_stats = self.level_stats_[c]
+
+            mean_response = self.smoothed_mean_response(
+                c_stats["response_sum"],
+                c_stats["weight_sum"],
+                c_stats["response_sq_sum"],
+            )
+
+            # building the dict from lists avoids the per item overhead of pd.Series.to_dict
+            self.mappings[c] = dict(
+                zip(c_stats["levels"].tolist(), mean_response.tolist())
+            )
+
+    def fit_transform(self, X, y=None):
+        """Fit the transformer then transform X. If the cv attribute is set the encodings are
+        calculated out-of-fold, see out_of_fold_mean_response, otherwise this is the same as
+        calling fit then transform.
+
+        Each column is factorized once. The sums by level for each fold are calculated in one
+        pass and the sums for the other folds found by subtracting them from the totals, rather
+        than fitting on each fold separately. Columns are processed through fit_by_column, so in
+        parallel if n_jobs is set.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data with nominal columns to fit on and transform, also containing response_column.
+
+        y : None or pd.DataFrame or pd.Series, default = None
+            Optional argument only required for the transformer to work with sklearn pipelines.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Transformed input X with out-of-fold encodings if cv is set.
+
+        """
+
+        if self.cv is None:
+
+            return super().fit_transform(X, y)
+
+        BaseNominalTransformer.fit(self, X, y)
+
+        self.mappings = {}
+
+        self.check_response_column(X)
+
+        response, weights = self.response_and_weights(X)
+
+        self.smoothing_ = self.smoothing
+
+        folds = self.fold_indices(X)
+
+        results = self.fit_by_column(
+            partial(
+                self.out_of_fold_mean_response,
+                response=response,
+                weights=weights,
+                folds=folds,
+            ),
+            X,
+        )
+
+        self.level_stats_ = {c: results[c][0] for c in self.columns}
+
+        self.set_mappings_from_level_stats()
+
+        X = BaseTransformer.transform(self, X)
+
+        for c in self.columns:
+
+            X[c] = results[c][1]
+
+        return X
+
+    def fold_indices(self, X):
+        """Assign each row of X to one of cv folds, the same folds as the test rows from
+        sklearn.model_selection.KFold, with shuffling if random_state is set.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to split into folds.
+
+        Returns
+        -------
+        folds : np.ndarray
+            Fold of each row, from 0 to cv - 1.
+
+        """
+
+        n_rows = X.shape[0]
+
+        if self.cv > n_rows:
+
+            raise ValueError(f"cv is {self.cv} but X only has {n_rows} rows")
+
+        rows = np.arange(n_rows)
+
+        if self.random_state is not None:
+
+            check_random_state(self.random_state).shuffle(rows)
+
+        # as in KFold the first n_rows % cv folds have one more row than the others
+        fold_sizes = np.full(self.cv, n_rows // self.cv, dtype=np.intp)
+        fold_sizes[: n_rows % self.cv] += 1
+
+        folds = np.empty(n_rows, dtype=np.intp)
+
+        folds[rows] = np.repeat(np.arange(self.cv), fold_sizes)
+
+        return folds
+
+    def out_of_fold_mean_response(self, X_c, c, response, weights, folds):
+        """Calculate the sums by level of a column and the out-of-fold encoding of each row,
+        used by fit_transform through fit_by_column.
+
+        The sums by level over all rows are calculated as in fit, see column_level_stats. The
+        sums by level and fold are calculated with a single np.bincount on combined fold and
+        level codes, then subtracted from the totals to give the sums over the other folds. The
+        encodings are smoothed towards the prior for the other folds as set by the smoothing_
+        attribute.
+
+        Parameters
+        ----------
+        X_c : pd.Series
+            Column to encode.
+
+        c : str
+            Name of the column.
+
+        response : np.ndarray
+            Response values, from response_and_weights.
+
+        weights : np.ndarray or None
+            Weights values, from response_and_weights.
+
+        folds : np.ndarray
+            Fold of each row, from fold_indices.
+
+        Returns
+        -------
+        c_stats : dict
+            Sums by level over all rows, see column_level_stats.
+
+        out_of_fold_values : pd.Series
+            Encoding for the level of each row from the rows in the other folds.
 
-    Parameters
-    ----------
-    response_column : str
-        Response column to use to encode the categorical levels.
+        """
 
-    columns : None or str or list, default = None
-        Columns to transform, if the default of None is supplied all object and category
-        columns in X are used.
+        codes, levels = self.level_codes(X_c)
 
-    weights_column : str or None
-        Weights column to use when calculating the mean response.
+        # nulls cannot be mapped, raise the same error as transform would
+        self.check_positions(X_c, c, codes)
 
-    **kwargs
-        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+        n_levels = len(levels)
 
-    Attributes
-    ----------
-    response_column : str
-        Response column to use to encode the categorical levels.
+        response_sum, weight_sum, response_sq_sum = self.level_sums_from_codes(
+            codes, n_levels, response, weights
+        )
 
-    weights_column : str or None
-        Weights column to use when calculating the mean response.
+        fold_codes = folds * n_levels + codes
 
-    mappings : dict
-        Created in fit. Dict of key (column names) value (mapping of categorical levels to numeric,
-        mean response values) pairs.
+        (
+            fold_response_sum,
+            fold_weight_sum,
+            fold_response_sq_sum,
+        ) = self.level_sums_from_codes(
+            fold_codes, self.cv * n_levels, response, weights
+        )
 
-    """
+        # row counts decide whether a level occurs in other folds, as subtracting the weights
+        # for the fold from the total may not give exactly 0
+        fold_counts = np.bincount(fold_codes, minlength=self.cv * n_levels).reshape(
+            self.cv, n_levels
+        )
 
-    def __init__(self, response_column, columns=None, weights_column=None, **kwargs):
+        # sums over the other folds for each fold and level, looked up for each row once below
+        other_counts = fold_counts.sum(axis=0) - fold_counts
+        other_response_sum = response_sum - fold_response_sum.reshape(self.cv, n_levels)
+        other_weight_sum = weight_sum - fold_weight_sum.reshape(self.cv, n_levels)
 
-        if type(response_column) is not str:
+        if weights is None:
 
-            raise TypeError("response_column should be a str")
+            other_response_sq_sum = response_sq_sum - fold_response_sq_sum.reshape(
+                self.cv, n_levels
+            )
 
-        if weights_column is not None:
+        else:
 
-            if type(weights_column) is not str:
+            other_response_sq_sum = None
 
-                raise TypeError("weights_column should be a str")
+        # mean response of all rows in the other folds, for levels only in their own fold
+        with np.errstate(divide="ignore", invalid="ignore"):
 
-            if weights_column == response_column:
+            fold_prior = other_response_sum.sum(axis=1) / other_weight_sum.sum(axis=1)
 
-                raise ValueError(
-                    "weights_column and response_column are the same column"
-                )
+        other_mean_response = np.where(
+            other_counts > 0,
+            self.smoothed_mean_response(
+                other_response_sum, other_weight_sum, other_response_sq_sum
+            ),
+            fold_prior[:, None],
+        )
 
-        self.response_column = response_column
-        self.weights_column = weights_column
+        out_of_fold_values = pd.Series(
+            other_mean_response.ravel()[fold_codes], index=X_c.index, name=X_c.name
+        )
 
-        BaseNominalTransformer.__init__(self, columns=columns, **kwargs)
+        c_stats = {
+            "levels": pd.Index(levels, name=c),
+            "response_sum": response_sum,
+            "weight_sum": weight_sum,
+            "response_sq_sum": response_sq_sum,
+        }
 
-    def fit(self, X, y=None):
-        """Identify mapping of categorical levels to mean response values.
+        return c_stats, out_of_fold_values
 
-        If the user specified the weights_column arg in when initialising the transformer
-        the weighted mean response will be calculated using that column.
+    def sufficient_stats(self, X):
+        """Calculate the sums by level kept in the level_stats_ attribute for a chunk of data,
+        used by partial_fit. See column_level_stats.
 
         Parameters
         ----------
         X : pd.DataFrame
-            Data to with catgeorical variable columns to transform and also containing response_column
-            column.
+            Chunk of data to calculate statistics from.
 
-        y : None or pd.DataFrame or pd.Series, default = None
-            Optional argument only required for the transformer to work with sklearn pipelines.
+        Returns
+        -------
+        stats : dict
+            pd.DataFrame with response_sum, weight_sum and, if weights_column is not set,
+            response_sq_sum columns, indexed by level, for each column in the columns attribute.
 
         """
 
-        BaseNominalTransformer.fit(self, X, y)
-
-        self.mappings = {}
+        self.check_response_column(X)
 
-        if self.response_column not in X.columns.values:
+        response, weights = self.response_and_weights(X)
 
-            raise ValueError(f"response {self.response_column} not in X")
+        stats = {}
 
-        if self.weights_column is not None:
+        for c in self.columns:
 
-            if self.weights_column not in X.columns.values:
+            c_stats = self.column_level_stats(X[c], c, response, weights)
 
-                raise ValueError(f"weights column {self.weights_column} not in X")
+            stats[c] = pd.DataFrame(
+                {k: v for k, v in c_stats.items() if k != "levels" and v is not None},
+                index=c_stats["levels"],
+            )
 
-        response_null_count = X[self.response_column].isnull().sum()
+        return stats
 
-        if response_null_count > 0:
+    def finalize(self):
+        """Set the level_stats_ and mappings attributes from the sums by level accumulated
+        with partial_fit.
+        """
 
-            raise ValueError(
-                f"{self.response_column} in X has {response_null_count} null values"
-            )
+        self.check_is_fitted(["sufficient_stats_"])
 
-        for c in self.columns:
+        self.smoothing_ = self.smoothing
 
-            if self.weights_column is None:
+        self.level_stats_ = {}
 
-                self.mappings[c] = X.groupby([c])[self.response_column].mean().to_dict()
+        for c in self.columns:
 
-            else:
+            c_stats = self.sufficient_stats_[c]
 
-                groupby_sum = X.groupby([c])[
-                    [self.response_column, self.weights_column]
-                ].sum()
+            self.level_stats_[c] = {
+                "levels": c_stats.index,
+                "response_sum": c_stats["response_sum"].to_numpy(),
+                "weight_sum": c_stats["weight_sum"].to_numpy(),
+                "response_sq_sum": c_stats["response_sq_sum"].to_numpy()
+                if "response_sq_sum" in c_stats.columns
+                else None,
+            }
 
-                self.mappings[c] = (
-                    groupby_sum[self.response_column] / groupby_sum[self.weights_column]
-                ).to_dict()
+        self.set_mappings_from_level_stats()
 
         return self
 
@@ -572,9 +2002,9 @@ class MeanResponseTransformer(BaseNominalTransformer, BaseMappingTransformMixin)
         """Transform method to apply mean response encoding stored in the mappings attribute to
         each column in the columns attribute.
 
-        This method calls the check_mappable_rows method from BaseNominalTransformer to check that
-        all rows can be mapped then transform from BaseMappingTransformMixin to apply the
-        standard pd.Series.map method.
+        This method calls transform from BaseMappingTransformMixin, which maps each column with
+        the map_column method from BaseNominalTransformer. This checks that all rows can be mapped
+        in the same pass as the mapping.
 
         Parameters
         ----------
@@ -588,14 +2018,56 @@ class MeanResponseTransformer(BaseNominalTransformer, BaseMappingTransformMixin)
 
         """
 
-        self.check_mappable_rows(X)
-
         X = BaseMappingTransformMixin.transform(self, X)
 
         return X
 
+    def transform_record(self, record):
+        """Transform method to apply mean response encoding stored in the mappings attribute to each
+        column in the columns attribute of a single record, giving the same values as transform.
+
+        This method calls transform_record from BaseMappingTransformMixin, which maps the values
+        with the map_record method from BaseNominalTransformer.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with levels mapped accoriding to mappings dict.
+
+        """
+
+        record = BaseMappingTransformMixin.transform_record(self, record)
+
+        return record
+
+    def column_functions(self):
+        """Functions to map each column separately, from
+        BaseMappingTransformMixin.column_functions, which maps with the map_column method from
+        BaseNominalTransformer.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to map each column in the columns attribute.
+
+        """
+
+        column_functions = BaseMappingTransformMixin.column_functions(self)
 
-class OrdinalEncoderTransformer(BaseNominalTransformer, BaseMappingTransformMixin):
+        return column_functions
+
+
+class OrdinalEncoderTransformer(
+    BaseNominalTransformer,
+    BaseMappingTransformMixin,
+    BaseMeanResponseStatsMixin,
+    BasePartialFitMixin,
+):
     """Transformer to encode categorical variables into ascending rank-ordered integer values variables by mapping
     it's levels to the target-mean response for that level.
     Values will be sorted in ascending order only i.e. categorical level with lowest target mean response to
@@ -676,69 +2148,39 @@ class OrdinalEncoderTransformer(BaseNominalTransformer, BaseMappingTransformMixi
 
         self.mappings = {}
 
-        if self.response_column not in X.columns.values:
-
-            raise ValueError(f"response {self.response_column} not in X")
-
-        if self.weights_column is not None:
-
-            if self.weights_column not in X.columns.values:
-
-                raise ValueError(f"weights column {self.weights_column} not in X")
-
-        response_null_count = X[self.response_column].isnull().sum()
+        mean_responses = self.fit_mean_response(X)
 
-        if response_null_count > 0:
+        for c in self.columns:
 
-            raise ValueError(
-                f"{self.response_column} in X has {response_null_count} null values"
-            )
+            self.mappings[c] = self.rank_mapping(mean_responses[c])
 
-        for c in self.columns:
+        return self
 
-            if self.weights_column is None:
+    def sufficient_stats(self, X):
+        """Calculate the sum of the response and of the weights by level, used by partial_fit.
+        See BaseMeanResponseStatsMixin.mean_response_sufficient_stats.
 
-                # get the indexes of the sorted target mean-encoded dict
-                _idx_target_mean = list(
-                    X.groupby([c])[self.response_column]
-                    .mean()
-                    .sort_values(ascending=True, kind="mergesort")
-                    .index
-                )
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Chunk of data to calculate statistics from.
 
-                # create a dictionary whose keys are the levels of the categorical variable
-                # sorted ascending by their target-mean value
-                # and whose values are ascending ordinal integers
-                ordinal_encoded_dict = {
-                    k: _idx_target_mean.index(k) + 1 for k in _idx_target_mean
-                }
+        """
 
-                self.mappings[c] = ordinal_encoded_dict
+        return self.mean_response_sufficient_stats(X)
 
-            else:
+    def finalize(self):
+        """Set the mappings attribute to the rank of the mean response by level from the sums
+        accumulated with partial_fit.
+        """
 
-                groupby_sum = X.groupby([c])[
-                    [self.response_column, self.weights_column]
-                ].sum()
+        self.check_is_fitted(["sufficient_stats_"])
 
-                # get the indexes of the sorted target mean-encoded dict
-                _idx_target_mean = list(
-                    (
-                        groupby_sum[self.response_column]
-                        / groupby_sum[self.weights_column]
-                    )
-                    .sort_values(ascending=True, kind="mergesort")
-                    .index
-                )
+        self.mappings = {}
 
-                # create a dictionary whose keys are the levels of the categorical variable
-                # sorted ascending by their target-mean value
-                # and whose values are ascending ordinal integers
-                ordinal_encoded_dict = {
-                    k: _idx_target_mean.index(k) + 1 for k in _idx_target_mean
-                }
+        for c in self.columns:
 
-                self.mappings[c] = ordinal_encoded_dict
+            self.mappings[c] = self.rank_mapping(self.mean_response_from_stats(c))
 
         return self
 
@@ -746,9 +2188,9 @@ class OrdinalEncoderTransformer(BaseNominalTransformer, BaseMappingTransformMixi
         """Transform method to apply ordinal encoding stored in the mappings attribute to
         each column in the columns attribute. This maps categorical levels to rank-ordered integer values by target-mean in ascending order.
 
-        This method calls the check_mappable_rows method from BaseNominalTransformer to check that
-        all rows can be mapped then transform from BaseMappingTransformMixin to apply the
-        standard pd.Series.map method.
+        This method calls transform from BaseMappingTransformMixin, which maps each column with
+        the map_column method from BaseNominalTransformer. This checks that all rows can be mapped
+        in the same pass as the mapping.
 
         Parameters
         ----------
@@ -762,12 +2204,49 @@ class OrdinalEncoderTransformer(BaseNominalTransformer, BaseMappingTransformMixi
 
         """
 
-        self.check_mappable_rows(X)
-
         X = BaseMappingTransformMixin.transform(self, X)
 
         return X
 
+    def transform_record(self, record):
+        """Transform method to apply ordinal encoding stored in the mappings attribute to each
+        column in the columns attribute of a single record, giving the same values as transform.
+
+        This method calls transform_record from BaseMappingTransformMixin, which maps the values
+        with the map_record method from BaseNominalTransformer.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with levels mapped accoriding to mappings dict.
+
+        """
+
+        record = BaseMappingTransformMixin.transform_record(self, record)
+
+        return record
+
+    def column_functions(self):
+        """Functions to map each column separately, from
+        BaseMappingTransformMixin.column_functions, which maps with the map_column method from
+        BaseNominalTransformer.
+
+        Returns
+        -------
+        column_functions : dict
+            Function to map each column in the columns attribute.
+
+        """
+
+        column_functions = BaseMappingTransformMixin.column_functions(self)
+
+        return column_functions
+
 
 class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
     """Transformer to convert cetegorical variables into dummy columns.
@@ -786,12 +2265,23 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
     drop_original : bool, default = False
         Should original columns be dropped after creating dummy fields?
 
-    copy : bool, default = True
-        Should X be copied prior to transform?
+    copy : bool or str, default = True
+        Should X be copied prior to transform? Passed onto BaseTransformer.init.
 
     verbose : bool, default = True
         Should warnings/checkmarks get displayed?
 
+    output : str, default = "dense"
+        How the dummy columns are stored in the output of transform. If "dense" the dummy columns are
+        numpy columns and if "sparse" they have pd.SparseDtype, storing only the non-zero values. In
+        both cases the type of the values is set by the dtype argument of OneHotEncoder, which can be
+        passed in kwargs, e.g. dtype=np.uint8 or dtype=bool for compact dense dummies. The dummies can
+        also be returned as a scipy CSR matrix with the transform_csr method.
+
+    max_levels : int or None, default = 100
+        Maximum number of levels allowed in each column in fit. If None there is no limit, which
+        is intended for use with output = "sparse" or the transform_csr method.
+
     **kwargs
         Arbitrary keyword arguments passed onto sklearn OneHotEncoder.init method.
 
@@ -803,6 +2293,15 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
     drop_original : bool
         Should original columns be dropped after creating dummy fields?
 
+    output : str
+        How the dummy columns are stored in the output of transform.
+
+    max_levels : int or None
+        Maximum number of levels allowed in each column in fit.
+
+    dummy_columns_ : list
+        Created in fit. Names of the dummy columns created in transform, see dummy_column_names.
+
     """
 
     def __init__(
@@ -812,6 +2311,8 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
         drop_original=False,
         copy=True,
         verbose=False,
+        output="dense",
+        max_levels=100,
         **kwargs,
     ):
 
@@ -819,12 +2320,34 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
             self, columns=columns, copy=copy, verbose=verbose
         )
 
+        if output not in ["dense", "sparse"]:
+
+            raise ValueError(f"output should be 'dense' or 'sparse' but got {output}")
+
+        if max_levels is not None:
+
+            if not isinstance(max_levels, int) or isinstance(max_levels, bool):
+
+                raise TypeError(
+                    f"max_levels should be None or an int but got {type(max_levels)}"
+                )
+
+            if not max_levels > 0:
+
+                raise ValueError(
+                    f"max_levels should be greater than 0 but got {max_levels}"
+                )
+
         # Set attributes for scikit-learn'S OneHotEncoder
-        OneHotEncoder.__init__(self, sparse=False, handle_unknown="ignore", **kwargs)
+        OneHotEncoder.__init__(
+            self, sparse=output == "sparse", handle_unknown="ignore", **kwargs
+        )
 
         # Set other class attrributes
         self.separator = separator
         self.drop_original = drop_original
+        self.output = output
+        self.max_levels = max_levels
 
     def fit(self, X, y=None):
         """Gets list of levels for each column to be transformed. This defines which dummy columns
@@ -849,20 +2372,33 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
 
                 raise ValueError("column %s has nulls - replace before proceeding" % c)
 
-        # Check each field has less than 100 categories/levels
-        for c in self.columns:
+        # Check each field has no more than max_levels categories/levels
+        if self.max_levels is not None:
+
+            for c in self.columns:
 
-            levels = X[c].unique().tolist()
+                levels = X[c].unique().tolist()
 
-            if len(levels) > 100:
+                if len(levels) > self.max_levels:
 
-                raise ValueError(
-                    "column %s has over 100 unique values - consider another type of encoding"
-                    % c
-                )
+                    raise ValueError(
+                        f"column {c} has over {self.max_levels} unique values - consider another type of encoding"
+                    )
 
         OneHotEncoder.fit(self, X=X[self.columns], y=y)
 
+        # names and level lookups are found once here rather than in each call to transform
+        self.dummy_columns_ = self.dummy_column_names()
+
+        self._category_indexes = [
+            pd.Index(categories, tupleize_cols=False) for categories in self.categories_
+        ]
+
+        self._category_positions = [
+            {level: i for i, level in enumerate(categories.tolist())}
+            for categories in self.categories_
+        ]
+
         return self
 
     def transform(self, X):
@@ -894,33 +2430,24 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
 
                 raise ValueError("column %s has nulls - replace before proceeding" % c)
 
+        self.check_is_fitted(["dummy_columns_"])
+
         X = BaseNominalTransformer.transform(self, X)
 
         # Apply OHE transform
         X_transformed = OneHotEncoder.transform(self, X[self.columns])
 
-        input_columns = self.get_feature_names(input_features=self.columns)
+        # the dummy columns are created with their final names
+        if self.output == "sparse":
 
-        X_transformed = pd.DataFrame(
-            X_transformed, columns=input_columns, index=X.index
-        )
-
-        # Rename dummy fields if separator is specified
-        if self.separator != "_":
+            X_transformed = pd.DataFrame.sparse.from_spmatrix(
+                X_transformed, columns=self.dummy_columns_, index=X.index
+            )
 
-            old_names = [
-                c + "_" + str(lvl)
-                for i, c in enumerate(self.columns)
-                for lvl in self.categories_[i]
-            ]
-            new_names = [
-                c + self.separator + str(lvl)
-                for i, c in enumerate(self.columns)
-                for lvl in self.categories_[i]
-            ]
+        else:
 
-            X_transformed.rename(
-                columns={i: j for i, j in zip(old_names, new_names)}, inplace=True
+            X_transformed = pd.DataFrame(
+                X_transformed, columns=self.dummy_columns_, index=X.index
             )
 
         # Print warning for unseen levels
@@ -928,9 +2455,11 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
 
             for i, c in enumerate(self.columns):
 
-                unseen_levels = set(X[c].unique().tolist()) - set(self.categories_[i])
+                unseen_rows = self._category_indexes[i].get_indexer(X[c]) == -1
 
-                if len(unseen_levels) > 0:
+                if unseen_rows.any():
+
+                    unseen_levels = set(X[c][unseen_rows].unique().tolist())
 
                     warnings.warn(
                         "column %s has unseen categories: %s" % (c, unseen_levels)
@@ -941,7 +2470,152 @@ class OneHotEncodingTransformer(BaseNominalTransformer, OneHotEncoder):
 
             X.drop(self.columns, axis=1, inplace=True)
 
-        # Concatenate original and new dummy fields
-        X_transformed = pd.concat((X, X_transformed), axis=1)
+        # Concatenate original and new dummy fields, X has already been copied if required
+        X_transformed = pd.concat((X, X_transformed), axis=1, copy=False)
 
         return X_transformed
+
+    def transform_record(self, record):
+        """Add the dummy values for the categorical fields to a single record, giving the same
+        values as transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed input record with dummy values added. If drop_original = True then the
+            original categorical values that the dummies are created from will not be in the
+            output record.
+
+        """
+
+        record = self.check_record(
+            record, ["separator", "drop_original", "dummy_columns_"]
+        )
+
+        for c in self.columns:
+
+            if is_null_value(record[c]):
+
+                raise ValueError("column %s has nulls - replace before proceeding" % c)
+
+        dummy_type = np.dtype(self.dtype).type
+
+        dummy_values = []
+
+        for i, c in enumerate(self.columns):
+
+            column_dummy_values = [dummy_type(0)] * len(self.categories_[i])
+
+            position = self._category_positions[i].get(record[c])
+
+            if position is None:
+
+                if self.verbose:
+
+                    warnings.warn(
+                        "column %s has unseen categories: %s" % (c, {record[c]})
+                    )
+
+            else:
+
+                column_dummy_values[position] = dummy_type(1)
+
+            dummy_values.extend(column_dummy_values)
+
+        if self.drop_original:
+
+            record = {k: v for k, v in record.items() if k not in self.columns}
+
+        record.update(zip(self.dummy_columns_, dummy_values))
+
+        return record
+
+    def transform_csr(self, X):
+        """Create the dummy columns from categorical fields as a scipy CSR matrix, rather than
+        adding them to X. This avoids creating a DataFrame when the dummies are passed on to a
+        model that accepts sparse input.
+
+        The matrix is built directly from the position of each value in the fitted categories, so
+        a dense block of dummy values is never created, whatever the output attribute is. Unseen
+        levels have no non-zero value, as with handle_unknown="ignore" in transform.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to apply one hot encoding to.
+
+        Returns
+        -------
+        X_dummies : scipy.sparse.csr_matrix
+            Dummy columns for each row of X, with the dtype set in init. The names of the columns
+            are given by the dummy_columns_ attribute.
+
+        """
+
+        self.check_is_fitted(["separator"])
+
+        self.columns_check(X)
+
+        # Check for nulls
+        for c in self.columns:
+
+            if X[c].isnull().sum() > 0:
+
+                raise ValueError("column %s has nulls - replace before proceeding" % c)
+
+        self.check_is_fitted(["dummy_columns_"])
+
+        n_categories = [len(categories) for categories in self.categories_]
+
+        offsets = np.cumsum([0] + n_categories[:-1])
+
+        # dummy column of each value for each row, or -1 for unseen levels
+        dummy_positions = np.empty((X.shape[0], len(self.columns)), dtype=np.int64)
+
+        for i, c in enumerate(self.columns):
+
+            positions = self.lookup_positions(X[c], self._category_indexes[i])
+
+            dummy_positions[:, i] = np.where(
+                positions == -1, -1, positions + offsets[i]
+            )
+
+        seen = dummy_positions != -1
+
+        # rows are stored in order and columns are in order within each row, as required by CSR
+        indices = dummy_positions[seen]
+
+        indptr = np.append(0, np.cumsum(seen.sum(axis=1)))
+
+        X_dummies = sparse.csr_matrix(
+            (np.ones(indices.shape[0], dtype=self.dtype), indices, indptr),
+            shape=(X.shape[0], sum(n_categories)),
+        )
+
+        return X_dummies
+
+    def dummy_column_names(self):
+        """Names of the dummy columns created in transform, in the format
+        [categorical feature][separator][category level].
+
+        Returns
+        -------
+        dummy_column_names : list
+            Names of the dummy columns.
+
+        """
+
+        self.check_is_fitted(["categories_"])
+
+        dummy_column_names = [
+            c + self.separator + str(lvl)
+            for i, c in enumerate(self.columns)
+            for lvl in self.categories_[i]
+        ]
+
+        return dummy_column_names
@@ -89,19 +89,7 @@ class LogTransformer(BaseTransformer):
 
         X = super().transform(X)
 
-        numeric_column_types = X[self.columns].apply(
-            pd.api.types.is_numeric_dtype, axis=0
-        )
-
-        if not numeric_column_types.all():
-
-            non_numeric_columns = list(
-                numeric_column_types.loc[~numeric_column_types].index
-            )
-
-            raise TypeError(
-                f"The following columns are not numeric in X; {non_numeric_columns}"
-            )
+        self.check_numeric_columns(X)
 
         new_column_names = [f"{column}_{self.suffix}" for column in self.columns]
 
@@ -283,32 +271,6 @@ class ScalingTransformer(BaseTransformer):
 
         super().__init__(columns=columns, **kwargs)
 
-    def check_numeric_columns(self, X):
-        """Method to check all columns (specicifed in self.columns) in X are all numeric.
-
-        Parameters
-        ----------
-        X : pd.DataFrame
-            Data containing columns to check.
-
-        """
-
-        numeric_column_types = X[self.columns].apply(
-            pd.api.types.is_numeric_dtype, axis=0
-        )
-
-        if not numeric_column_types.all():
-
-            non_numeric_columns = list(
-                numeric_column_types.loc[~numeric_column_types].index
-            )
-
-            raise TypeError(
-                f"The following columns are not numeric in X; {non_numeric_columns}"
-            )
-
-        return X
-
     def fit(self, X, y=None):
         """Fit scaler to input data.
 
@@ -0,0 +1,542 @@
+"""
+This module contains a pipeline class for chaining together tubular transformers and a
+transformer that fuses consecutive steps of a pipeline into a single pass over the columns.
+"""
+
+from itertools import groupby
+from sklearn.pipeline import Pipeline
+
+from tubular.base import BaseTransformer, copy_elision, transform_chunks
+
+
+class FusedColumnTransformer(BaseTransformer):
+    """Transformer that applies a sequence of fitted tubular transformers, that each transform
+    columns independently, in a single pass over the columns.
+
+    Rather than each transformer in turn reading and writing all of its columns, each column
+    is read once, passed through the functions from each transformer that uses it in order
+    and written back once. The transformers must implement column_functions, see
+    BaseTransformer.column_functions. As each column function only uses the values of its own
+    column, the output is the same as applying the transformers one after another. This is
+    usually created from a fitted pipeline with TubularPipeline.fuse_steps.
+
+    Parameters
+    ----------
+    transformers : list
+        List of (name, transformer) tuples of the fitted transformers to apply, in order.
+
+    **kwargs
+        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+
+    Attributes
+    ----------
+    transformers : list
+        List of (name, transformer) tuples of the transformers to apply.
+
+    """
+
+    row_independent = True
+
+    def __init__(self, transformers, **kwargs):
+
+        if not isinstance(transformers, list) or not len(transformers) > 0:
+
+            raise ValueError("transformers should be a non-empty list")
+
+        columns = []
+
+        for step in transformers:
+
+            if not (
+                isinstance(step, tuple)
+                and len(step) == 2
+                and isinstance(step[1], BaseTransformer)
+            ):
+
+                raise TypeError(
+                    f"each item in transformers should be a (name, transformer) tuple with a tubular transformer but got {step}"
+                )
+
+            if step[1].columns is None:
+
+                raise ValueError(f"columns not set for transformer {step[0]}")
+
+            columns.extend(c for c in step[1].columns if c not in columns)
+
+        self.transformers = transformers
+
+        super().__init__(columns=columns, **kwargs)
+
+    def fit(self, X, y=None):
+        """Fit each transformer in turn on the data transformed by the transformers before it.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to fit the transformers on.
+
+        y : None or pd.DataFrame or pd.Series, default = None
+            Passed onto the fit method of each transformer.
+
+        """
+
+        super().fit(X, y)
+
+        X = X.copy()
+
+        with copy_elision([transformer for _, transformer in self.transformers]):
+
+            for _, transformer in self.transformers:
+
+                X = transformer.fit(X, y).transform(X)
+
+        return self
+
+    def step_column_functions(self):
+        """Collect the column functions from each transformer, which also checks each
+        transformer is fitted.
+
+        Returns
+        -------
+        step_column_functions : list
+            List of (name, transformer, column_functions) tuples for each transformer, in order.
+
+        """
+
+        step_column_functions = []
+
+        for name, transformer in self.transformers:
+
+            column_functions = transformer.column_functions()
+
+            if column_functions is None:
+
+                raise TypeError(
+                    f"transformer {name} ({type(transformer).__name__}) does not implement column_functions so cannot be fused"
+                )
+
+            step_column_functions.append((name, transformer, column_functions))
+
+        return step_column_functions
+
+    def column_function_chains(self):
+        """Collect the column functions from each transformer into a list of functions to apply
+        to each column, in the order of the transformers.
+
+        Returns
+        -------
+        column_function_chains : dict
+            List of functions to apply in turn to each column in the columns attribute.
+
+        """
+
+        column_function_chains = {c: [] for c in self.columns}
+
+        for _, _, column_functions in self.step_column_functions():
+
+            for c, column_function in column_functions.items():
+
+                column_function_chains[c].append(column_function)
+
+        return column_function_chains
+
+    def transform(self, X):
+        """Apply the transformers to X, reading and writing each column once.
+
+        The checks each transformer makes in transform are made in the same order as applying
+        the transformers in turn, so the same errors are raised. Each transformer is checked to
+        be fitted and its columns checked to be in X before any are applied. Then before its
+        column functions are applied, the values of its columns, as transformed by the
+        transformers before it, are checked with its check_column_functions_input method.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to transform.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Transformed input X, the same as from applying each transformer in turn.
+
+        """
+
+        step_column_functions = self.step_column_functions()
+
+        for _, transformer, _ in step_column_functions:
+
+            transformer.columns_check(X)
+
+        X = super().transform(X)
+
+        # transformed values of each column, only written back to X once all have been applied
+        X_columns = {}
+
+        for _, transformer, column_functions in step_column_functions:
+
+            step_columns = {
+                c: X_columns[c] if c in X_columns else X[c] for c in column_functions
+            }
+
+            transformer.check_column_functions_input(step_columns)
+
+            for c, column_function in column_functions.items():
+
+                X_columns[c] = column_function(step_columns[c])
+
+        for c, X_c in X_columns.items():
+
+            X[c] = X_c
+
+        return X
+
+    def transform_record(self, record):
+        """Apply the transform_record method of each transformer in turn to a single record.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed record.
+
+        """
+
+        record = self.check_record(record)
+
+        # the record has been copied if required so later transformers can work on it in place
+        with copy_elision([transformer for _, transformer in self.transformers]):
+
+            for _, transformer in self.transformers:
+
+                record = transformer.transform_record(record)
+
+        return record
+
+
+class TubularPipeline(Pipeline):
+    """Pipeline of transformers that copies the input data once, rather than once per step.
+
+    Each tubular transformer copies X in transform (if its copy attribute is True), so a standard
+    sklearn Pipeline of n tubular transformers copies the data n times. This pipeline instead copies
+    X once before the first step and then runs the steps within the copy_elision context, so
+    later steps work in place on that private copy. The caller's X is never modified.
+
+    Only steps that are tubular transformers skip copying X. Other steps are unaffected, as are
+    any tubular transformers nested within them, e.g. the branches of a FeatureUnion, which each
+    need their own copy of X.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, transform) tuples (implementing fit/transform) that are chained, in the
+        order in which they are chained, with the last object an estimator. Passed onto
+        sklearn.pipeline.Pipeline.
+
+    memory : None or str or object with the joblib.Memory interface, default = None
+        Used to cache the fitted transformers of the pipeline. Passed onto sklearn.pipeline.Pipeline.
+
+    verbose : bool, default = False
+        If True, the time elapsed while fitting each step will be printed as it is completed.
+        Passed onto sklearn.pipeline.Pipeline.
+
+    copy : bool, default = True
+        Should X be copied (once) before the steps are applied? If False then X will be modified
+        in place by the steps.
+
+    Attributes
+    ----------
+    copy : bool
+        Should X be copied (once) before the steps are applied?
+
+    """
+
+    def __init__(self, steps, memory=None, verbose=False, copy=True):
+
+        if not isinstance(copy, bool):
+
+            raise ValueError("copy must be a bool")
+
+        self.copy = copy
+
+        super().__init__(steps=steps, memory=memory, verbose=verbose)
+
+    def copy_input(self, X):
+        """Method to take the single copy of X used by all steps of the pipeline, if the copy
+        attribute is True.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data passed to the pipeline.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            Input X, copied if specified by user.
+
+        """
+
+        if self.copy:
+
+            X = X.copy()
+
+        return X
+
+    def step_copy_elision(self):
+        """Context manager within which the steps of the pipeline that are tubular transformers
+        do not copy X, see copy_elision.
+
+        Tubular transformers nested within other steps are not included, so they still copy X.
+        If memory is set the steps are cloned before they are fit, so the clones copy X as normal.
+
+        Returns
+        -------
+        context : contextmanager
+            copy_elision context for the tubular transformer steps.
+
+        """
+
+        return copy_elision(
+            [step for _, step in self.steps if isinstance(step, BaseTransformer)]
+        )
+
+    def fit(self, X, y=None, **fit_params):
+        """Fit all the steps of the pipeline, copying X once before the first step.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to fit the pipeline on.
+
+        y : None or pd.DataFrame or pd.Series, default = None
+            Training targets, passed onto each step.
+
+        **fit_params
+            Parameters passed to the fit method of each step, see sklearn.pipeline.Pipeline.fit.
+
+        """
+
+        X = self.copy_input(X)
+
+        with self.step_copy_elision():
+
+            return super().fit(X, y, **fit_params)
+
+    def fit_transform(self, X, y=None, **fit_params):
+        """Fit all the steps of the pipeline then transform X with the final step, copying X once
+        before the first step.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to fit the pipeline on and transform.
+
+        y : None or pd.DataFrame or pd.Series, default = None
+            Training targets, passed onto each step.
+
+        **fit_params
+            Parameters passed to the fit method of each step, see sklearn.pipeline.Pipeline.fit.
+
+        Returns
+        -------
+        Xt : pd.DataFrame
+            Transformed data.
+
+        """
+
+        X = self.copy_input(X)
+
+        with self.step_copy_elision():
+
+            return super().fit_transform(X, y, **fit_params)
+
+    def fuse_steps(self):
+        """Create a pipeline with the same fitted steps, where each run of consecutive steps that
+        transform columns independently is replaced by a single FusedColumnTransformer step.
+
+        Steps can be fused if they are tubular transformers that implement column_functions,
+        e.g. imputers, capping and mapping transformers, see BaseTransformer.column_functions.
+        In the new pipeline each column used by a run of fused steps is read and written once,
+        rather than once for each step, e.g. a column that is imputed, capped then mapped. The
+        output of transform is the same as from this pipeline. This pipeline must be fitted
+        first. The steps are not copied, so they should not be refit through this pipeline while
+        the fused pipeline is in use.
+
+        Returns
+        -------
+        pipeline : TubularPipeline
+            Pipeline with runs of consecutive steps that can be fused replaced by one step,
+            named by joining the names of the fused steps with "__".
+
+        """
+
+        def can_fuse(named_step):
+
+            step = named_step[1]
+
+            return (
+                isinstance(step, BaseTransformer)
+                and step.column_functions() is not None
+            )
+
+        steps = []
+
+        for fuse, group in groupby(self.steps, key=can_fuse):
+
+            group = list(group)
+
+            if fuse and len(group) > 1:
+
+                fused_name = "__".join(name for name, _ in group)
+
+                # the pipeline copies X once so the fused step does not need to
+                steps.append((fused_name, FusedColumnTransformer(group, copy=False)))
+
+            else:
+
+                steps.extend(group)
+
+        pipeline = TubularPipeline(
+            steps=steps, memory=self.memory, verbose=self.verbose, copy=self.copy
+        )
+
+        return pipeline
+
+    def transform(self, X):
+        """Apply the transform method of each step in turn, copying X once before the first step.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to transform.
+
+        Returns
+        -------
+        Xt : pd.DataFrame
+            Transformed data.
+
+        """
+
+        X = self.copy_input(X)
+
+        with self.step_copy_elision():
+
+            return super().transform(X)
+
+    def transform_record(self, record):
+        """Apply the transform_record method of each step in turn to a single record, copying
+        the record once before the first step.
+
+        This gives the same values as transforming a DataFrame with the record as its only row
+        with the transform method, without creating a DataFrame for steps that have a fast path
+        for single records, see BaseTransformer.transform_record. Steps that are not tubular
+        transformers are applied to a DataFrame with a single row, so they must return a
+        DataFrame from transform.
+
+        Parameters
+        ----------
+        record : dict
+            Values for each column of a single row of data.
+
+        Returns
+        -------
+        record : dict
+            Transformed record.
+
+        """
+
+        if not isinstance(record, dict):
+
+            raise ValueError("record should be a dict")
+
+        if self.copy:
+
+            record = record.copy()
+
+        with self.step_copy_elision():
+
+            for _, name, transform in self._iter():
+
+                if isinstance(transform, BaseTransformer):
+
+                    record = transform.transform_record(record)
+
+                else:
+
+                    record = BaseTransformer.transform_record(transform, record)
+
+        return record
+
+    def transform_stream(self, chunks):
+        """Generator that applies the transform method of the pipeline to each chunk of data from
+        an iterable of DataFrames, e.g. from pd.read_csv with chunksize set or the row groups of
+        a parquet file.
+
+        Each chunk is passed through all the steps of the pipeline before the next chunk is read
+        and no reference is kept to a chunk once the next one is requested, so only one chunk
+        needs to be held in memory at a time. See BaseTransformer.transform_stream.
+
+        Parameters
+        ----------
+        chunks : iterable of pd.DataFrame
+            Chunks of data to transform.
+
+        Yields
+        ------
+        Xt : pd.DataFrame
+            Each chunk transformed by the pipeline.
+
+        """
+
+        yield from transform_chunks(self.transform, chunks)
+
+    def predict(self, X, **predict_params):
+        """Apply the transform method of each step in turn then predict with the final estimator,
+        copying X once before the first step.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to predict on.
+
+        **predict_params
+            Parameters passed to the predict method of the final estimator.
+
+        Returns
+        -------
+        y_pred : np.ndarray
+            Predictions from the final estimator.
+
+        """
+
+        X = self.copy_input(X)
+
+        with self.step_copy_elision():
+
+            return super().predict(X, **predict_params)
+
+    def predict_proba(self, X):
+        """Apply the transform method of each step in turn then predict_proba with the final
+        estimator, copying X once before the first step.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to predict on.
+
+        Returns
+        -------
+        y_proba : np.ndarray
+            Predicted probabilities from the final estimator.
+
+        """
+
+        X = self.copy_input(X)
+
+        with self.step_copy_elision():
+
+            return super().predict_proba(X)
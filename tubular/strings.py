@@ -51,6 +51,8 @@ class SeriesStrMethodTransformer(BaseTransformer):
 
     """
 
+    row_independent = True
+
     def __init__(
         self, new_column_name, pd_method_name, columns, pd_method_kwargs={}, **kwargs
     ):
@@ -634,6 +634,46 @@ def index_preserved_params(df_1, df_2, seed=0):
     return params
 
 
+def assert_transform_record_equal(transformer, df, msg):
+    """Assert that the transform_record method of a fitted transformer gives the same values as
+    the transform method for each row of df.
+
+    Each row of df is passed to transform as a single row pd.DataFrame and to transform_record as
+    a dict. The output records must have the same keys, in the same order, and equal values or
+    both null values.
+
+    Parameters
+    ----------
+    transformer : BaseTransformer or TubularPipeline
+        Fitted transformer to test.
+
+    df : pd.DataFrame
+        Data to transform row by row.
+
+    msg : string
+        A tag for the AssertionException message.
+
+    """
+
+    for i in df.index:
+
+        record = df.loc[[i]].to_dict("records")[0]
+
+        expected = transformer.transform(df.loc[[i]]).to_dict("records")[0]
+
+        actual = transformer.transform_record(record)
+
+        assert list(actual.keys()) == list(
+            expected.keys()
+        ), f"{msg} index {i} keys -\n  Expected: {list(expected.keys())}\n  Actual: {list(actual.keys())}"
+
+        for k in expected.keys():
+
+            assert (actual[k] == expected[k]) or (
+                pd.isnull(actual[k]) and pd.isnull(expected[k])
+            ), f"{msg} index {i} key {k} -\n  Expected: {expected[k]}\n  Actual: {actual[k]}"
+
+
 @contextmanager
 def assert_function_call_count(mocker, target, attribute, expected_n_calls, **kwargs):
     """Assert a function has been called a given number of times. This should be used